@@ -5,6 +5,7 @@ import pygame
 from core.config import load_config
 from core.resources import load_images, load_sounds
 from core.decoration.background import FondoAnimado
+from ui.components.emoji import get_emoji_renderer
 from ui.menu_principal import run_menu_principal
 
 def run_app(debug=False):
@@ -18,8 +19,17 @@ def run_app(debug=False):
     alto = config["pantalla"] .get("alto")
     pantalla = pygame.display.set_mode((ancho, alto), pygame.RESIZABLE)
     pygame.display.set_caption("Jugando con Dino")
-    images = load_images("assets/imagenes")
+    recursos = config.get("recursos", {})
+    presupuesto_mb = recursos.get("presupuesto_imagenes_mb", 64)
+    cache_mb = recursos.get("cache_imagenes_mb", 256)
+    images = load_images(
+        "assets/imagenes",
+        presupuesto_bytes=presupuesto_mb * 1024 * 1024,
+        max_bytes_cache=cache_mb * 1024 * 1024,
+    )
     sounds = load_sounds("assets/sonidos")
+    # Crea el renderer de emojis ya: las páginas del atlas se decodifican mientras arranca el menú
+    get_emoji_renderer()
     fondo = FondoAnimado(ancho, alto)
     run_menu_principal(pantalla, fondo, images, sounds, config)
 
@@ -5,6 +5,14 @@ Gestión de configuración global y constantes del juego.
 """
 import json
 
+# Las animaciones están calibradas en "frames a 60 FPS": las velocidades y
+# contadores se multiplican por factor_paso(dt) para no depender del FPS real.
+FPS_REFERENCIA = 60
+
+def factor_paso(dt=None):
+    """Convierte dt (segundos) en frames de referencia. Sin dt se asume un frame."""
+    return 1.0 if dt is None else dt * FPS_REFERENCIA
+
 def load_config(config_path):
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"No se encontró el archivo: {config_path}")
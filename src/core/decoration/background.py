@@ -1,10 +1,31 @@
 """
 Módulo para lógica de fondo animado y gestión de estrellas.
+
+Las estrellas se dibujan con sprites pre-renderizados por (puntas, color,
+radio); el parpadeo se cuantiza a NIVELES_PARPADEO radios, así que cada
+estrella usa unas pocas variantes que se pintan una sola vez.
+
+La ubicación inicial usa muestreo de disco de Poisson (Bridson): reparto
+parejo sin solapamientos en tiempo lineal. Al redimensionar se reescalan las
+estrellas existentes y solo se agregan o quitan las que hagan falta.
+
+Con el bucle de paso fijo (core.game_loop) las estrellas se dibujan
+interpoladas entre la posición del paso anterior y la del actual según el
+`alfa` que se pasa a FondoAnimado.interpolar(); sin llamarlo se dibuja la
+posición actual.
 """
 import pygame
 import random
 import math
 from collections import defaultdict
+from functools import lru_cache
+import numpy as np
+from ui.components.gradientes import gradiente
+from core.decoration.sprites import COLORKEY
+
+NIVELES_PARPADEO = 8
+RADIO_MAX = 32
+DISTANCIA_MINIMA = 2 * RADIO_MAX  # dos estrellas nunca se solapan
 
 class FondoAnimado:
     """
@@ -18,49 +39,145 @@ class FondoAnimado:
         self.resize(ancho, alto)
 
     def resize(self, ancho, alto):
+        anterior = getattr(self, "estrellas", None)
+        if anterior is not None and self.ancho and self.alto:
+            anterior.ajustar(self.ancho, self.alto, ancho, alto, self.max_estrellas)
+        else:
+            self.estrellas = CampoEstrellas(crear_estrellas_pantalla(ancho, alto, self.max_estrellas))
         self.ancho, self.alto = ancho, alto
-        self.fondo = pygame.Surface((ancho, alto))
-        dibujar_gradiente(self.fondo, self.color_fondo1, self.color_fondo2)
-        self.estrellas = crear_estrellas_pantalla(ancho, alto, self.max_estrellas)
+        # Superficie compartida (y opaca) de la caché de gradientes: solo se lee
+        self.fondo = gradiente(ancho, alto, (self.color_fondo1[:3], self.color_fondo2[:3]), opaco=True)
+        self._rects_previos = None
 
     def update(self, dt=1.0):
-        for estrella in self.estrellas:
-            estrella.update(self.ancho, self.alto, dt)
+        # Zonas ocupadas antes de moverse, acumuladas hasta el próximo rects_sucios()
+        if self._rects_previos is None:
+            self._rects_previos = self.estrellas.rects()
+        self.estrellas.update(self.ancho, self.alto, dt)
+
+    def interpolar(self, alfa):
+        """Dibuja las estrellas a `alfa` (0..1) del camino entre el paso anterior y el actual."""
+        if alfa != self.estrellas.alfa:
+            # Las estrellas se mueven en pantalla aunque no haya habido update()
+            if self._rects_previos is None:
+                self._rects_previos = self.estrellas.rects()
+            self.estrellas.alfa = alfa
 
     def draw(self, surface):
         surface.blit(self.fondo, (0, 0))
-        for estrella in self.estrellas:
-            estrella.draw(surface)
+        self.estrellas.draw(surface)
+
+    def rects_sucios(self):
+        """Rectángulos que cambiaron desde la última llamada (posición vieja y nueva de cada estrella)."""
+        if self._rects_previos is None:
+            return []
+        rects = self._rects_previos + self.estrellas.rects()
+        self._rects_previos = None
+        return rects
+
+    def restaurar(self, surface, rects):
+        """Redibuja el fondo solo dentro de los rectángulos indicados."""
+        clip = surface.get_clip()
+        rects_estrellas = self.estrellas.rects()
+        sprites = self.estrellas.sprites()
+        for rect in rects:
+            surface.set_clip(rect)
+            surface.blit(self.fondo, rect, rect)
+            surface.blits([sprites[i] for i in rect.collidelistall(rects_estrellas)], doreturn=False)
+        surface.set_clip(clip)
 
 # --- Funciones utilitarias ---
 def dibujar_gradiente(surf, color1, color2):
     width, height = surf.get_size()
-    for y in range(height):
-        ratio = y / (height - 1)
-        color = tuple(int(color1[i] + (color2[i] - color1[i]) * ratio) for i in range(3))
-        pygame.draw.line(surf, color, (0, y), (width, y))
-
-def crear_estrellas_pantalla(ancho, alto, max_estrellas):
-    area = ancho * alto
-    num_estrellas = min(max(area // 30000, 6), max_estrellas)
-    cell_size = 48
-    grid = defaultdict(list)
-    estrellas = []
-    intentos = 0
-    while len(estrellas) < num_estrellas and intentos < num_estrellas * 30:
-        nueva = Estrella(ancho, alto)
-        cx, cy = int(nueva.x // cell_size), int(nueva.y // cell_size)
-        if all(not nueva.colisiona_con(e) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for e in grid[(cx+dx, cy+dy)]):
-            estrellas.append(nueva)
-            grid[(cx, cy)].append(nueva)
-        intentos += 1
-    return estrellas
+    surf.blit(gradiente(width, height, (color1[:3], color2[:3]), opaco=True), (0, 0))
+    return surf
+
+def cantidad_estrellas(ancho, alto, max_estrellas):
+    return min(max(ancho * alto // 30000, 6), max_estrellas)
+
+def muestreo_poisson(ancho, alto, distancia, ocupados=(), intentos=12, limite=None):
+    """
+    Muestreo de disco de Poisson (Bridson, con los candidatos repartidos en el
+    anillo de radio `distancia` como propone Roberts) en [0, ancho) x [0, alto).
+    Devuelve puntos nuevos a distancia >= `distancia` entre sí y de los
+    `ocupados`, hasta llenar el área (o juntar `limite`). La grilla con celdas de lado
+    distancia/√2 limita cada consulta a las celdas vecinas, así que el costo
+    es lineal en la cantidad de puntos.
+    """
+    celda = distancia / math.sqrt(2)
+    distancia2 = distancia * distancia
+    columnas, filas = int(ancho / celda) + 1, int(alto / celda) + 1
+    grilla = [[] for _ in range(columnas * filas)]
+    activos, nuevos = [], []
+
+    def agregar(punto):
+        grilla[int(punto[0] / celda) * filas + int(punto[1] / celda)].append(punto)
+        activos.append(punto)
+
+    def libre(x, y):
+        cx, cy = int(x / celda), int(y / celda)
+        for gx in range(max(cx - 2, 0), min(cx + 3, columnas)):
+            for gy in range(max(cy - 2, 0), min(cy + 3, filas)):
+                for px, py in grilla[gx * filas + gy]:
+                    if (px - x) ** 2 + (py - y) ** 2 < distancia2:
+                        return False
+        return True
+
+    for punto in ocupados:
+        if 0 <= punto[0] < ancho and 0 <= punto[1] < alto:
+            agregar(tuple(punto))
+    if not activos:
+        punto = (random.uniform(0, ancho), random.uniform(0, alto))
+        agregar(punto)
+        nuevos.append(punto)
+
+    radio = distancia * (1 + 1e-7)
+    paso = 2 * math.pi / intentos
+    while activos and (limite is None or len(nuevos) < limite):
+        i = random.randrange(len(activos))
+        px, py = activos[i]
+        inicio = random.uniform(0, 2 * math.pi)
+        for j in range(intentos):
+            angulo = inicio + j * paso
+            x, y = px + radio * math.cos(angulo), py + radio * math.sin(angulo)
+            if 0 <= x < ancho and 0 <= y < alto and libre(x, y):
+                agregar((x, y))
+                nuevos.append((x, y))
+                break
+        else:
+            activos[i] = activos[-1]
+            activos.pop()
+    return nuevos
+
+def crear_estrellas_pantalla(ancho, alto, max_estrellas, ocupados=()):
+    """
+    Crea las estrellas que faltan para llegar a la cantidad que corresponde a
+    la pantalla, separadas entre sí y de las posiciones `ocupados`.
+    """
+    faltan = cantidad_estrellas(ancho, alto, max_estrellas) - len(ocupados)
+    if faltan <= 0:
+        return []
+    util_w, util_h = max(ancho - 2 * RADIO_MAX, 1), max(alto - 2 * RADIO_MAX, 1)
+    relativos = [(x - RADIO_MAX, y - RADIO_MAX) for x, y in ocupados]
+    # Separación pensada para que el área llena dé algo más de las necesarias;
+    # si no alcanzan se achica hasta la distancia mínima. Sin estrellas previas
+    # se llena todo y se elige al azar, para no agruparlas alrededor del primer
+    # punto; con estrellas previas alcanza con crecer desde ellas.
+    distancia = max(DISTANCIA_MINIMA, 0.9 * math.sqrt(util_w * util_h / (faltan + len(ocupados))))
+    limite = faltan if ocupados else None
+    while True:
+        puntos = muestreo_poisson(util_w, util_h, distancia, relativos, limite=limite)
+        if len(puntos) >= faltan or distancia == DISTANCIA_MINIMA:
+            break
+        distancia = max(DISTANCIA_MINIMA, distancia * 0.8)
+    puntos = random.sample(puntos, min(faltan, len(puntos)))
+    return [Estrella(ancho, alto, x + RADIO_MAX, y + RADIO_MAX) for x, y in puntos]
 
 class Estrella:
-    def __init__(self, ancho, alto):
-        self.radio_base = random.randint(16, 32)
-        self.x = random.uniform(self.radio_base, ancho - self.radio_base)
-        self.y = random.uniform(self.radio_base, alto - self.radio_base)
+    def __init__(self, ancho, alto, x=None, y=None):
+        self.radio_base = random.randint(16, RADIO_MAX)
+        self.x = random.uniform(self.radio_base, ancho - self.radio_base) if x is None else x
+        self.y = random.uniform(self.radio_base, alto - self.radio_base) if y is None else y
         self.color = random.choice([(255, 255, 255), (255, 255, 200), (255, 240, 180), (255, 235, 255)])
         self.puntos = random.choice([5, 6, 7])
         angle = random.uniform(0, 2 * math.pi)
@@ -77,14 +194,127 @@ class Estrella:
         if not (self.radio < self.x < ancho - self.radio): self.dx *= -1
         if not (self.radio < self.y < alto - self.radio): self.dy *= -1
         self.fase += self.parpadeo_vel * 0.03 * dt
-        self.radio = int(self.radio_base * (0.85 + 0.15 * math.sin(self.fase)))
+        self.radio = int(radios_parpadeo(self.radio_base, self.fase))
 
     def draw(self, surface):
-        dibujar_estrella(surface, self.color, (int(self.x), int(self.y)), self.radio, self.puntos)
+        sprite = sprite_estrella_fondo(self.puntos, self.color, self.radio)
+        surface.blit(sprite, (int(self.x) - self.radio, int(self.y) - self.radio))
+
+    def rect(self):
+        r = self.radio_base + 1
+        return pygame.Rect(int(self.x) - r, int(self.y) - r, 2 * r + 1, 2 * r + 1)
 
     def colisiona_con(self, otra):
         return math.hypot(self.x - otra.x, self.y - otra.y) < (self.radio + otra.radio)
 
+class CampoEstrellas:
+    """
+    Todas las estrellas del fondo en arreglos de NumPy: posición, velocidad y
+    parpadeo se actualizan juntos en update() y draw() hace un solo blits().
+    Se construye a partir de la lista de Estrella ya ubicadas.
+    """
+    def __init__(self, estrellas):
+        # Fila 0: x, fila 1: y
+        self.pos = np.array([[e.x for e in estrellas], [e.y for e in estrellas]], np.float64).reshape(2, -1)
+        self.vel = np.array([[e.dx for e in estrellas], [e.dy for e in estrellas]], np.float64).reshape(2, -1)
+        self.fase = np.array([e.fase for e in estrellas], np.float64)
+        self.parpadeo_vel = np.array([e.parpadeo_vel for e in estrellas], np.float64)
+        self.radio_base = np.array([e.radio_base for e in estrellas], np.int32)
+        self.radio = np.array([e.radio for e in estrellas], np.int32)
+        self.puntos = [e.puntos for e in estrellas]
+        self.colores = [e.color for e in estrellas]
+        # Posiciones del paso anterior, para dibujar interpolando con `alfa`
+        self.pos_anterior = self.pos.copy()
+        self.alfa = 1.0
+
+    def __len__(self):
+        return len(self.puntos)
+
+    def posiciones(self):
+        return list(zip(*self.pos.tolist()))
+
+    def reescalar(self, fx, fy, ancho, alto):
+        """Escala las posiciones a la nueva pantalla, manteniéndolas dentro."""
+        self.pos *= np.array([[fx], [fy]])
+        np.clip(self.pos[0], self.radio_base, ancho - self.radio_base, out=self.pos[0])
+        np.clip(self.pos[1], self.radio_base, alto - self.radio_base, out=self.pos[1])
+        self.pos_anterior = self.pos.copy()
+
+    def ajustar(self, ancho_anterior, alto_anterior, ancho, alto, max_estrellas):
+        """Reutiliza las estrellas en otra pantalla: se reescalan y solo se completan o recortan."""
+        self.reescalar(ancho / ancho_anterior, alto / alto_anterior, ancho, alto)
+        self.recortar(cantidad_estrellas(ancho, alto, max_estrellas))
+        self.agregar(crear_estrellas_pantalla(ancho, alto, max_estrellas, self.posiciones()))
+
+    def recortar(self, cantidad):
+        """Se queda con las primeras `cantidad` estrellas."""
+        self.pos, self.vel = self.pos[:, :cantidad], self.vel[:, :cantidad]
+        self.pos_anterior = self.pos_anterior[:, :cantidad]
+        for nombre in ("fase", "parpadeo_vel", "radio_base", "radio", "puntos", "colores"):
+            setattr(self, nombre, getattr(self, nombre)[:cantidad])
+
+    def agregar(self, estrellas):
+        if not estrellas:
+            return
+        otro = CampoEstrellas(estrellas)
+        self.pos = np.hstack((self.pos, otro.pos))
+        self.vel = np.hstack((self.vel, otro.vel))
+        self.pos_anterior = np.hstack((self.pos_anterior, otro.pos_anterior))
+        for nombre in ("fase", "parpadeo_vel", "radio_base", "radio"):
+            setattr(self, nombre, np.concatenate((getattr(self, nombre), getattr(otro, nombre))))
+        self.puntos = self.puntos + otro.puntos
+        self.colores = self.colores + otro.colores
+
+    def update(self, ancho, alto, dt=1.0):
+        np.copyto(self.pos_anterior, self.pos)
+        self.pos += self.vel * dt
+        limite = np.array([[ancho], [alto]]) - self.radio
+        self.vel[(self.pos <= self.radio) | (self.pos >= limite)] *= -1
+        self.fase += self.parpadeo_vel * 0.03 * dt
+        self.radio = radios_parpadeo(self.radio_base, self.fase).astype(np.int32)
+
+    def pos_dibujo(self):
+        """Posiciones a dibujar: interpoladas entre el paso anterior y el actual según `alfa`."""
+        if self.alfa >= 1.0:
+            return self.pos
+        return self.pos_anterior + (self.pos - self.pos_anterior) * self.alfa
+
+    def rects(self):
+        r = self.radio_base + 1
+        xs, ys = (self.pos_dibujo().astype(np.int32) - r).tolist()
+        return [pygame.Rect(x, y, l, l) for x, y, l in zip(xs, ys, (2 * r + 1).tolist())]
+
+    def sprites(self):
+        """Lista (sprite, posición) de cada estrella, lista para surface.blits()."""
+        radios = self.radio.tolist()
+        xs, ys = (self.pos_dibujo().astype(np.int32) - self.radio).tolist()
+        return [
+            (sprite_estrella_fondo(puntos, color, radio), (x, y))
+            for puntos, color, radio, x, y in zip(self.puntos, self.colores, radios, xs, ys)
+        ]
+
+    def draw(self, surface):
+        surface.blits(self.sprites(), doreturn=False)
+
+def radios_parpadeo(radio_base, fase):
+    """Radio del parpadeo con el seno cuantizado a NIVELES_PARPADEO valores."""
+    nivel = np.round((np.sin(fase) + 1) * (NIVELES_PARPADEO - 1) / 2)
+    seno = nivel * 2 / (NIVELES_PARPADEO - 1) - 1
+    return radio_base * (0.85 + 0.15 * seno)
+
+@lru_cache(maxsize=512)
+def sprite_estrella_fondo(puntos, color, radio):
+    """
+    Estrella de `puntos` puntas centrada en un cuadrado de 2*radio+1. Es opaca
+    (como al dibujarla directo en pantalla), así que usa colorkey con RLE.
+    """
+    lado = 2 * radio + 1
+    surf = pygame.Surface((lado, lado))
+    surf.fill(COLORKEY)
+    dibujar_estrella(surf, color, (radio, radio), radio, puntos)
+    surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return surf
+
 def dibujar_estrella(surface, color, center, radius, points):
     angle = math.pi / points
     vertices = [
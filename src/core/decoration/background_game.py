@@ -1,8 +1,31 @@
+"""
+Motor de fondo animado de los juegos.
+
+FondoAnimado dibuja una lista de capas intercambiables (gradiente, nubes,
+burbujas y, si se agrega, estrellas). Cada capa implementa:
+
+    preparar(motor)         al crearse y en cada resize
+    cambiar_calidad(motor)  (opcional) al cambiar la calidad; por defecto preparar
+    update(paso)            paso en frames de referencia (ver core.config.factor_paso)
+    draw(surface)
+    escalable               False si la calidad no cambia su costo (no se mide)
+
+La calidad ("alta", "media", "baja") fija cuántas nubes, burbujas y
+estrellas hay y la resolución con que se pintan las nubes nuevas. Con
+presupuesto_ms el motor mide el costo por frame de las capas escalables y
+baja un nivel de calidad si el promedio se pasa del presupuesto. Vuelve a
+subir (hasta la calidad configurada) solo tras varias ventanas seguidas por
+debajo de la mitad, y cada bajada duplica esa espera para que no oscile.
+"""
+import time
 import pygame
 import random
 import math
-from collections import deque
-from ui.components.utils import get_gradient
+import numpy as np
+from ui.components.gradientes import gradiente, es_opaco
+from core.config import factor_paso
+from core.decoration.sprites import sprite_burbuja
+from core.decoration.background import CampoEstrellas, crear_estrellas_pantalla
 from core.scale.responsive_scaler_animated import ResponsiveScalerAnimado  # agregado
 
 PALETA = {
@@ -12,6 +35,19 @@ PALETA = {
     "lavanda": (186, 156, 255),
     "turquesa": (52, 199, 186)
 }
+COLORES_BURBUJA = tuple(PALETA.values())
+CAPACIDAD_BURBUJAS = 64
+PERIODO_OSCILACION = 520  # ms
+
+CALIDADES = {
+    "alta":  {"nubes": 6, "burbujas": CAPACIDAD_BURBUJAS, "intervalo_burbujas": 1.0, "resolucion_nubes": 1.0, "estrellas": 20},
+    "media": {"nubes": 4, "burbujas": 24, "intervalo_burbujas": 1.5, "resolucion_nubes": 0.75, "estrellas": 12},
+    "baja":  {"nubes": 2, "burbujas": 8, "intervalo_burbujas": 2.5, "resolucion_nubes": 0.5, "estrellas": 6},
+}
+NIVELES_CALIDAD = ("baja", "media", "alta")
+VENTANA_MEDICION = 60  # frames promediados antes de decidir un cambio de calidad
+VENTANAS_SUBIDA = 5  # ventanas seguidas bajo la mitad del presupuesto para subir
+MAX_VENTANAS_SUBIDA = 80
 
 def generar_nube_surface_eficiente(radio_base, color):
     ancho_nube = radio_base * 3.0
@@ -37,8 +73,235 @@ def generar_nube_surface_eficiente(radio_base, color):
     )
     return surf.convert_alpha(), (radio_base * 0.7, radio_base * 0.7)
 
+class CapaGradiente:
+    """
+    Capa base: la superficie o el color que se pasa a FondoAnimado.draw(fondo),
+    escalado a la pantalla, o el gradiente por defecto si no se pasa nada.
+    Su costo no depende de la calidad, así que no cuenta para el presupuesto.
+    """
+    escalable = False
+
+    def __init__(self, color_arriba=(230, 245, 255), color_abajo=(255, 255, 255)):
+        self.color_arriba = color_arriba
+        self.color_abajo = color_abajo
+        # Con colores sin transparencia el gradiente se cachea opaco (blit sin alfa por píxel)
+        self.opaco = es_opaco((color_arriba, color_abajo))
+        self.actual = None
+        self.cache = None
+
+    def preparar(self, motor):
+        self.motor = motor
+        self.cache = None
+
+    def update(self, paso=1.0):
+        pass
+
+    def draw(self, surface):
+        fondo = self.motor.fondo
+        if fondo != self.actual or self.cache is None:
+            tamaño = (self.motor.ANCHO, self.motor.ALTO)
+            if isinstance(fondo, pygame.Surface):
+                self.cache = pygame.transform.smoothscale(fondo, tamaño)
+            elif isinstance(fondo, tuple) and len(fondo) >= 3:
+                self.cache = pygame.Surface(tamaño)
+                self.cache.fill(fondo)
+            else:
+                self.cache = gradiente(*tamaño, (self.color_arriba, self.color_abajo), opaco=self.opaco)
+            self.actual = fondo
+        surface.blit(self.cache, (0, 0))
+
+class NubesFondo:
+    """
+    Nubes que cruzan la parte alta de la pantalla. Cada una conserva su
+    superficie; posición y velocidad viven en arreglos de NumPy. Al salir por
+    la derecha (más allá de `limite_x`) vuelven a entrar por la izquierda a una
+    altura al azar entre y_min e y_max.
+    """
+    def __init__(self):
+        self.surfs = []
+        self.offset = np.zeros((0, 2), np.float32)
+        self.w = self.x = self.y = self.velocidad = np.zeros(0, np.float32)
+
+    def __len__(self):
+        return len(self.surfs)
+
+    def preparar(self, motor):
+        self.limite_x = motor.ANCHO + motor.sx(120)
+        self.y_min, self.y_max = motor.navbar_height, motor.ALTO // 3
+        self.surfs = []
+        self.offset = np.zeros((0, 2), np.float32)
+        self.w = self.x = self.y = self.velocidad = np.zeros(0, np.float32)
+        self._agregar(motor, motor.calidad["nubes"], [random.randint(0, motor.ANCHO) for _ in range(motor.calidad["nubes"])])
+
+    def cambiar_calidad(self, motor):
+        """Recorta o agrega nubes sin tocar las que ya están en pantalla."""
+        cantidad = motor.calidad["nubes"]
+        if cantidad < len(self):
+            self.surfs = self.surfs[:cantidad]
+            self.offset, self.w = self.offset[:cantidad], self.w[:cantidad]
+            self.x, self.y, self.velocidad = self.x[:cantidad], self.y[:cantidad], self.velocidad[:cantidad]
+        elif cantidad > len(self):
+            # Las nuevas entran por la izquierda, fuera de la pantalla
+            self._agregar(motor, cantidad - len(self), None)
+
+    def _agregar(self, motor, cantidad, xs):
+        resolucion = motor.calidad["resolucion_nubes"]
+        surfs, offsets = [], []
+        for _ in range(cantidad):
+            radio = motor.sx(60) * random.uniform(1.0, 1.7)
+            surf, offset = generar_nube_surface_eficiente(
+                radio * resolucion, (255, 255, 255, random.randint(90, 140))
+            )
+            if resolucion != 1.0:
+                # Se pinta más chica y se agranda: menos trabajo al regenerar
+                surf = pygame.transform.smoothscale(surf, (int(radio * 3.0), int(radio * 1.8)))
+                offset = (radio * 0.7, radio * 0.7)
+            surfs.append(surf)
+            offsets.append(offset)
+        w = np.array([surf.get_width() for surf in surfs], np.float32)
+        if xs is None:
+            xs = -w - np.array([random.randint(0, motor.sx(200)) for _ in range(cantidad)], np.float32)
+        self.surfs += surfs
+        self.offset = np.concatenate([self.offset, np.array(offsets, np.float32).reshape(-1, 2)])
+        self.w = np.concatenate([self.w, w])
+        self.x = np.concatenate([self.x, np.asarray(xs, np.float32)])
+        self.y = np.concatenate([self.y, np.array([random.randint(self.y_min, self.y_max) for _ in range(cantidad)], np.float32)])
+        self.velocidad = np.concatenate([self.velocidad, np.array([random.uniform(0.15, 0.45) for _ in range(cantidad)], np.float32)])
+
+    def update(self, paso=1.0):
+        self.x += self.velocidad * paso
+        fuera = self.x > self.limite_x
+        if fuera.any():
+            self.x[fuera] = -self.w[fuera]
+            self.y[fuera] = [random.randint(self.y_min, self.y_max) for _ in range(int(fuera.sum()))]
+
+    def draw(self, surface):
+        posiciones = zip((self.x - self.offset[:, 0]).tolist(), (self.y - self.offset[:, 1]).tolist())
+        surface.blits(list(zip(self.surfs, posiciones)), doreturn=False)
+
+class BurbujasFondo:
+    """
+    Burbujas que suben oscilando. Viven en arreglos de NumPy de capacidad fija
+    usados como buffer circular: cada burbuja nueva ocupa el siguiente hueco y,
+    si el buffer está lleno, reemplaza a la más vieja. Se dibujan con sprites
+    de core.decoration.sprites (uno por radio y color).
+    """
+    def __init__(self, capacidad=CAPACIDAD_BURBUJAS):
+        self.capacidad = capacidad
+        self.x = np.zeros(capacidad, np.float32)
+        self.y = np.zeros(capacidad, np.float32)
+        self.velocidad = np.zeros(capacidad, np.float32)
+        self.oscilacion = np.zeros(capacidad, np.float32)
+        self.fase = np.zeros(capacidad, np.float32)
+        self.radio = np.zeros(capacidad, np.int32)
+        self.color = np.zeros(capacidad, np.uint8)  # índice en COLORES_BURBUJA
+        self.activa = np.zeros(capacidad, bool)
+        self._siguiente = 0
+        self.maximo = capacidad
+        self.intervalo = 1.0
+        self.tiempo_burbuja = 0
+        self.motor = None
+
+    def __len__(self):
+        return int(self.activa.sum())
+
+    def clear(self):
+        self.activa[:] = False
+
+    def preparar(self, motor):
+        self.motor = motor
+        self.maximo = min(self.capacidad, motor.calidad["burbujas"])
+        self.intervalo = motor.calidad["intervalo_burbujas"]
+
+    # Solo cambian el máximo y el ritmo: las burbujas en pantalla siguen su camino
+    cambiar_calidad = preparar
+
+    def emitir(self, x, y, radio, velocidad, color, oscilacion, fase):
+        i = self._siguiente
+        self.x[i], self.y[i] = x, y
+        self.radio[i] = radio
+        self.velocidad[i] = velocidad
+        self.color[i] = color
+        self.oscilacion[i] = oscilacion
+        self.fase[i] = fase
+        self.activa[i] = True
+        self._siguiente = (i + 1) % self.capacidad
+
+    def crear_burbuja(self):
+        """Emite una burbuja al azar desde debajo del borde inferior."""
+        m = self.motor
+        self.emitir(
+            x=random.randint(m.sx(50), m.ANCHO - m.sx(50)),
+            y=m.ALTO + m.sy(20),
+            radio=random.randint(m.sy(14), m.sy(32)),
+            velocidad=random.uniform(0.4, 1.3),
+            color=random.randrange(len(COLORES_BURBUJA)),
+            oscilacion=random.uniform(0.7, 1.7),
+            fase=random.uniform(0, 2 * math.pi)
+        )
+
+    def update(self, paso=1.0, ticks=None):
+        if self.motor is not None:
+            self.tiempo_burbuja -= paso
+            if self.tiempo_burbuja <= 0:
+                if len(self) < self.maximo:
+                    self.crear_burbuja()
+                self.tiempo_burbuja = random.randint(36, 110) * self.intervalo
+        if not self.activa.any():
+            return
+        ticks = pygame.time.get_ticks() if ticks is None else ticks
+        self.y -= self.velocidad * paso
+        self.x += np.sin(ticks / PERIODO_OSCILACION + self.fase) * self.oscilacion * paso
+        self.activa &= self.y > -self.radio
+
+    def draw(self, surface):
+        # De la más vieja a la más nueva, como se crearon
+        orden = np.roll(np.arange(self.capacidad), -self._siguiente)
+        orden = orden[self.activa[orden]]
+        if not len(orden):
+            return
+        radios = self.radio[orden]
+        xs = (self.x[orden].astype(np.int32) - radios).tolist()
+        ys = (self.y[orden].astype(np.int32) - radios).tolist()
+        colores = self.color[orden].tolist()
+        surface.blits([
+            (sprite_burbuja(r, COLORES_BURBUJA[c]), (x, y))
+            for x, y, r, c in zip(xs, ys, radios.tolist(), colores)
+        ], doreturn=False)
+
+class CapaEstrellas:
+    """Estrellas del fondo del menú (core.decoration.background) como capa del motor."""
+    def __init__(self):
+        self.campo = None
+        self.ancho = self.alto = 0
+
+    def __len__(self):
+        return len(self.campo) if self.campo is not None else 0
+
+    def preparar(self, motor):
+        maximo = motor.calidad["estrellas"]
+        if self.campo is not None and self.ancho and self.alto:
+            self.campo.ajustar(self.ancho, self.alto, motor.ANCHO, motor.ALTO, maximo)
+        else:
+            self.campo = CampoEstrellas(crear_estrellas_pantalla(motor.ANCHO, motor.ALTO, maximo))
+        self.ancho, self.alto = motor.ANCHO, motor.ALTO
+
+    def update(self, paso=1.0):
+        self.campo.update(self.ancho, self.alto, paso)
+
+    def draw(self, surface):
+        self.campo.draw(surface)
+
 class FondoAnimado:
-    def __init__(self, pantalla, navbar_height=0):
+    """
+    Args:
+        pantalla: superficie donde se dibuja
+        navbar_height: las nubes no suben por encima de la barra
+        calidad: "alta", "media" o "baja" (máxima a la que puede volver)
+        presupuesto_ms: costo máximo del fondo por frame; None no ajusta la calidad
+        capas: lista de capas a usar en lugar de gradiente + nubes + burbujas
+    """
+    def __init__(self, pantalla, navbar_height=0, calidad="alta", presupuesto_ms=None, capas=None):
         self.pantalla = pantalla
         self.navbar_height = navbar_height
 
@@ -49,12 +312,62 @@ class FondoAnimado:
         self.sx = self.scaler.sx  # funciones de escalado
         self.sy = self.scaler.sy
 
-        # estado del fondo
-        self.burbujas = deque()
-        self.nubes    = self._generar_nubes(6)
-        self.fondo_actual = None
-        self.fondo_cache   = None
-        self.tiempo_burbuja = 0
+        # calidad y medición de costo
+        self.nivel_maximo = NIVELES_CALIDAD.index(calidad)
+        self.nivel = self.nivel_maximo
+        self.presupuesto_ms = presupuesto_ms
+        self.costo_promedio_ms = 0.0
+        self._costo_acumulado = 0.0
+        self._frames_medidos = 0
+        self._ventanas_holgadas = 0
+        self._espera_subida = VENTANAS_SUBIDA
+
+        # capas
+        self.fondo = None
+        self.gradiente = CapaGradiente()
+        self.nubes = NubesFondo()
+        self.burbujas = BurbujasFondo()
+        self.capas = capas if capas is not None else [self.gradiente, self.nubes, self.burbujas]
+        self._preparar_capas()
+
+    @classmethod
+    def desde_config(cls, pantalla, config, navbar_height=0):
+        """Crea el fondo con calidad_fondo y presupuesto_fondo_ms de la sección "rendimiento"."""
+        rendimiento = config.get("rendimiento", {}) if config else {}
+        return cls(
+            pantalla, navbar_height,
+            calidad=rendimiento.get("calidad_fondo", "alta"),
+            presupuesto_ms=rendimiento.get("presupuesto_fondo_ms"),
+        )
+
+    @property
+    def calidad(self):
+        return CALIDADES[NIVELES_CALIDAD[self.nivel]]
+
+    @property
+    def nombre_calidad(self):
+        return NIVELES_CALIDAD[self.nivel]
+
+    def _preparar_capas(self):
+        for capa in self.capas:
+            capa.preparar(self)
+
+    def _cambiar_calidad(self, nivel):
+        self.nivel = nivel
+        self._ventanas_holgadas = 0
+        for capa in self.capas:
+            getattr(capa, "cambiar_calidad", capa.preparar)(self)
+
+    def agregar_capa(self, capa, indice=None):
+        """Agrega una capa (por defecto arriba de todo)."""
+        capa.preparar(self)
+        self.capas.insert(len(self.capas) if indice is None else indice, capa)
+
+    def set_calidad(self, calidad):
+        """Fija la calidad actual y la máxima del ajuste automático."""
+        self.nivel_maximo = NIVELES_CALIDAD.index(calidad)
+        self._espera_subida = VENTANAS_SUBIDA
+        self._cambiar_calidad(self.nivel_maximo)
 
     def set_escaladores(self, sx, sy):
         """Permite inyectar otro sistema de escala (opcional)."""
@@ -62,95 +375,52 @@ class FondoAnimado:
         self.sy = sy
 
     def resize(self, ancho, alto):
-        """Llamar en VIDEORESIZE: actualiza tamaño, escalador y nubes."""
+        """Llamar en VIDEORESIZE: actualiza tamaño, escalador y capas."""
         self.ANCHO, self.ALTO = ancho, alto
         self.scaler.update(ancho, alto)         # nuevo
-        self.fondo_cache = None
-        self.nubes = self._generar_nubes(6)
+        self._preparar_capas()
 
-    def _generar_nubes(self, cantidad):
-        nubes = []
-        for _ in range(cantidad):
-            radio = self.sx(60) * random.uniform(1.0, 1.7)
-            surf, offset = generar_nube_surface_eficiente(
-                radio, (255,255,255, random.randint(90,140))
-            )
-            nubes.append({
-                'x': random.randint(0, self.ANCHO),
-                'y': random.randint(self.navbar_height, self.ALTO//3),
-                'velocidad': random.uniform(0.15,0.45),
-                'surf': surf,
-                'offset': offset,
-                'w': surf.get_width()
-            })
-        return nubes
-
-    def update(self):
-        """Llamar cada frame antes de draw()."""
-        self.scaler.tick()           # nuevo: avanza animación de escala
-        self._actualizar_nubes()
-        self._actualizar_burbujas()
+    def update(self, dt=None):
+        """Llamar cada frame antes de draw(). dt en segundos (None = un frame a 60 FPS)."""
+        self.scaler.tick(dt)         # nuevo: avanza animación de escala
+        paso = factor_paso(dt)
+        for capa in self.capas:
+            if getattr(capa, "escalable", True):
+                inicio = time.perf_counter()
+                capa.update(paso)
+                self._costo_acumulado += (time.perf_counter() - inicio) * 1000
+            else:
+                capa.update(paso)
 
     def draw(self, fondo=None):
-        if fondo != self.fondo_actual or self.fondo_cache is None:
-            if isinstance(fondo, pygame.Surface):
-                self.fondo_cache = pygame.transform.smoothscale(fondo, (self.ANCHO, self.ALTO))
-            elif isinstance(fondo, tuple) and len(fondo) >= 3:
-                self.fondo_cache = pygame.Surface((self.ANCHO, self.ALTO))
-                self.fondo_cache.fill(fondo)
+        self.fondo = fondo
+        for capa in self.capas:
+            if getattr(capa, "escalable", True):
+                inicio = time.perf_counter()
+                capa.draw(self.pantalla)
+                self._costo_acumulado += (time.perf_counter() - inicio) * 1000
             else:
-                self.fondo_cache = get_gradient(self.ANCHO, self.ALTO, (230, 245, 255), (255, 255, 255))
-            self.fondo_actual = fondo
-
-        self.pantalla.blit(self.fondo_cache, (0, 0))
-        self._dibujar_nubes()
-        self._dibujar_burbujas()
-
-    def _actualizar_nubes(self):
-        for nube in self.nubes:
-            nube['x'] += nube['velocidad']
-            if nube['x'] > self.ANCHO + self.sx(120):
-                nube['x'] = -nube['w']
-                nube['y'] = random.randint(self.navbar_height, self.ALTO // 3)
-
-    def _dibujar_nubes(self):
-        for nube in self.nubes:
-            self.pantalla.blit(nube['surf'], (nube['x'] - nube['offset'][0], nube['y'] - nube['offset'][1]))
-
-    def _crear_burbuja(self):
-        x = random.randint(self.sx(50), self.ANCHO - self.sx(50))
-        y = self.ALTO + self.sy(20)
-        color = random.choice(list(PALETA.values()))
-        self.burbujas.append({
-            'x': x,
-            'y': y,
-            'radio': random.randint(self.sy(14), self.sy(32)),
-            'velocidad': random.uniform(0.4, 1.3),
-            'color': (*color[:3], 90),
-            'oscilacion': random.uniform(0.7, 1.7),
-            'fase': random.uniform(0, 2 * math.pi)
-        })
-
-    def _actualizar_burbujas(self):
-        self.tiempo_burbuja -= 1
-        if self.tiempo_burbuja <= 0:
-            self._crear_burbuja()
-            self.tiempo_burbuja = random.randint(36, 110)
-
-        ticks = pygame.time.get_ticks()
-        self.burbujas = deque([
-            dict(b,
-                 y=b['y'] - b['velocidad'],
-                 x=b['x'] + math.sin(ticks / 520 + b['fase']) * b['oscilacion']
-            )
-            for b in self.burbujas if b['y'] > -b['radio']
-        ])
-
-    def _dibujar_burbujas(self):
-        for b in self.burbujas:
-            pygame.draw.circle(self.pantalla, b['color'], (int(b['x']), int(b['y'])), b['radio'])
-            pygame.draw.circle(
-                self.pantalla, (255, 255, 255, 120),
-                (int(b['x'] - b['radio'] // 4), int(b['y'] - b['radio'] // 4)),
-                b['radio'] // 3
-            )
+                capa.draw(self.pantalla)
+        self._medir()
+
+    def _medir(self):
+        """Promedia el costo (update+draw de las capas escalables) y ajusta la calidad cada VENTANA_MEDICION frames."""
+        self._frames_medidos += 1
+        if self._frames_medidos < VENTANA_MEDICION:
+            return
+        self.costo_promedio_ms = self._costo_acumulado / self._frames_medidos
+        self._costo_acumulado = 0.0
+        self._frames_medidos = 0
+        if self.presupuesto_ms is None:
+            return
+        if self.costo_promedio_ms > self.presupuesto_ms:
+            if self.nivel > 0:
+                # Cada bajada alarga la espera para volver a subir
+                self._espera_subida = min(self._espera_subida * 2, MAX_VENTANAS_SUBIDA)
+                self._cambiar_calidad(self.nivel - 1)
+        elif self.costo_promedio_ms < self.presupuesto_ms / 2 and self.nivel < self.nivel_maximo:
+            self._ventanas_holgadas += 1
+            if self._ventanas_holgadas >= self._espera_subida:
+                self._cambiar_calidad(self.nivel + 1)
+        else:
+            self._ventanas_holgadas = 0
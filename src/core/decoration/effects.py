@@ -2,7 +2,13 @@ import pygame
 import random
 import math
 import time
-from ui.components.utils import get_gradient, mostrar_texto_adaptativo, obtener_fuente
+from functools import lru_cache
+import numpy as np
+from core.config import factor_paso
+from core.decoration.particulas import SistemaParticulas
+from core.decoration.sprites import FORMAS, sprite_estrella
+from ui.components.utils import mostrar_texto_adaptativo, obtener_fuente
+from ui.components.gradientes import gradiente
 from ui.components.emoji import mostrar_alternativo_adaptativo
 
 # Mensajes de feedback
@@ -50,7 +56,41 @@ PALETA = {
     "menta": (152, 255, 179)
 }
 
+@lru_cache(maxsize=16)
+def superficie_feedback(mensaje, color, ancho, alto, radio, sombra_offset, fuente):
+    """
+    Compone el cartel de feedback completo (sombra, fondo, gradiente, borde y
+    texto) una sola vez por mensaje, color y tamaño.
+    """
+    surf = pygame.Surface((ancho, alto), pygame.SRCALPHA)
+    pygame.draw.rect(surf, (0, 0, 0, 40), (4, 4, ancho, alto), border_radius=radio)
+    pygame.draw.rect(surf, (255, 255, 255, 240), (0, 0, ancho, alto), border_radius=radio)
+    alfa = color[3] if len(color) > 3 else 180
+    gradiente_masked = gradiente(
+        ancho, alto, ((*color[:3], alfa), (*(max(0, c-30) for c in color[:3]), alfa))
+    ).copy()
+    mask = pygame.Surface((ancho, alto), pygame.SRCALPHA)
+    pygame.draw.rect(mask, (255, 255, 255, 255), (0, 0, ancho, alto), border_radius=radio)
+    gradiente_masked.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    surf.blit(gradiente_masked, (0, 0))
+    pygame.draw.rect(surf, (255, 255, 255, 150), (0, 0, ancho, alto), width=3, border_radius=radio)
+    mostrar_texto_adaptativo(
+        surf, mensaje, sombra_offset, sombra_offset, ancho, alto,
+        fuente_base=fuente, color=(10, 10, 10, 150), centrado=True
+    )
+    mostrar_texto_adaptativo(
+        surf, mensaje, 0, 0, ancho, alto,
+        fuente_base=fuente, color=(30, 30, 30), centrado=True
+    )
+    return surf
+
 class EffectsMixin:
+    def _sistema_particulas(self):
+        # Acepta juegos que todavía inicializan self.particulas = []
+        if not isinstance(getattr(self, 'particulas', None), SistemaParticulas):
+            self.particulas = SistemaParticulas()
+        return self.particulas
+
     def mostrar_feedback(self, es_correcto, respuesta_correcta=None):
         if es_correcto:
             mensaje = random.choice(mensajes_correcto)
@@ -81,120 +121,26 @@ class EffectsMixin:
     def dibujar_feedback(self):
         if self.tiempo_mensaje > 0 and self.mensaje:
             ancho = self.sx(550)
-            alto = self.sy(80)
+            alto_completo = alto = self.sy(80)
             x = (self.ANCHO - ancho) // 2
             y = self.ALTO - self.sy(180)
             if y < self.navbar_height:
                 y = self.navbar_height + self.sy(10)
-            if self.tiempo_mensaje < 10:
-                factor = self.tiempo_mensaje / 10
-                alto = int(alto * factor)
-                self.mensaje_animacion = factor
-            elif self.mensaje_animacion < 1.0:
-                self.mensaje_animacion = min(1.0, self.mensaje_animacion + 0.1)
+            # La animación de apertura/cierre la avanza update_mensaje
+            if self.mensaje_animacion < 1.0:
                 alto = int(alto * self.mensaje_animacion)
-            surf = pygame.Surface((ancho, alto), pygame.SRCALPHA)
-            sombra = pygame.Surface((ancho, alto), pygame.SRCALPHA)
-            pygame.draw.rect(
-                sombra,
-                (0, 0, 0, 40),
-                (4, 4, ancho, alto),
-                border_radius=self.sy(25)
-            )
-            surf.blit(sombra, (0, 0))
-            pygame.draw.rect(
-                surf,
-                (255, 255, 255, 240),
-                (0, 0, ancho, alto),
-                border_radius=self.sy(25)
-            )
-            gradiente = get_gradient(ancho, alto, 
-                                    self.mensaje_color[:3], 
-                                    tuple(max(0, c-30) for c in self.mensaje_color[:3]))
-            gradiente.set_alpha(self.mensaje_color[3] if len(self.mensaje_color) > 3 else 180)
-            mask = pygame.Surface((ancho, alto), pygame.SRCALPHA)
-            pygame.draw.rect(
-                mask,
-                (255, 255, 255, 255),
-                (0, 0, ancho, alto),
-                border_radius=self.sy(25)
-            )
-            gradiente_masked = gradiente.copy()
-            gradiente_masked.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            surf.blit(gradiente_masked, (0, 0))
-            pygame.draw.rect(
-                surf,
-                (255, 255, 255, 150),
-                (0, 0, ancho, alto),
-                width=3,
-                border_radius=self.sy(25)
-            )
-            self.pantalla.blit(surf, (x, y))
-            sombra_offset = self.sy(2)
-            mostrar_texto_adaptativo(
-                self.pantalla,
-                self.mensaje,
-                x + sombra_offset, y + sombra_offset,
-                ancho, alto,
-                fuente_base=self.fuente,
-                color=(10, 10, 10, 150),
-                centrado=True
-            )
-            mostrar_texto_adaptativo(
-                self.pantalla,
-                self.mensaje,
-                x, y,
-                ancho, alto,
-                fuente_base=self.fuente,
-                color=(30, 30, 30),
-                centrado=True
-            )
-            self.tiempo_mensaje -= 1
-
-    def crear_estrella_img(self, tamaño=None, color=(255, 215, 0)):
-        tamaño = tamaño or self.sy(20)
-        img = pygame.Surface((tamaño, tamaño), pygame.SRCALPHA)
-        puntos = []
-        for i in range(5):
-            ang = math.pi/2 + i * 2*math.pi/5
-            puntos.append((
-                tamaño//2 + int(tamaño//2 * math.cos(ang)),
-                tamaño//2 - int(tamaño//2 * math.sin(ang))
-            ))
-            ang += math.pi/5
-            puntos.append((
-                tamaño//2 + int(tamaño//5 * math.cos(ang)),
-                tamaño//2 - int(tamaño//5 * math.sin(ang))
-            ))
-        pygame.draw.polygon(img, color, puntos)
-        return img
-
-    def crear_estrella_img_simple(self, tamaño=None, color=(255, 215, 0)):
-        """
-        Crea una imagen de estrella simple para efectos de celebración.
-        Este método replica el efecto clásico de estrella usado en dino_cazador.
-        """
-        tamaño = tamaño or self.sy(15)
-        img = pygame.Surface((tamaño, tamaño), pygame.SRCALPHA)
-        puntos = []
-        for i in range(5):
-            ang = math.pi/2 + i * 2*math.pi/5
-            puntos.append((
-                tamaño//2 + int(tamaño//2 * math.cos(ang)),
-                tamaño//2 - int(tamaño//2 * math.sin(ang))
-            ))
-            ang += math.pi/5
-            puntos.append((
-                tamaño//2 + int(tamaño//5 * math.cos(ang)),
-                tamaño//2 - int(tamaño//5 * math.sin(ang))
-            ))
-        pygame.draw.polygon(img, color, puntos)
-        return img
+            if alto > 0:
+                banner = superficie_feedback(
+                    self.mensaje, tuple(self.mensaje_color), ancho, alto_completo,
+                    self.sy(25), self.sy(2), self.fuente
+                )
+                # La animación de apertura/cierre solo escala el cartel ya compuesto
+                if alto != alto_completo:
+                    banner = pygame.transform.scale(banner, (ancho, alto))
+                self.pantalla.blit(banner, (x, y))
 
     def crear_efecto_estrellas(self, posicion, cantidad=12, colores=None):
         x, y = posicion
-        if not hasattr(self, 'estrella_img') or self.estrella_img is None:
-            self.estrella_img = self.crear_estrella_img()
         if colores is None:
             colores = [
                 PALETA["amarillo_sol"],
@@ -233,8 +179,6 @@ class EffectsMixin:
         Crea estrellas para celebrar una respuesta correcta (versión simple).
         """
         x, y = posicion
-        if not hasattr(self, 'estrella_img_simple') or self.estrella_img_simple is None:
-            self.estrella_img_simple = self.crear_estrella_img_simple()
         if not hasattr(self, 'estrellas_simple'):
             self.estrellas_simple = []
         for _ in range(cantidad):
@@ -264,113 +208,101 @@ class EffectsMixin:
             tamaño = random.uniform(self.sy(5), self.sy(12))
         if vida is None:
             vida = random.randint(30, 70)
-        if not hasattr(self, 'particulas'):
-            self.particulas = []
-        self.particulas.append({
-            'x': x, 'y': y,
-            'vel_x': velocidad[0], 'vel_y': velocidad[1],
-            'tamaño': tamaño, 'tamaño_original': tamaño,
-            'color': color, 'vida': vida, 'max_vida': vida,
-            'forma': forma
-        })
+        self._sistema_particulas().emitir(x, y, velocidad[0], velocidad[1], tamaño, color, vida, forma)
 
     def crear_explosion_particulas(self, x, y, cantidad=30, colores=None, radio=None):
         if colores is None:
             colores = random.sample(list(PALETA.values()), min(6, len(PALETA)))
         if radio is None:
             radio = self.sy(120)
-        formas = ["circulo", "cuadrado", "triangulo", "estrella", "corazon"]
-        if not hasattr(self, 'particulas'):
-            self.particulas = []
-        for _ in range(cantidad):
-            angulo = random.uniform(0, 2 * math.pi)
-            magnitud = random.uniform(1.5, 4.0)
-            vel_x = math.cos(angulo) * magnitud
-            vel_y = math.sin(angulo) * magnitud
-            tamaño = random.uniform(self.sy(6), self.sy(15))
-            color = random.choice(colores)
-            vida = random.randint(40, 80)
-            forma = random.choice(formas)
-            self.particulas.append({
-                'x': x, 'y': y,
-                'vel_x': vel_x, 'vel_y': vel_y,
-                'tamaño': tamaño, 'tamaño_original': tamaño,
-                'color': color, 'vida': vida, 'max_vida': vida,
-                'forma': forma
-            })
+        colores = np.array([c[:3] for c in colores], dtype=np.uint8)
+        angulo = np.random.uniform(0, 2 * math.pi, cantidad)
+        magnitud = np.random.uniform(1.5, 4.0, cantidad)
+        self._sistema_particulas().emitir(
+            x, y,
+            np.cos(angulo) * magnitud, np.sin(angulo) * magnitud,
+            np.random.uniform(self.sy(6), self.sy(15), cantidad),
+            colores[np.random.randint(0, len(colores), cantidad)],
+            np.random.randint(40, 81, cantidad),
+            np.random.randint(0, len(FORMAS), cantidad)
+        )
         if self.sonido_activado and 'explosion' in self.sounds:
             self.sounds['explosion'].play()
 
-    def update_animacion_estrellas(self):
+    def update_efectos(self, dt=None):
+        """
+        Avanza todos los efectos (mensaje de feedback, estrellas y partículas).
+        dt en segundos; los métodos de dibujo ya no modifican estado.
+        """
+        self.update_mensaje(dt)
+        self.update_animacion_estrellas(dt)
+        self.update_animacion_estrellas_simple(dt)
+        self.update_particulas(dt)
+
+    def update_mensaje(self, dt=None):
+        if self.tiempo_mensaje <= 0:
+            return
+        paso = factor_paso(dt)
+        self.tiempo_mensaje = max(0, self.tiempo_mensaje - paso)
+        if self.tiempo_mensaje < 10:
+            self.mensaje_animacion = self.tiempo_mensaje / 10
+        elif self.mensaje_animacion < 1.0:
+            self.mensaje_animacion = min(1.0, self.mensaje_animacion + 0.1 * paso)
+
+    def update_animacion_estrellas(self, dt=None):
         if not hasattr(self, 'estrellas'):
             self.estrellas = []
+        paso = factor_paso(dt)
         for s in self.estrellas[:]:
-            s['rotacion'] += 3
-            s['vida'] -= 1
-            s['vel_y'] += 0.05
-            s['x'] += s['vel_x']
-            s['y'] += s['vel_y']
+            s['rotacion'] += 3 * paso
+            s['vida'] -= paso
+            s['vel_y'] += 0.05 * paso
+            s['x'] += s['vel_x'] * paso
+            s['y'] += s['vel_y'] * paso
             if s['vida'] < s['max_vida'] * 0.3:
-                s['escala'] *= 0.97
+                s['escala'] *= 0.97 ** paso
             if s['vida'] <= 0:
                 self.estrellas.remove(s)
         if hasattr(self, 'animacion_activa') and self.animacion_activa:
-            self.tiempo_animacion -= 1
+            self.tiempo_animacion -= paso
             if self.tiempo_animacion <= 0:
                 self.animacion_activa = False
 
-    def update_animacion_estrellas_simple(self):
+    def update_animacion_estrellas_simple(self, dt=None):
         """
         Actualiza la animación de las estrellas simples.
         """
         if not hasattr(self, 'estrellas_simple'):
             self.estrellas_simple = []
+        paso = factor_paso(dt)
         for s in self.estrellas_simple[:]:
-            s['rotacion'] += 2
-            s['vida'] -= 1
+            s['rotacion'] += 2 * paso
+            s['vida'] -= paso
             if s['vida'] <= 0:
                 self.estrellas_simple.remove(s)
         if hasattr(self, 'animacion_activa_simple') and self.animacion_activa_simple:
-            self.tiempo_animacion_simple -= 1
+            self.tiempo_animacion_simple -= paso
             if self.tiempo_animacion_simple <= 0:
                 self.animacion_activa_simple = False
 
-    def update_particulas(self):
-        if not hasattr(self, 'particulas'):
-            self.particulas = []
-        for p in self.particulas[:]:
-            p['vida'] -= 1
-            p['x'] += p['vel_x']
-            p['y'] += p['vel_y']
-            p['vel_y'] += 0.1
-            p['vel_x'] *= 0.98
-            factor_vida = p['vida'] / p['max_vida']
-            p['tamaño'] = p['tamaño_original'] * max(0.2, factor_vida)
-            if p['vida'] <= 0:
-                self.particulas.remove(p)
+    def update_particulas(self, dt=None):
+        self._sistema_particulas().update(factor_paso(dt))
 
     def draw_animacion_estrellas(self):
-        if not hasattr(self, 'estrella_img') or self.estrella_img is None:
-            self.estrella_img = self.crear_estrella_img()
         if not hasattr(self, 'estrellas'):
             self.estrellas = []
+        tamaño_base = self.sy(20)
         for s in self.estrellas:
+            tamaño = int(tamaño_base * s['escala'])
+            if tamaño <= 0:
+                continue
             opacidad = int(255 * (s['vida'] / s['max_vida']))
-            estrella_coloreada = self.crear_estrella_img(
-                tamaño=int(self.sy(20) * s['escala']),
-                color=s['color']
-            )
-            img_rotada = pygame.transform.rotozoom(
-                estrella_coloreada,
-                s['rotacion'],
-                1.0
-            )
-            img_rotada.set_alpha(opacidad)
+            img_rotada, glow = sprite_estrella(tamaño, s['color'], s['rotacion'])
             if opacidad > 150:
-                glow = pygame.transform.rotozoom(img_rotada, 0, 1.5)
                 glow.set_alpha(opacidad // 3)
                 glow_rect = glow.get_rect(center=(s['x'], s['y']))
                 self.pantalla.blit(glow, glow_rect)
+            img_rotada.set_alpha(opacidad)
             rect = img_rotada.get_rect(center=(s['x'], s['y']))
             self.pantalla.blit(img_rotada, rect)
 
@@ -378,62 +310,18 @@ class EffectsMixin:
         """
         Dibuja las estrellas animadas simples.
         """
-        if not hasattr(self, 'estrella_img_simple') or self.estrella_img_simple is None:
-            self.estrella_img_simple = self.crear_estrella_img_simple()
         if not hasattr(self, 'estrellas_simple'):
             self.estrellas_simple = []
+        tamaño_base = self.sy(15)
         for s in self.estrellas_simple:
+            tamaño = int(tamaño_base * s['escala'])
+            if tamaño <= 0:
+                continue
             opacidad = int(255 * (s['vida'] / s['max_vida']))
-            img_rotada = pygame.transform.rotozoom(
-                self.estrella_img_simple,
-                s['rotacion'],
-                s['escala']
-            )
+            img_rotada, _ = sprite_estrella(tamaño, (255, 215, 0), s['rotacion'])
             img_rotada.set_alpha(opacidad)
             rect = img_rotada.get_rect(center=(s['x'], s['y']))
             self.pantalla.blit(img_rotada, rect)
 
     def draw_particulas(self):
-        if not hasattr(self, 'particulas'):
-            self.particulas = []
-        for p in self.particulas:
-            opacidad = int(255 * (p['vida'] / p['max_vida']))
-            color = (*p['color'][:3], opacidad)
-            tamaño = int(p['tamaño'])
-            if tamaño <= 0:
-                continue
-            surf = pygame.Surface((tamaño*2, tamaño*2), pygame.SRCALPHA)
-            if p['forma'] == "circulo":
-                pygame.draw.circle(surf, color, (tamaño, tamaño), tamaño)
-            elif p['forma'] == "cuadrado":
-                pygame.draw.rect(surf, color, (0, 0, tamaño*2, tamaño*2), border_radius=tamaño//3)
-            elif p['forma'] == "triangulo":
-                pygame.draw.polygon(surf, color, [
-                    (tamaño, 0),
-                    (0, tamaño*2),
-                    (tamaño*2, tamaño*2)
-                ])
-            elif p['forma'] == "estrella":
-                puntos = []
-                for i in range(5):
-                    ang = math.pi/2 + i * 2*math.pi/5
-                    puntos.append((
-                        tamaño + int(tamaño * 0.8 * math.cos(ang)),
-                        tamaño - int(tamaño * 0.8 * math.sin(ang))
-                    ))
-                    ang += math.pi/5
-                    puntos.append((
-                        tamaño + int(tamaño * 0.3 * math.cos(ang)),
-                        tamaño - int(tamaño * 0.3 * math.sin(ang))
-                    ))
-                pygame.draw.polygon(surf, color, puntos)
-            elif p['forma'] == "corazon":
-                radio = tamaño * 0.8
-                pygame.draw.circle(surf, color, (tamaño - int(radio//2), tamaño - int(radio//2)), int(radio//2))
-                pygame.draw.circle(surf, color, (tamaño + int(radio//2), tamaño - int(radio//2)), int(radio//2))
-                pygame.draw.polygon(surf, color, [
-                    (tamaño - radio, tamaño - radio//3),
-                    (tamaño + radio, tamaño - radio//3),
-                    (tamaño, tamaño + radio)
-                ])
-            self.pantalla.blit(surf, (p['x'] - tamaño, p['y'] - tamaño))
\ No newline at end of file
+        self._sistema_particulas().draw(self.pantalla)
@@ -2,6 +2,7 @@ import random
 import pygame
 from ui.components.utils import mostrar_texto_adaptativo, dibujar_caja_texto, obtener_fuente
 from ui.components.emoji import mostrar_alternativo_adaptativo
+from ui.components.gradientes import gradiente
 from ui.components.utils import Boton
 
 def mostrar_texto(pantalla, texto, x, y, w, h, fuente, color=(30,30,30), centrado=False):
@@ -121,13 +122,7 @@ def mostrar_victoria(
     alto_panel = sy(200)
     x_panel = (ANCHO - ancho_panel) // 2
     y_panel = (ALTO - alto_panel) // 2
-    panel = pygame.Surface((ancho_panel, alto_panel), pygame.SRCALPHA)
-    for i in range(alto_panel):
-        factor = i / alto_panel
-        r = int(255 - factor * 50)
-        g = int(250 - factor * 20)
-        b = int(150 + factor * 50)
-        pygame.draw.line(panel, (r, g, b, 240), (0, i), (ancho_panel, i))
+    panel = gradiente(ancho_panel, alto_panel, ((255, 250, 150, 240), (205, 230, 200, 240)))
     pantalla.blit(panel, (x_panel, y_panel))
     pygame.draw.rect(
         pantalla, 
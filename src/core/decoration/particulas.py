@@ -0,0 +1,112 @@
+"""
+Sistema de partículas con almacenamiento en arreglos de NumPy.
+
+Cada atributo (posición, velocidad, vida, tamaño, color, forma) vive en su
+propio arreglo, de modo que update() integra todas las partículas con unas
+pocas operaciones vectorizadas y draw() se reduce a un solo surface.blits()
+con sprites sacados de core.decoration.sprites.
+"""
+import numpy as np
+
+from core.decoration.sprites import FORMAS, cuantizar_alfa, sprite_particula
+
+GRAVEDAD = 0.1
+FRICCION_X = 0.98
+TAMAÑO_MINIMO = 0.2  # fracción del tamaño original al final de la vida
+
+
+class SistemaParticulas:
+    """
+    Conjunto de partículas vivas. Se comporta como una colección: len()
+    devuelve cuántas hay activas y clear() las elimina todas.
+    """
+    def __init__(self, capacidad=64):
+        self.n = 0
+        self._reservar(capacidad)
+
+    def _reservar(self, capacidad):
+        viejos = getattr(self, "_datos", None)
+        self._datos = {
+            "x": np.zeros(capacidad, np.float32),
+            "y": np.zeros(capacidad, np.float32),
+            "vel_x": np.zeros(capacidad, np.float32),
+            "vel_y": np.zeros(capacidad, np.float32),
+            "tamaño_original": np.zeros(capacidad, np.float32),
+            "vida": np.zeros(capacidad, np.float32),
+            "max_vida": np.ones(capacidad, np.float32),
+            "color": np.zeros((capacidad, 3), np.uint8),
+            "forma": np.zeros(capacidad, np.uint8),
+        }
+        if viejos is not None:
+            for k, arr in viejos.items():
+                self._datos[k][:self.n] = arr[:self.n]
+
+    def __len__(self):
+        return self.n
+
+    def __bool__(self):
+        return self.n > 0
+
+    def clear(self):
+        self.n = 0
+
+    def emitir(self, x, y, vel_x, vel_y, tamaño, color, vida, forma="circulo"):
+        """
+        Agrega partículas. Cada argumento puede ser un escalar o un arreglo
+        (todos del mismo largo); `color` es un RGB o un arreglo (n, 3) y
+        `forma` un nombre o un arreglo de índices de FORMAS.
+        """
+        cantidad = max(np.size(x), np.size(vel_x), np.size(vida), 1)
+        if self.n + cantidad > len(self._datos["x"]):
+            self._reservar(max(2 * len(self._datos["x"]), self.n + cantidad))
+        s = slice(self.n, self.n + cantidad)
+        d = self._datos
+        d["x"][s] = x
+        d["y"][s] = y
+        d["vel_x"][s] = vel_x
+        d["vel_y"][s] = vel_y
+        d["tamaño_original"][s] = tamaño
+        d["vida"][s] = vida
+        d["max_vida"][s] = vida
+        d["color"][s] = np.asarray(color)[..., :3]
+        d["forma"][s] = FORMAS.index(forma) if isinstance(forma, str) else forma
+        self.n += cantidad
+
+    def update(self, paso=1.0):
+        """Avanza `paso` frames de referencia (ver core.config.factor_paso)."""
+        if not self.n:
+            return
+        d = self._datos
+        s = slice(0, self.n)
+        d["vida"][s] -= paso
+        d["x"][s] += d["vel_x"][s] * paso
+        d["y"][s] += d["vel_y"][s] * paso
+        d["vel_y"][s] += GRAVEDAD * paso
+        d["vel_x"][s] *= FRICCION_X ** paso
+        # Compacta quitando las que terminaron
+        vivas = d["vida"][s] > 0
+        if not vivas.all():
+            restantes = int(vivas.sum())
+            for arr in d.values():
+                arr[:restantes] = arr[s][vivas]
+            self.n = restantes
+
+    def draw(self, surface):
+        if not self.n:
+            return
+        d = self._datos
+        s = slice(0, self.n)
+        factor_vida = d["vida"][s] / d["max_vida"][s]
+        tamaños = (d["tamaño_original"][s] * np.maximum(TAMAÑO_MINIMO, factor_vida)).astype(np.int32)
+        opacidades = (255 * factor_vida).astype(np.int32).tolist()
+        xs, ys = d["x"][s].tolist(), d["y"][s].tolist()
+        colores, formas = d["color"][s].tolist(), d["forma"][s].tolist()
+        lote = []
+        for i, tamaño in enumerate(tamaños.tolist()):
+            if tamaño <= 0:
+                continue
+            sprite = sprite_particula(
+                FORMAS[formas[i]], tamaño, tuple(colores[i]), cuantizar_alfa(opacidades[i])
+            )
+            lote.append((sprite, (xs[i] - tamaño, ys[i] - tamaño)))
+        surface.blits(lote, doreturn=False)
@@ -0,0 +1,127 @@
+"""
+Caché de sprites pre-renderizados para los efectos.
+
+Las partículas ya no dibujan su forma en una superficie nueva cada frame:
+piden aquí el sprite de (forma, tamaño, color, opacidad) y solo lo blitean.
+El tamaño se redondea a píxeles enteros y la opacidad a escalones de
+PASO_ALFA para que la cantidad de variantes se mantenga acotada.
+
+Las estrellas de celebración se guardan ya rotadas (en pasos de
+PASO_ANGULO) junto con su halo, así que dibujarlas es buscar el sprite,
+ajustar set_alpha y blitear.
+
+Las burbujas del fondo de los juegos se guardan por (radio, color).
+"""
+import math
+from functools import lru_cache
+
+import pygame
+
+FORMAS = ("circulo", "cuadrado", "triangulo", "estrella", "corazon")
+PASO_ALFA = 16
+PASO_ANGULO = 6  # grados
+SIMETRIA_ESTRELLA = 72  # una estrella de 5 puntas se repite cada 72°
+ESCALA_HALO = 1.5
+COLORKEY = (255, 0, 255)
+
+
+def cuantizar_alfa(alfa):
+    """Redondea la opacidad al escalón más cercano (0..255)."""
+    return min(255, int(alfa + PASO_ALFA // 2) // PASO_ALFA * PASO_ALFA)
+
+
+def _dibujar_forma(surf, forma, tamaño, color):
+    if forma == "circulo":
+        pygame.draw.circle(surf, color, (tamaño, tamaño), tamaño)
+    elif forma == "cuadrado":
+        pygame.draw.rect(surf, color, (0, 0, tamaño*2, tamaño*2), border_radius=tamaño//3)
+    elif forma == "triangulo":
+        pygame.draw.polygon(surf, color, [
+            (tamaño, 0),
+            (0, tamaño*2),
+            (tamaño*2, tamaño*2)
+        ])
+    elif forma == "estrella":
+        puntos = []
+        for i in range(5):
+            ang = math.pi/2 + i * 2*math.pi/5
+            puntos.append((
+                tamaño + int(tamaño * 0.8 * math.cos(ang)),
+                tamaño - int(tamaño * 0.8 * math.sin(ang))
+            ))
+            ang += math.pi/5
+            puntos.append((
+                tamaño + int(tamaño * 0.3 * math.cos(ang)),
+                tamaño - int(tamaño * 0.3 * math.sin(ang))
+            ))
+        pygame.draw.polygon(surf, color, puntos)
+    elif forma == "corazon":
+        radio = tamaño * 0.8
+        pygame.draw.circle(surf, color, (tamaño - int(radio//2), tamaño - int(radio//2)), int(radio//2))
+        pygame.draw.circle(surf, color, (tamaño + int(radio//2), tamaño - int(radio//2)), int(radio//2))
+        pygame.draw.polygon(surf, color, [
+            (tamaño - radio, tamaño - radio//3),
+            (tamaño + radio, tamaño - radio//3),
+            (tamaño, tamaño + radio)
+        ])
+
+
+@lru_cache(maxsize=2048)
+def sprite_particula(forma, tamaño, color, alfa=255):
+    """
+    Sprite de (tamaño*2)x(tamaño*2) con la forma dibujada.
+    `color` debe ser una tupla RGB y `alfa` ya cuantizado (ver cuantizar_alfa).
+    """
+    surf = pygame.Surface((tamaño*2, tamaño*2), pygame.SRCALPHA)
+    _dibujar_forma(surf, forma, tamaño, (*color, alfa))
+    return surf
+
+
+def _dibujar_estrella(surf, tamaño, color):
+    puntos = []
+    for i in range(5):
+        ang = math.pi/2 + i * 2*math.pi/5
+        puntos.append((
+            tamaño//2 + int(tamaño//2 * math.cos(ang)),
+            tamaño//2 - int(tamaño//2 * math.sin(ang))
+        ))
+        ang += math.pi/5
+        puntos.append((
+            tamaño//2 + int(tamaño//5 * math.cos(ang)),
+            tamaño//2 - int(tamaño//5 * math.sin(ang))
+        ))
+    pygame.draw.polygon(surf, color, puntos)
+
+
+@lru_cache(maxsize=1024)
+def _estrella_rotada(tamaño, color, angulo):
+    img = pygame.Surface((tamaño, tamaño), pygame.SRCALPHA)
+    _dibujar_estrella(img, tamaño, color)
+    rotada = pygame.transform.rotozoom(img, angulo, 1.0)
+    halo = pygame.transform.rotozoom(rotada, 0, ESCALA_HALO)
+    return rotada, halo
+
+
+def sprite_estrella(tamaño, color, rotacion):
+    """
+    Devuelve (estrella, halo) de `tamaño` px rotados `rotacion` grados
+    (cuantizados a PASO_ANGULO). Las superficies son compartidas: se puede
+    cambiar su set_alpha justo antes de blitear, pero no dibujar sobre ellas.
+    """
+    angulo = int(round(rotacion / PASO_ANGULO)) * PASO_ANGULO % SIMETRIA_ESTRELLA
+    return _estrella_rotada(tamaño, tuple(color[:3]), angulo)
+
+
+@lru_cache(maxsize=256)
+def sprite_burbuja(radio, color):
+    """
+    Burbuja de (radio*2)x(radio*2) con su brillo. Es opaca, igual que cuando
+    se dibujaba con pygame.draw directo sobre la pantalla, así que se usa
+    colorkey con RLE en vez de alfa por píxel: bliteo mucho más barato.
+    """
+    surf = pygame.Surface((radio*2, radio*2))
+    surf.fill(COLORKEY)
+    pygame.draw.circle(surf, color[:3], (radio, radio), radio)
+    pygame.draw.circle(surf, (255, 255, 255), (radio - radio // 4, radio - radio // 4), radio // 3)
+    surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return surf
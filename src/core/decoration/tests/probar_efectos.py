@@ -25,9 +25,7 @@ class DummyGame(EffectsMixin):
         self.particulas = []
 
     def update(self):
-        self.update_animacion_estrellas()
-        self.update_animacion_estrellas_simple()
-        self.update_particulas()
+        self.update_efectos()
         if random.random() < 0.01:
             self.crear_efecto_estrellas((random.randint(100, self.ANCHO-100), random.randint(100, self.ALTO-100)))
         if random.random() < 0.01:
@@ -0,0 +1,122 @@
+"""
+Bucle principal con paso de lógica fijo.
+
+La lógica avanza siempre en pasos de `paso` segundos (por defecto 1/60),
+acumulando el tiempo real transcurrido; el dibujo ocurre una vez por
+iteración y recibe `alfa` (fracción del siguiente paso ya transcurrida) para
+interpolar posiciones entre el paso anterior y el actual (el menú lo usa con
+las estrellas del fondo). Si un frame se atrasa se
+pueden saltar algunos dibujos para que la lógica alcance al reloj, y el
+ritmo de frames se limita a `fps_objetivo` (30 en modo batería).
+
+Clock.tick devuelve milisegundos enteros (16 o 17 para un paso de 16.67), así
+que un acumulador puro a veces dibuja sin avanzar la lógica y a veces avanza
+dos pasos: tirones visibles. Por eso los frames que duran casi un número
+entero de pasos (a menos de `tolerancia_ajuste` segundos) se cuentan como
+exactamente esos pasos. La diferencia se guarda en `deriva` y se devuelve
+al acumulador cuando llega a medio paso, así la lógica no se adelanta ni se
+atrasa respecto al reloj real.
+
+Configuración (sección "rendimiento" de Configuracion.json):
+    fps_objetivo, hz_logica, modo_bateria, fps_bateria,
+    max_pasos_por_frame, max_frames_saltados, tolerancia_ajuste_ms
+"""
+import pygame
+
+RENDIMIENTO_POR_DEFECTO = {
+    "fps_objetivo": 60,
+    "hz_logica": 60,
+    "modo_bateria": False,
+    "fps_bateria": 30,
+    "max_pasos_por_frame": 5,
+    "max_frames_saltados": 2,
+    "tolerancia_ajuste_ms": 2,
+}
+
+
+class BucleJuego:
+    """
+    Args:
+        procesar_eventos: callable(eventos) -> bool; False detiene el bucle
+        actualizar: callable(dt) llamado con el paso fijo en segundos
+        dibujar: callable(alfa) que dibuja y hace flip del display
+    """
+    def __init__(self, procesar_eventos, actualizar, dibujar, fps_objetivo=60, hz_logica=60,
+                 max_pasos_por_frame=5, max_frames_saltados=2, tolerancia_ajuste=0.002, reloj=None):
+        self.procesar_eventos = procesar_eventos
+        self.actualizar = actualizar
+        self.dibujar = dibujar
+        self.fps_objetivo = fps_objetivo
+        self.paso = 1.0 / hz_logica
+        self.max_pasos_por_frame = max_pasos_por_frame
+        self.max_frames_saltados = max_frames_saltados
+        self.tolerancia_ajuste = tolerancia_ajuste
+        self.deriva = 0.0
+        self.reloj = reloj or pygame.time.Clock()
+        self.acumulado = 0.0
+        self.frames_saltados = 0
+        self.corriendo = False
+
+    @classmethod
+    def desde_config(cls, config, procesar_eventos, actualizar, dibujar, reloj=None):
+        """Crea el bucle a partir de la configuración completa del juego."""
+        opciones = {**RENDIMIENTO_POR_DEFECTO, **config.get("rendimiento", {})}
+        fps = opciones["fps_bateria"] if opciones["modo_bateria"] else opciones["fps_objetivo"]
+        return cls(
+            procesar_eventos, actualizar, dibujar,
+            fps_objetivo=fps,
+            hz_logica=opciones["hz_logica"],
+            max_pasos_por_frame=opciones["max_pasos_por_frame"],
+            max_frames_saltados=opciones["max_frames_saltados"],
+            tolerancia_ajuste=opciones["tolerancia_ajuste_ms"] / 1000.0,
+            reloj=reloj,
+        )
+
+    def detener(self):
+        self.corriendo = False
+
+    def ajustar_transcurrido(self, transcurrido):
+        """Redondea a pasos enteros los frames que casi lo son (ver docstring del módulo)."""
+        pasos = round(transcurrido / self.paso)
+        exacto = pasos * self.paso
+        if pasos >= 1 and abs(transcurrido - exacto) <= self.tolerancia_ajuste:
+            self.deriva += transcurrido - exacto
+            transcurrido = exacto
+        if abs(self.deriva) >= self.paso / 2:
+            transcurrido += self.deriva
+            self.deriva = 0.0
+        return max(0.0, transcurrido)
+
+    def iteracion(self, transcurrido):
+        """
+        Procesa una iteración con `transcurrido` segundos reales desde la anterior.
+        Devuelve True si se dibujó el frame.
+        """
+        if not self.procesar_eventos(pygame.event.get()):
+            self.corriendo = False
+            return False
+
+        self.acumulado += self.ajustar_transcurrido(transcurrido)
+        pasos = 0
+        while self.acumulado >= self.paso and pasos < self.max_pasos_por_frame:
+            self.actualizar(self.paso)
+            self.acumulado -= self.paso
+            pasos += 1
+        atrasado = self.acumulado >= self.paso
+        if atrasado and self.frames_saltados < self.max_frames_saltados:
+            # Se salta el dibujo para que la lógica alcance al reloj
+            self.frames_saltados += 1
+            return False
+        if atrasado:
+            # Sigue atrasado tras saltar frames: se descarta el tiempo pendiente
+            self.acumulado %= self.paso
+        self.frames_saltados = 0
+        self.dibujar(self.acumulado / self.paso)
+        return True
+
+    def run(self):
+        self.corriendo = True
+        self.reloj.tick()
+        while self.corriendo:
+            transcurrido = self.reloj.tick(self.fps_objetivo) / 1000.0
+            self.iteracion(transcurrido)
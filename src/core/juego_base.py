@@ -2,12 +2,14 @@ import pygame
 import random
 from ui.components.utils import (
     mostrar_texto_adaptativo, Boton, obtener_fuente, render_text_cached,
-    dibujar_caja_texto, TooltipManager
+    dibujar_caja_texto, TooltipManager, layout_texto_adaptativo
 )
 from ui.components.emoji import mostrar_alternativo_adaptativo
 from core.decoration.effects import EffectsMixin
+from core.decoration.particulas import SistemaParticulas
 from core.decoration.background_game import FondoAnimado
 from core.decoration.paleta import PALETA_LISTA as PALETA
+from core.renderizado import CapaCacheada
 from core.scale.responsive_scaler_basic import ResponsiveScaler
 from core.decoration.helpers import (
     mostrar_texto, mostrar_titulo, mostrar_instrucciones, mostrar_puntaje,
@@ -53,28 +55,73 @@ class JuegoBase(EffectsMixin):
         self.mensaje_animacion = 1.0
         self.sonido_activado = True
         self.estrellas = []
-        self.particulas = []
-        self.estrella_img = None
+        self.particulas = SistemaParticulas()
         self.animacion_activa = False
         self.tiempo_animacion = 0
-        self.fondo_animado = FondoAnimado(self.pantalla, self.navbar_height)
+        self.fondo_animado = FondoAnimado.desde_config(self.pantalla, self.config, self.navbar_height)
         self.fondo_animado.set_escaladores(self.sx, self.sy)
         self.fondo_animado.resize(self.ANCHO, self.ALTO)
+        self.capas = {}
+        self.registrar_capa("titulo", self.dibujar_titulo)
+        self.registrar_capa("marcador", self.dibujar_marcador, self.clave_marcador)
+
+    # --- Capas estáticas ---
+    def registrar_capa(self, nombre, dibujar, clave=None):
+        """
+        Declara una capa que se pinta una vez en una superficie cacheada y luego
+        solo se blitea. `dibujar(surface)` la pinta; `clave()` (opcional) devuelve
+        el estado del que depende y la capa se repinta cuando cambia. Lo demás
+        (resize, nuevo problema...) se avisa con invalidar_capas().
+        """
+        self.capas[nombre] = (CapaCacheada(dibujar), clave)
+
+    def invalidar_capas(self, *nombres):
+        """Invalida las capas indicadas, o todas si no se indica ninguna."""
+        for nombre in nombres or self.capas:
+            if nombre in self.capas:
+                self.capas[nombre][0].invalidar()
+
+    def dibujar_capa(self, nombre):
+        capa, clave = self.capas[nombre]
+        capa.componer(self.pantalla, clave() if clave else None)
+
+    def dibujar_titulo(self, surface):
+        self.mostrar_titulo(surface)
+
+    def clave_marcador(self):
+        return (
+            getattr(self, "puntuacion", self.config.get("juegos_ganados")),
+            getattr(self, "jugadas_totales", self.config.get("juegos_totales")),
+            self.racha_correctas, self.mejor_racha
+        )
+
+    def dibujar_marcador(self, surface):
+        # Usa los atributos propios si existen, si no usa config
+        if hasattr(self, "puntuacion") and hasattr(self, "jugadas_totales"):
+            self.mostrar_puntaje(self.puntuacion, self.jugadas_totales, surface=surface)
+        else:
+            self.mostrar_puntaje(self.config["juegos_ganados"], self.config["juegos_totales"], surface=surface)
+        self.mostrar_racha(surface=surface)
 
-    def mostrar_racha(self, rect=None):
-        mostrar_racha(self.pantalla, self.ANCHO, self.ALTO, self.sx, self.sy, self.racha_correctas, self.mejor_racha, rect)
+    def mostrar_racha(self, rect=None, surface=None):
+        mostrar_racha(surface or self.pantalla, self.ANCHO, self.ALTO, self.sx, self.sy, self.racha_correctas, self.mejor_racha, rect)
 
     def mostrar_operacion(self, rect=None):
         mostrar_operacion(self.pantalla, self.ANCHO, self.navbar_height, self.sx, self.sy, self.operacion_actual, self.sf, rect)
 
-    def mostrar_texto(self, texto, x, y, w, h, fuente=None, color=(30,30,30), centrado=False):
-        mostrar_texto(self.pantalla, texto, x, y, w, h, fuente or self.fuente, color, centrado)
+    def mostrar_texto(self, texto, x, y, w, h, fuente=None, color=(30,30,30), centrado=False, surface=None):
+        mostrar_texto(surface or self.pantalla, texto, x, y, w, h, fuente or self.fuente, color, centrado)
 
-    def mostrar_titulo(self):
-        mostrar_titulo(self.pantalla, self.nombre, self.dificultad, self.fuente_titulo, self.ui_elements, self.navbar_height, self.sy, self.ANCHO)
+    def precalentar_texto(self, texto, w, h, fuente=None, color=(30,30,30), centrado=False):
+        """Compone por adelantado el texto que luego dibujará mostrar_texto con los mismos argumentos."""
+        fuente = fuente or self.fuente
+        layout_texto_adaptativo(texto, w, h, fuente.get_height(), fuente.get_bold(), tuple(color), centrado)
 
-    def mostrar_puntaje(self, juegos_ganados, juegos_totales, frase="¡Puntaje!"):
-        mostrar_puntaje(self.pantalla, juegos_ganados, juegos_totales, self.fuente, self.sy, self.sx, self.ALTO, self.ui_elements, frase)
+    def mostrar_titulo(self, surface=None):
+        mostrar_titulo(surface or self.pantalla, self.nombre, self.dificultad, self.fuente_titulo, self.ui_elements, self.navbar_height, self.sy, self.ANCHO)
+
+    def mostrar_puntaje(self, juegos_ganados, juegos_totales, frase="¡Puntaje!", surface=None):
+        mostrar_puntaje(surface or self.pantalla, juegos_ganados, juegos_totales, self.fuente, self.sy, self.sx, self.ALTO, self.ui_elements, frase)
 
     def dibujar_opciones(self, opciones=None, tooltips=None, estilo="flat", border_radius=None, x0=None, y0=None, espacio=None):
         dibujar_opciones(
@@ -120,7 +167,6 @@ class JuegoBase(EffectsMixin):
 
     def dibujar_fondo(self):
         if self.pantalla:
-            self.fondo_animado.update()
             self.fondo_animado.draw()
 
     def generar_opciones(self, respuesta: int, cantidad: int = 3) -> list[int]:
@@ -153,6 +199,7 @@ class JuegoBase(EffectsMixin):
             self.fondo_animado.set_escaladores(self.sx, self.sy)
             self.fondo_animado.resize(self.ANCHO, self.ALTO)
             self.on_resize(self.ANCHO, self.ALTO)
+            self.invalidar_capas()
         if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
             for btn in self.opcion_botones:
                 if btn.handle_event(evento):
@@ -162,16 +209,16 @@ class JuegoBase(EffectsMixin):
         pass
 
     def update(self, dt=None):
-        self.fondo_animado.update()
+        """
+        Avanza fondo y efectos. dt en segundos; las subclases que redefinen
+        update deben llamar a super().update(dt).
+        """
+        self.fondo_animado.update(dt)
+        self.update_efectos(dt)
 
     def draw(self, surface):
         surface = surface or self.pantalla
         self.dibujar_fondo()
-        self.mostrar_titulo()
-        # Usa los atributos propios si existen, si no usa config
-        if hasattr(self, "puntuacion") and hasattr(self, "jugadas_totales"):
-            self.mostrar_puntaje(self.puntuacion, self.jugadas_totales)
-        else:
-            self.mostrar_puntaje(self.config["juegos_ganados"], self.config["juegos_totales"])
-        self.mostrar_racha()
+        self.dibujar_capa("titulo")
+        self.dibujar_capa("marcador")
 
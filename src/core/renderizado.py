@@ -0,0 +1,124 @@
+"""
+Renderizado por rectángulos sucios.
+
+Las pantallas que separan su contenido en una parte estática (dibujada una
+vez en una CapaCacheada) y una dinámica pueden dibujarse con
+RenderizadorSucio: en cada frame solo se restaura el fondo bajo los
+rectángulos que cambiaron (los que marcaron los widgets con mark_dirty en el
+frame anterior y los que movió el fondo animado), se vuelve a poner la capa
+estática encima, se dibuja lo dinámico y se llama a
+pygame.display.update(rects) en vez de flip().
+
+Lo dinámico debe marcar con mark_dirty todo lo que dibuja; el registro de
+ui.components.utils se vacía en cada frame.
+"""
+import pygame
+
+from ui.components.utils import get_dirty_rects
+
+
+class CapaCacheada:
+    """
+    Superficie con transparencia que se redibuja solo cuando cambia su
+    tamaño/clave o se invalida explícitamente. La superficie se conserva
+    mientras no cambie el tamaño: al repintar solo se limpia.
+
+    Args:
+        dibujar: callable(surface) que pinta el contenido de la capa
+    """
+    def __init__(self, dibujar):
+        self.dibujar = dibujar
+        self.superficie = None
+        self.area = None
+        self._clave = None
+        self._valida = False
+
+    def invalidar(self):
+        self._valida = False
+
+    def obtener(self, tamaño, clave=None):
+        clave = (tuple(tamaño), clave)
+        if not self._valida or clave != self._clave:
+            if self.superficie is None or self.superficie.get_size() != clave[0]:
+                self.superficie = pygame.Surface(tamaño, pygame.SRCALPHA)
+            else:
+                self.superficie.fill((0, 0, 0, 0))
+            self.dibujar(self.superficie)
+            # Los widgets marcan su rect al pintarse, pero aquí no tocaron la pantalla
+            get_dirty_rects()
+            self.area = self.superficie.get_bounding_rect()
+            self._clave = clave
+            self._valida = True
+        return self.superficie
+
+    def componer(self, destino, clave=None):
+        """Blitea la capa sobre `destino`, solo en la zona que tiene contenido."""
+        superficie = self.obtener(destino.get_size(), clave)
+        if self.area.w and self.area.h:
+            destino.blit(superficie, self.area, self.area)
+
+
+def fusionar_rects(rects):
+    """
+    Une los rectángulos que se solapan cuando la unión no agrega más área de
+    la que se ahorra, para no restaurar dos veces la misma zona.
+    """
+    fusionados = []
+    for r in sorted((pygame.Rect(r) for r in rects), key=lambda r: (r.y, r.x)):
+        if r.w <= 0 or r.h <= 0:
+            continue
+        fusionado = True
+        while fusionado:
+            fusionado = False
+            for i, otro in enumerate(fusionados):
+                if r.colliderect(otro):
+                    union = r.union(otro)
+                    if union.w * union.h <= r.w * r.h + otro.w * otro.h:
+                        r = union
+                        fusionados.pop(i)
+                        fusionado = True
+                        break
+        fusionados.append(r)
+    return fusionados
+
+
+class RenderizadorSucio:
+    """
+    Dibuja un frame actualizando solo las zonas que cambiaron. El fondo debe
+    ofrecer rects_sucios() (zonas que movió desde el último frame) y
+    restaurar(surface, rects); si no, se redibuja todo y se hace flip().
+    """
+    def __init__(self):
+        self._previos = []
+        self._clave = None
+
+    def invalidar(self):
+        """Fuerza un frame completo (cambio de pantalla, resize...)."""
+        self._clave = None
+
+    def dibujar(self, pantalla, fondo, capa, dibujar_dinamico, clave=None):
+        tamaño = pantalla.get_size()
+        estatica = capa.obtener(tamaño)
+        clave = (tamaño, id(pantalla), clave)
+        area = pantalla.get_rect()
+        soportado = hasattr(fondo, "rects_sucios") and hasattr(fondo, "restaurar")
+        movidos = fondo.rects_sucios() if soportado else []
+
+        if not soportado or clave != self._clave:
+            get_dirty_rects()
+            fondo.draw(pantalla)
+            pantalla.blit(estatica, (0, 0))
+            dibujar_dinamico(pantalla)
+            self._previos = [r.clip(area) for r in map(pygame.Rect, get_dirty_rects())]
+            self._clave = clave if soportado else None
+            pygame.display.flip()
+            return
+
+        restaurar = fusionar_rects(r.clip(area) for r in map(pygame.Rect, self._previos + movidos))
+        fondo.restaurar(pantalla, restaurar)
+        for rect in restaurar:
+            pantalla.blit(estatica, rect, rect)
+        dibujar_dinamico(pantalla)
+        actuales = [r.clip(area) for r in map(pygame.Rect, get_dirty_rects())]
+        pygame.display.update(restaurar + actuales)
+        self._previos = actuales
@@ -1,28 +1,337 @@
-# resources.py
 """
 Gestión centralizada de recursos (imágenes, sonidos, fuentes, etc.).
+
+Los archivos se decodifican en un pool de hilos y los resultados se van
+volcando en los diccionarios devueltos a medida que terminan. Las imágenes
+decodificadas se guardan además en una caché en disco (buffers RGBA crudos
+indexados por el hash del contenido del PNG), así un arranque en caliente
+no vuelve a descomprimir ningún PNG. Cada lectura renueva la fecha del archivo
+y load_images poda la caché al arrancar (podar_cache): se borran las entradas
+de más de MAX_DIAS_CACHE días y luego las menos usadas hasta quedar por
+debajo de MAX_BYTES_CACHE.
+
+Por defecto load_images devuelve un ImagenesPerezosas: un mapping que decodifica
+cada imagen la primera vez que se pide, mantiene las superficies dentro de un
+presupuesto de bytes (LRU) y permite adelantar la carga con prefetch(keys).
+Las imágenes que usa el juego activo se fijan (fijar/soltar) para que el LRU
+no las descarte mientras el juego conserva referencias a ellas.
 """
+import hashlib
+import io
+import logging
+import os
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pygame
+
+CACHE_DIR = os.path.join(".cache", "imagenes")
+PRESUPUESTO_IMAGENES = 64 * 1024 * 1024  # bytes de superficies decodificadas
+MAX_BYTES_CACHE = 256 * 1024 * 1024  # tamaño máximo de la caché en disco
+MAX_DIAS_CACHE = 30  # entradas sin usar en este tiempo se borran
+_CABECERA = struct.Struct("<II")  # ancho, alto del buffer RGBA
+
+logger = logging.getLogger(__name__)
+
+
+def _num_workers(workers):
+    return workers or min(8, (os.cpu_count() or 2) + 2)
+
+
+def _ruta_cache(cache_dir, digest):
+    return os.path.join(cache_dir, f"{digest}.rgba")
+
+
+def _leer_cache(ruta):
+    try:
+        with open(ruta, "rb") as f:
+            cabecera = f.read(_CABECERA.size)
+            if len(cabecera) != _CABECERA.size:
+                return None
+            ancho, alto = _CABECERA.unpack(cabecera)
+            pixeles = f.read()
+    except OSError:
+        return None
+    if len(pixeles) != ancho * alto * 4:
+        return None
+    try:
+        os.utime(ruta)  # marca de uso para podar_cache
+    except OSError:
+        pass
+    return (ancho, alto), pixeles
+
+
+def _escribir_cache(ruta, size, pixeles):
+    # Se escribe a un temporal y se renombra para no dejar entradas a medias
+    tmp = f"{ruta}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(_CABECERA.pack(*size))
+            f.write(pixeles)
+        os.replace(tmp, ruta)
+    except OSError as e:
+        logger.warning("No se pudo escribir la caché de imagen %s: %s", ruta, e)
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def podar_cache(cache_dir=CACHE_DIR, max_bytes=MAX_BYTES_CACHE, max_dias=MAX_DIAS_CACHE):
+    """
+    Borra de la caché en disco las entradas sin usar hace más de `max_dias` y
+    luego las menos recientes hasta que el total quede en `max_bytes`.
+    Devuelve la cantidad de archivos borrados.
+    """
+    try:
+        nombres = os.listdir(cache_dir)
+    except OSError:
+        return 0
+    entradas = []
+    for nombre in nombres:
+        ruta = os.path.join(cache_dir, nombre)
+        try:
+            st = os.stat(ruta)
+        except OSError:
+            continue
+        entradas.append((st.st_mtime, st.st_size, ruta))
+    entradas.sort()  # de la menos a la más reciente
+    limite = time.time() - max_dias * 86400
+    total = sum(size for _, size, _ in entradas)
+    borradas = 0
+    for mtime, size, ruta in entradas:
+        if mtime >= limite and total <= max_bytes:
+            break
+        try:
+            os.remove(ruta)
+        except OSError:
+            continue
+        total -= size
+        borradas += 1
+    return borradas
+
+
+def decodificar_imagen(ruta, cache_dir=CACHE_DIR):
+    """
+    Decodifica un PNG a (tamaño, bytes RGBA). Pensada para correr en un hilo:
+    no toca el display, la conversión final se hace en el hilo principal.
+    """
+    with open(ruta, "rb") as f:
+        datos = f.read()
+    ruta_cache = None
+    if cache_dir:
+        ruta_cache = _ruta_cache(cache_dir, hashlib.sha1(datos).hexdigest())
+        cacheado = _leer_cache(ruta_cache)
+        if cacheado is not None:
+            return cacheado
+    surf = pygame.image.load(io.BytesIO(datos), os.path.basename(ruta))
+    size = surf.get_size()
+    pixeles = pygame.image.tobytes(surf, "RGBA")
+    if ruta_cache:
+        _escribir_cache(ruta_cache, size, pixeles)
+    return size, pixeles
+
+
+def superficie_desde_rgba(size, pixeles):
+    """Crea la superficie final (convertida al formato del display si existe)."""
+    surf = pygame.image.frombytes(pixeles, size, "RGBA")
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    return surf
+
+
+def _listar(path, extension):
+    return {
+        os.path.splitext(file)[0]: os.path.join(path, file)
+        for file in sorted(os.listdir(path))
+        if file.endswith(extension)
+    }
 
-def load_images(path):
-    # Implementa la carga funcional de imágenes desde un directorio
-    import os
-    import pygame
+
+class ImagenesPerezosas(Mapping):
+    """
+    Diccionario de imágenes de solo lectura con decodificación bajo demanda.
+
+    Las superficies decodificadas se guardan en un LRU limitado por bytes; al
+    superar el presupuesto se descartan las menos usadas (se vuelven a cargar
+    desde la caché RGBA si se piden otra vez). Solo debe usarse desde el hilo
+    principal; los hilos del pool únicamente decodifican.
+
+    Descartar una imagen que alguien sigue usando no libera memoria y la
+    próxima petición crearía una segunda copia. Por eso, entre fijar() y
+    soltar() (mientras hay un juego abierto) las imágenes fijadas y todas las
+    que se entregan quedan fuera del LRU: el presupuesto se puede superar en
+    lo que ocupen.
+    """
+    def __init__(self, archivos, presupuesto_bytes=PRESUPUESTO_IMAGENES,
+                 cache_dir=CACHE_DIR, workers=None, al_cargar=None):
+        self._archivos = archivos
+        self.presupuesto_bytes = presupuesto_bytes
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.al_cargar = al_cargar
+        self._superficies = OrderedDict()
+        self._bytes = 0
+        self._pendientes = {}
+        self._pool = None
+        self._fijadas = set()
+        self._fijando = False
+
+    def __getitem__(self, name):
+        if self._fijando and name in self._archivos:
+            self._fijadas.add(name)
+        surf = self._superficies.get(name)
+        if surf is not None:
+            self._superficies.move_to_end(name)
+            return surf
+        ruta = self._archivos[name]  # KeyError si no existe
+        futuro = self._pendientes.pop(name, None)
+        if futuro is not None:
+            size, pixeles = futuro.result()
+        else:
+            size, pixeles = decodificar_imagen(ruta, self.cache_dir)
+        surf = superficie_desde_rgba(size, pixeles)
+        self._guardar(name, surf)
+        if self.al_cargar:
+            self.al_cargar(name, surf)
+        return surf
+
+    def __contains__(self, name):
+        return name in self._archivos
+
+    def __iter__(self):
+        return iter(self._archivos)
+
+    def __len__(self):
+        return len(self._archivos)
+
+    @property
+    def bytes_en_uso(self):
+        return self._bytes
+
+    def _guardar(self, name, surf):
+        self._superficies[name] = surf
+        self._bytes += surf.get_bytesize() * surf.get_width() * surf.get_height()
+        self._recortar()
+
+    def _recortar(self):
+        """Descarta las menos usadas hasta entrar en el presupuesto, salvo las fijadas."""
+        if self._bytes <= self.presupuesto_bytes:
+            return
+        # Siempre se conserva la última imagen pedida aunque supere el presupuesto
+        ultima = next(reversed(self._superficies))
+        for name in list(self._superficies):
+            if self._bytes <= self.presupuesto_bytes:
+                break
+            if name == ultima or name in self._fijadas:
+                continue
+            viejo = self._superficies.pop(name)
+            self._bytes -= viejo.get_bytesize() * viejo.get_width() * viejo.get_height()
+
+    def fijar(self, keys=()):
+        """
+        Fija las imágenes indicadas y, hasta soltar(), todas las que se pidan:
+        el LRU no las descarta porque quien las pidió guarda la referencia.
+        """
+        self._fijando = True
+        self._fijadas.update(k for k in keys if k in self._archivos)
+
+    def soltar(self):
+        """Libera las imágenes fijadas (al salir del juego) y vuelve al presupuesto."""
+        self._fijando = False
+        self._fijadas.clear()
+        self._recortar()
+
+    def prefetch(self, keys, esperar=False):
+        """
+        Adelanta la decodificación de las imágenes indicadas en el pool de hilos.
+        Con esperar=True bloquea hasta tenerlas listas en memoria.
+        """
+        nuevas = [
+            k for k in keys
+            if k in self._archivos and k not in self._superficies and k not in self._pendientes
+        ]
+        if nuevas:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=_num_workers(self.workers))
+            for name in nuevas:
+                self._pendientes[name] = self._pool.submit(
+                    decodificar_imagen, self._archivos[name], self.cache_dir
+                )
+        if esperar:
+            for name in keys:
+                if name in self._archivos:
+                    self[name]
+
+    def cerrar(self):
+        """Libera el pool de hilos (las decodificaciones en curso terminan)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._pendientes.clear()
+
+
+def load_images(path, workers=None, cache_dir=CACHE_DIR, al_cargar=None,
+                perezosa=True, presupuesto_bytes=PRESUPUESTO_IMAGENES, max_bytes_cache=MAX_BYTES_CACHE):
+    """
+    Carga las imágenes PNG de un directorio.
+
+    Args:
+        path: Directorio con los PNG
+        workers: Número de hilos (por defecto según CPUs)
+        cache_dir: Directorio de la caché RGBA (None la desactiva)
+        al_cargar: Callback opcional (nombre, superficie) llamado al terminar cada imagen
+        perezosa: Si es True devuelve un ImagenesPerezosas sin decodificar nada aún;
+                  si es False decodifica todo en paralelo y devuelve un dict
+        presupuesto_bytes: Límite de memoria de superficies en modo perezoso
+        max_bytes_cache: Tamaño máximo de la caché en disco (se poda al empezar)
+    """
+    if cache_dir:
+        podar_cache(cache_dir, max_bytes_cache)
+    archivos = _listar(path, ".png")
+    if perezosa:
+        return ImagenesPerezosas(archivos, presupuesto_bytes, cache_dir, workers, al_cargar)
     images = {}
-    for file in os.listdir(path):
-        if file.endswith('.png'):
-            name = os.path.splitext(file)[0]
-            images[name] = pygame.image.load(os.path.join(path, file)).convert_alpha()
+    with ThreadPoolExecutor(max_workers=_num_workers(workers)) as pool:
+        futuros = {
+            pool.submit(decodificar_imagen, ruta, cache_dir): name
+            for name, ruta in archivos.items()
+        }
+        for futuro in as_completed(futuros):
+            name = futuros[futuro]
+            try:
+                size, pixeles = futuro.result()
+            except Exception as e:
+                logger.error("No se pudo cargar la imagen %s: %s", archivos[name], e)
+                continue
+            images[name] = superficie_desde_rgba(size, pixeles)
+            if al_cargar:
+                al_cargar(name, images[name])
     return images
 
-def load_sounds(path):
-    # Implementa la carga funcional de sonidos desde un directorio
-    import os
-    import pygame
+
+def _leer_sonido(ruta):
+    with open(ruta, "rb") as f:
+        return pygame.mixer.Sound(file=io.BytesIO(f.read()))
+
+
+def load_sounds(path, workers=None, al_cargar=None):
+    """Carga todos los WAV de un directorio en paralelo."""
     sounds = {}
-    for file in os.listdir(path):
-        if file.endswith('.wav'):
-            name = os.path.splitext(file)[0]
-            sounds[name] = pygame.mixer.Sound(os.path.join(path, file))
+    archivos = _listar(path, ".wav")
+    with ThreadPoolExecutor(max_workers=_num_workers(workers)) as pool:
+        futuros = {pool.submit(_leer_sonido, ruta): name for name, ruta in archivos.items()}
+        for futuro in as_completed(futuros):
+            name = futuros[futuro]
+            try:
+                sounds[name] = futuro.result()
+            except Exception as e:
+                logger.error("No se pudo cargar el sonido %s: %s", archivos[name], e)
+                continue
+            if al_cargar:
+                al_cargar(name, sounds[name])
     return sounds
 
 # El acceso a recursos se hace pasando los diccionarios resultantes
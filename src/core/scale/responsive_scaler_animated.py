@@ -25,9 +25,10 @@ class ResponsiveScalerAnimado:
         self.target_width = new_width
         self.target_height = new_height
 
-    def tick(self):
+    def tick(self, dt=None):
         now = time.time()
-        dt = now - self.last_time
+        if dt is None:
+            dt = now - self.last_time
         self.last_time = now
         t = min(dt * self.transition_speed, 1.0)
         self.current_width += (self.target_width - self.current_width) * t
@@ -1,14 +1,87 @@
 import pygame
 import random
 import math
+import itertools
 from pygame.locals import *
 from ui.components.utils import mostrar_texto_adaptativo, dibujar_caja_texto, Boton , obtener_fuente
 from core.juego_base import JuegoBase , PALETA
+from games.banco_problemas import BancoProblemas
+
+NOMBRES = ["Rexy", "Trici", "Spike", "Dina", "Terry"]
+OBJETOS = ["pasteles", "galletas", "helados", "caramelos"]
+
+# --- Plantillas: función(**valores) -> (enunciado, respuesta, explicación) y el rango de cada valor ---
+def _fiestas(nombre, obj, n):
+    return (f"{nombre} dio 1 {obj} a cada uno de sus {n} amigos en la primera fiesta y 2 en la segunda.\n ¿Cuántos {obj} dio en total?",
+            n*3, f"Suma 1×{n} + 2×{n} = 3×{n}.")
+
+def _arboles(nombre, x, y):
+    return (f"{nombre} plantó {x} árboles cada día durante {y} días.\n ¿Cuántos en total?",
+            x*y, f"{x} × {y}.")
+
+def _canastas(nombre, f, c):
+    return (f"{nombre} tenía {f} frutas y las repartió en {c} canastas iguales.\n ¿Cuántas por canasta?",
+            f//c, f"{f} ÷ {c}.")
+
+def _frutas(nombre, a, f):
+    return (f"{nombre} y sus {a} amigos fueron a recoger frutas. Cada uno recogió {f} frutas, pero luego decidieron repartirlas equitativamente.\n ¿Cuántas frutas recibió cada uno?", f, f"Multiplica {f} × {a+1} y divide entre {a+1}.")
+
+def _monedas(nombre, m, d, am):
+    return (f"{nombre} tiene {m} monedas. Si da {d} monedas a cada amigo y tiene {am} amigos,\n ¿cuántas monedas le quedarán?", m - (d * am), f"Multiplica {d} × {am} y réstalo de {m}.")
+
+def _circulo(nombre, total, pos):
+    return (f"{nombre} y sus amigos están formados en un círculo. Si hay {total} dinosaurios en total y {nombre} es el número {pos},\n ¿qué número es el dinosaurio que está exactamente al frente de {nombre}?", (pos + total // 2) % total if total % 2 == 0 else 1, f"Suma la mitad de {total} a {pos} y aplica módulo {total}.")
+
+def _carrera(nombre, a, p):
+    return (f"{nombre} organiza una carrera con {a} amigos. Si cada uno corre a una velocidad diferente y {nombre} llega en la posición {p},\n ¿cuántos dinosaurios llegaron después de él?", a - p + 1, f"Resta la posición de {nombre} a los participantes: {a} - {p} + 1.")
+
+def _jardin(nombre, l):
+    return (f"{nombre} tiene un jardín cuadrado con {l} metros por lado. Quiere plantar flores en el borde, poniendo una flor cada metro.\n ¿Cuántas flores necesitará?", l * 4, f"El perímetro es 4 × {l}.")
+
+def _pelota(nombre, total, salto):
+    return (f"{nombre} y sus amigos están jugando a pasarse una pelota. Son {total} dinosaurios en total, formados en círculo. Si cada uno pasa la pelota al dinosaurio que está {salto} posiciones a su derecha,\n ¿cuántos pases se necesitan para que la pelota vuelva al dinosaurio que la lanzó primero?", total // math.gcd(total, salto), f"El mínimo número de pases es {total} dividido por el MCD de {total} y {salto}.")
+
+def _sobres(nombre, m, s):
+    return (f"{nombre} tiene {m} monedas y quiere repartirlas en sobres de {s} monedas cada uno.\n ¿Cuántos sobres puede llenar completamente?", m // s, f"Divide {m} entre {s}.")
+
+PLANTILLAS_LOGICO = {
+    "Básico": [
+        (_fiestas, {"nombre": NOMBRES, "obj": OBJETOS, "n": range(5, 16)}),
+        (_arboles, {"nombre": NOMBRES, "x": range(3, 9), "y": range(3, 8)}),
+        (_canastas, {"nombre": NOMBRES, "f": range(20, 41), "c": range(2, 6)}),
+    ],
+    "Medio": [
+        (_frutas, {"nombre": NOMBRES, "a": range(2, 6), "f": range(5, 16)}),
+        (_monedas, {"nombre": NOMBRES, "m": range(10, 31), "d": range(2, 6), "am": range(3, 9)}),
+        (_circulo, {"nombre": NOMBRES, "total": range(6, 15), "pos": range(2, 5)}),
+    ],
+    "Avanzado": [
+        (_carrera, {"nombre": NOMBRES, "a": range(3, 7), "p": range(2, 4)}),
+        (_jardin, {"nombre": NOMBRES, "l": range(5, 11)}),
+        (_pelota, {"nombre": NOMBRES, "total": range(5, 11), "salto": range(2, 4)}),
+        (_sobres, {"nombre": NOMBRES, "m": range(20, 41), "s": range(4, 9)}),
+    ],
+}
+
+def generar_problema_logico(nivel):
+    """Elige una plantilla del nivel y le da valores al azar"""
+    plantilla, rangos = random.choice(PLANTILLAS_LOGICO[nivel])
+    return plantilla(**{nombre: random.choice(rango) for nombre, rango in rangos.items()})
+
+def enumerar_problemas_logicos(nivel):
+    """Todos los problemas del nivel, un grupo por plantilla"""
+    grupos = []
+    for plantilla, rangos in PLANTILLAS_LOGICO[nivel]:
+        nombres = list(rangos)
+        grupos.append([
+            plantilla(**dict(zip(nombres, valores))) for valores in itertools.product(*rangos.values())
+        ])
+    return grupos
 
 class JuegoLogico(JuegoBase):
     # Constantes de clase para reutilizar
-    NOMBRES = ["Rexy", "Trici", "Spike", "Dina", "Terry"]
-    OBJETOS = ["pasteles", "galletas", "helados", "caramelos"]
+    NOMBRES = NOMBRES
+    OBJETOS = OBJETOS
     USEREVENT_SIGUIENTE = USEREVENT + 1
 
     def __init__(self, pantalla, config, dificultad, fondo, navbar, images, sounds, return_to_menu):
@@ -26,6 +99,12 @@ class JuegoLogico(JuegoBase):
         self.respuesta_correcta = None
         self.explicacion = ""
         self.opcion_botones: list[Boton] = []
+        self.registrar_capa("enunciado", self.dibujar_enunciado)
+        self.registrar_capa("decoracion", self.dibujar_decoracion,
+                            lambda: tuple(tuple(btn.rect) for btn in self.opcion_botones))
+        self.banco = BancoProblemas.desde_config(
+            "logico", self.nivel_actual, enumerar_problemas_logicos, config, self.precalentar_problema
+        )
         self.generar_problema()
 
     def cargar_imagenes(self):
@@ -34,12 +113,7 @@ class JuegoLogico(JuegoBase):
         self.mapa_img = self.images.get("mapa")
 
     def generar_problema(self):
-        if self.nivel_actual == "Básico":
-            problema, respuesta, explicacion = self.generar_problema_logico_basico()
-        elif self.nivel_actual == "Medio":
-            problema, respuesta, explicacion = self.generar_problema_logico_medio()
-        else:
-            problema, respuesta, explicacion = self.generar_problema_logico_avanzado()
+        problema, respuesta, explicacion = self.banco.siguiente()
         self.problema_actual = problema
         self.respuesta_correcta = respuesta
         self.explicacion = explicacion
@@ -47,54 +121,17 @@ class JuegoLogico(JuegoBase):
         random.shuffle(self.opciones)
         self.tiempo_mensaje = 0
         self.mensaje = ""
+        self.invalidar_capas("enunciado")
 
 
     def generar_problema_logico_basico(self):
-        nombre = random.choice(self.NOMBRES)
-        obj = random.choice(self.OBJETOS)
-        n, x, y, f, c = [random.randint(lo, hi) for lo,hi in ((5,15),(3,8),(3,7),(20,40),(2,5))]
-        lista = [
-            (f"{nombre} dio 1 {obj} a cada uno de sus {n} amigos en la primera fiesta y 2 en la segunda.\n ¿Cuántos {obj} dio en total?",
-             n*3, f"Suma 1×{n} + 2×{n} = 3×{n}."),
-            (f"{nombre} plantó {x} árboles cada día durante {y} días.\n ¿Cuántos en total?",
-             x*y, f"{x} × {y}."),
-            (f"{nombre} tenía {f} frutas y las repartió en {c} canastas iguales.\n ¿Cuántas por canasta?",
-             f//c, f"{f} ÷ {c}.")
-        ]
-        return random.choice(lista)
+        return generar_problema_logico("Básico")
 
     def generar_problema_logico_medio(self):
-        nombre = random.choice(self.NOMBRES)
-        a = random.randint(2, 5)
-        f = random.randint(5, 15)
-        m = random.randint(10, 30)
-        d = random.randint(2, 5)
-        am = random.randint(3, 8)
-        total = random.randint(6, 14)
-        pos = random.randint(2, 4)
-        problemas = [
-            (f"{nombre} y sus {a} amigos fueron a recoger frutas. Cada uno recogió {f} frutas, pero luego decidieron repartirlas equitativamente.\n ¿Cuántas frutas recibió cada uno?", f, f"Multiplica {f} × {a+1} y divide entre {a+1}."),
-            (f"{nombre} tiene {m} monedas. Si da {d} monedas a cada amigo y tiene {am} amigos,\n ¿cuántas monedas le quedarán?", m - (d * am), f"Multiplica {d} × {am} y réstalo de {m}."),
-            (f"{nombre} y sus amigos están formados en un círculo. Si hay {total} dinosaurios en total y {nombre} es el número {pos},\n ¿qué número es el dinosaurio que está exactamente al frente de {nombre}?", (pos + total // 2) % total if total % 2 == 0 else 1, f"Suma la mitad de {total} a {pos} y aplica módulo {total}.")
-        ]
-        return random.choice(problemas)
+        return generar_problema_logico("Medio")
 
     def generar_problema_logico_avanzado(self):
-        nombre = random.choice(self.NOMBRES)
-        a = random.randint(3, 6)
-        p = random.randint(2, 3)
-        l = random.randint(5, 10)
-        total = random.randint(5, 10)
-        salto = random.randint(2, 3)
-        m = random.randint(20, 40)
-        s = random.randint(4, 8)
-        problemas = [
-            (f"{nombre} organiza una carrera con {a} amigos. Si cada uno corre a una velocidad diferente y {nombre} llega en la posición {p},\n ¿cuántos dinosaurios llegaron después de él?", a - p + 1, f"Resta la posición de {nombre} a los participantes: {a} - {p} + 1."),
-            (f"{nombre} tiene un jardín cuadrado con {l} metros por lado. Quiere plantar flores en el borde, poniendo una flor cada metro.\n ¿Cuántas flores necesitará?", l * 4, f"El perímetro es 4 × {l}."),
-            (f"{nombre} y sus amigos están jugando a pasarse una pelota. Son {total} dinosaurios en total, formados en círculo. Si cada uno pasa la pelota al dinosaurio que está {salto} posiciones a su derecha,\n ¿cuántos pases se necesitan para que la pelota vuelva al dinosaurio que la lanzó primero?", total // math.gcd(total, salto), f"El mínimo número de pases es {total} dividido por el MCD de {total} y {salto}."),
-            (f"{nombre} tiene {m} monedas y quiere repartirlas en sobres de {s} monedas cada uno.\n ¿Cuántos sobres puede llenar completamente?", m // s, f"Divide {m} entre {s}.")
-        ]
-        return random.choice(problemas)
+        return generar_problema_logico("Avanzado")
 
     def handle_event(self, evento):
         super().handle_event(evento)
@@ -118,23 +155,26 @@ class JuegoLogico(JuegoBase):
             self.generar_problema()
 
     def update(self, dt=None):
-        if self.tiempo_mensaje > 0:
-            self.tiempo_mensaje -= 1
-        self.update_animacion_estrellas()
-        self.update_particulas()
-
-    def draw(self, surface):
-        self.dibujar_fondo()
-        self.mostrar_titulo()
+        super().update(dt)
 
-        # --- Mejoras para el enunciado del problema ---
+    def _enunciado_rect(self):
         enunciado_y = self.navbar_height + 100  # Debajo del título
         enunciado_h = max(90, int(self.ALTO * 0.13))
+        return enunciado_y, enunciado_h
+
+    def precalentar_problema(self, problema):
+        enunciado_h = self._enunciado_rect()[1]
+        enunciado_fuente = obtener_fuente(max(38, int(self.ALTO * 0.045)), negrita=True)
+        self.precalentar_texto(problema[0], self.ANCHO - 80, enunciado_h, fuente=enunciado_fuente, centrado=True)
+
+    def dibujar_enunciado(self, surface):
+        # --- Mejoras para el enunciado del problema ---
+        enunciado_y, enunciado_h = self._enunciado_rect()
         enunciado_fuente = obtener_fuente(max(38, int(self.ALTO * 0.045)), negrita=True)
 
         # Opcional: dibujar una caja suave de fondo para el enunciado
         dibujar_caja_texto(
-            self.pantalla,
+            surface,
             40, enunciado_y,
             self.ANCHO - 80, enunciado_h,
             color=(255, 255, 240, 220),
@@ -149,13 +189,12 @@ class JuegoLogico(JuegoBase):
             h=enunciado_h,
             fuente=enunciado_fuente,
             color=(30, 30, 30),
-            centrado=True
+            centrado=True,
+            surface=surface
         )
 
-        # opciones
-        opciones_y = enunciado_y + enunciado_h + 30  # Espacio debajo del enunciado
-        self.dibujar_opciones(y0=opciones_y)
-
+    def dibujar_decoracion(self, surface):
+        """Dino y mapa escalados junto a los botones; depende de sus posiciones."""
         # — Dino pequeño a la izquierda del primer botón —
         if self.opcion_botones and self.dino_img:
             nuevo_w = int(self.ANCHO * 0.15)
@@ -165,7 +204,7 @@ class JuegoLogico(JuegoBase):
             first_btn = self.opcion_botones[0]
             x_dino = max(10, first_btn.rect.left - nuevo_w - 10)
             y_dino = first_btn.rect.centery - nuevo_h // 2
-            self.pantalla.blit(dino_small, (x_dino, y_dino))
+            surface.blit(dino_small, (x_dino, y_dino))
 
         # — Mapa pequeño debajo de los botones —
         if self.mapa_img:
@@ -178,7 +217,24 @@ class JuegoLogico(JuegoBase):
             else:
                 y_map = self.navbar_height + 10
             x_map = self.ANCHO - nuevo_map_w - 20
-            self.pantalla.blit(mapa_small, (x_map, y_map))
+            surface.blit(mapa_small, (x_map, y_map))
+
+    def clave_marcador(self):
+        return (self.puntuacion, self.jugadas_totales)
+
+    def dibujar_marcador(self, surface):
+        self.mostrar_puntaje(self.puntuacion, self.jugadas_totales, "Puntaje", surface=surface)
+
+    def draw(self, surface):
+        self.dibujar_fondo()
+        self.dibujar_capa("titulo")
+        self.dibujar_capa("enunciado")
+
+        # opciones
+        enunciado_y, enunciado_h = self._enunciado_rect()
+        opciones_y = enunciado_y + enunciado_h + 30  # Espacio debajo del enunciado
+        self.dibujar_opciones(y0=opciones_y)
+        self.dibujar_capa("decoracion")
 
         # feedback
         self.dibujar_feedback()
@@ -186,7 +242,7 @@ class JuegoLogico(JuegoBase):
         self.draw_particulas()
 
         # puntaje y navbar
-        self.mostrar_puntaje(self.puntuacion, self.jugadas_totales, "Puntaje")
+        self.dibujar_capa("marcador")
 
 
 
@@ -11,13 +11,19 @@ from .mi_juego import MiJuego
 # from .otro_juego import OtroJuego  # Descomenta y agrega más juegos aquí
 
 # Lista centralizada de juegos (opcional, para usar en el menú principal)
+# "recursos": imágenes que usa el juego; el menú las precarga (prefetch) antes de instanciarlo
 JUEGOS_DISPONIBLES = [
-    {"nombre": "Dino Sumas/Resta", "clase": JuegoSumaResta, "imagen": "dino1"},
-    {"nombre": "Dino Cazador", "clase": JuegoCazadorNumeros, "imagen": "dino2"},
-    {"nombre": "Dino Logico", "clase": JuegoLogico, "imagen": "dino3"},
-    {"nombre": "Memoria Jurasica", "clase": JuegoMemoriaJurasica, "imagen": "dino4"},
-    {"nombre": "Mi Juego", "clase": MiJuego, "imagen": "dino5"},
-    {"nombre": "Rescate Jurásico", "clase": JuegoRescate, "imagen": "dino5"},
+    {"nombre": "Dino Sumas/Resta", "clase": JuegoSumaResta, "imagen": "dino1",
+     "recursos": ["dino1", "cueva", "piedrita"]},
+    {"nombre": "Dino Cazador", "clase": JuegoCazadorNumeros, "imagen": "dino2",
+     "recursos": ["dino3", "fruta"]},
+    {"nombre": "Dino Logico", "clase": JuegoLogico, "imagen": "dino3",
+     "recursos": ["dino4", "mapa"]},
+    {"nombre": "Memoria Jurasica", "clase": JuegoMemoriaJurasica, "imagen": "dino4",
+     "recursos": ["card_back", "encendido", "apagado"]},
+    {"nombre": "Mi Juego", "clase": MiJuego, "imagen": "dino5", "recursos": []},
+    {"nombre": "Rescate Jurásico", "clase": JuegoRescate, "imagen": "dino5",
+     "recursos": ["dino_mama", "dino_bebe", "roca"]},
     # {"nombre": "Otro Juego", "func": OtroJuego},
 ]
 
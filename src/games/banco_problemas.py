@@ -0,0 +1,155 @@
+"""
+Bancos de problemas precalculados para los juegos de preguntas.
+
+Cada juego ofrece una función enumerar(nivel) que devuelve TODOS los problemas
+posibles del nivel, agrupados (una lista por tipo de problema/plantilla). El
+banco los deduplica y los guarda en .cache/problemas/<juego>_<nivel>.json; la
+caché se regenera sola cuando cambia el módulo que define el enumerador.
+
+BancoProblemas sortea primero el grupo (uniforme, sin ponderar por tamaño) y
+luego un problema del grupo. Es lo mismo que hacían los generadores
+aleatorios (plantilla al azar y después valores al azar): cada tipo sale con
+la misma frecuencia, así que cada problema de un grupo chico se repite más que
+uno de un grupo grande. Ponderar por tamaño haría que la plantilla con más
+combinaciones acapare el nivel.
+
+Además evita repetir los últimos vistos y deja preparado el siguiente
+problema para que el juego pueda precalentar su texto antes de mostrarlo. Con `semilla` la secuencia de
+preguntas es reproducible (p. ej. para una sesión en clase).
+"""
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import unicodedata
+from collections import deque
+
+CACHE_DIR = os.path.join(".cache", "problemas")
+MEMORIA_RECIENTES = 20  # problemas recientes que no se repiten
+INTENTOS_SORTEO = 8
+
+logger = logging.getLogger(__name__)
+
+
+def _nombre_archivo(juego, nivel):
+    nivel = unicodedata.normalize("NFKD", nivel).encode("ascii", "ignore").decode().lower()
+    return f"{juego}_{nivel}.json"
+
+
+def _firma(enumerar):
+    """Hash del módulo que define el enumerador: si se edita, la caché deja de valer."""
+    ruta = getattr(sys.modules.get(enumerar.__module__), "__file__", None)
+    try:
+        with open(ruta, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except (OSError, TypeError):
+        return None
+
+
+def deduplicar(grupos):
+    """Quita problemas repetidos (mismo enunciado) y grupos vacíos, conservando el orden."""
+    vistos = set()
+    resultado = []
+    for grupo in grupos:
+        unicos = []
+        for problema in grupo:
+            if problema[0] not in vistos:
+                vistos.add(problema[0])
+                unicos.append(tuple(problema))
+        if unicos:
+            resultado.append(unicos)
+    return resultado
+
+
+def _leer_cache(ruta, firma):
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            datos = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if firma is None or datos.get("firma") != firma:
+        return None
+    return [[tuple(p) for p in grupo] for grupo in datos["grupos"]]
+
+
+def _escribir_cache(ruta, firma, grupos):
+    # Se escribe a un temporal y se renombra para no dejar archivos a medias
+    tmp = f"{ruta}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"firma": firma, "grupos": grupos}, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, ruta)
+    except OSError as e:
+        logger.warning("No se pudo escribir el banco de problemas %s: %s", ruta, e)
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def cargar_grupos(juego, nivel, enumerar, cache_dir=CACHE_DIR):
+    """Grupos de problemas del nivel, desde la caché o enumerándolos (y guardándolos)."""
+    firma = _firma(enumerar)
+    ruta = os.path.join(cache_dir, _nombre_archivo(juego, nivel)) if cache_dir else None
+    if ruta:
+        grupos = _leer_cache(ruta, firma)
+        if grupos:
+            return grupos
+    grupos = deduplicar(enumerar(nivel))
+    if ruta and firma:
+        _escribir_cache(ruta, firma, grupos)
+    return grupos
+
+
+class BancoProblemas:
+    """
+    Args:
+        juego: nombre corto del juego (nombre del archivo de caché)
+        nivel: "Básico", "Medio" o "Avanzado"
+        enumerar: callable(nivel) -> lista de grupos de problemas (tuplas)
+        semilla: semilla del sorteo; None = aleatorio
+        al_preparar: callable(problema) llamado con el siguiente problema en
+            cuanto se elige, para precalentar su texto
+    """
+    def __init__(self, juego, nivel, enumerar, semilla=None, al_preparar=None, cache_dir=CACHE_DIR):
+        self.grupos = cargar_grupos(juego, nivel, enumerar, cache_dir)
+        if not self.grupos:
+            raise ValueError(f"No hay problemas para {juego} en nivel {nivel}")
+        total = sum(len(grupo) for grupo in self.grupos)
+        self.rng = random.Random(semilla)
+        self.recientes = deque(maxlen=min(MEMORIA_RECIENTES, total // 2))
+        self.al_preparar = al_preparar
+        self.proximo = None
+
+    @classmethod
+    def desde_config(cls, juego, nivel, enumerar, config, al_preparar=None):
+        """Crea el banco con la semilla de la sección "problemas" de la configuración (si la hay)."""
+        semilla = (config or {}).get("problemas", {}).get("semilla")
+        return cls(juego, nivel, enumerar, semilla=semilla, al_preparar=al_preparar)
+
+    def __len__(self):
+        return sum(len(grupo) for grupo in self.grupos)
+
+    def _sortear(self):
+        # Grupo uniforme a propósito: conserva la mezcla de plantillas (ver docstring del módulo)
+        problema = None
+        for _ in range(INTENTOS_SORTEO):
+            problema = self.rng.choice(self.rng.choice(self.grupos))
+            if problema[0] not in self.recientes:
+                break
+        return problema
+
+    def preparar(self):
+        """Elige el siguiente problema y lo pasa a al_preparar."""
+        self.proximo = self._sortear()
+        self.recientes.append(self.proximo[0])
+        if self.al_preparar:
+            self.al_preparar(self.proximo)
+        return self.proximo
+
+    def siguiente(self):
+        """Devuelve el problema preparado y deja preparado el que sigue."""
+        problema = self.proximo or self.preparar()
+        self.preparar()
+        return problema
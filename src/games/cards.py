@@ -1,11 +1,34 @@
 """
 Funciones para dibujar cartas genéricas del juego de memoria.
+
+Cada variante de carta (reverso, cara, acierto y error) se pinta una sola vez
+por tamaño en una superficie cacheada; en cada frame solo se blitea.
 """
 import pygame
+from functools import lru_cache
 from ui.components.utils import dibujar_caja_texto, mostrar_texto_adaptativo
 
+@lru_cache(maxsize=16)
+def sprite_reverso(img_reverso, ancho, alto, color_borde_reverso):
+    """Reverso escalado al tamaño de la carta, con su borde."""
+    surf = pygame.Surface((ancho, alto), pygame.SRCALPHA)
+    surf.blit(pygame.transform.scale(img_reverso, (ancho, alto)), (0, 0))
+    pygame.draw.rect(surf, color_borde_reverso, surf.get_rect(), 2, border_radius=10)
+    return surf
+
+@lru_cache(maxsize=256)
+def sprite_cara(valor, tipo, bordes, ancho, alto, fuente, color_texto, color_borde):
+    """Cara de la carta con su texto; `bordes` es None, 'acierto' o 'error' (ver color_borde)."""
+    surf = pygame.Surface((ancho, alto), pygame.SRCALPHA)
+    color_fondo = (60, 60, 100) if tipo == 'operacion' else (100, 60, 60)
+    dibujar_caja_texto(surf, 0, 0, ancho, alto, color_fondo, radius=10)
+    mostrar_texto_adaptativo(surf, valor, 0, 0, ancho, alto, fuente, color_texto, centrado=True)
+    pygame.draw.rect(surf, color_borde, surf.get_rect(), 3 if bordes is None else 4, border_radius=10)
+    return surf
+
 def dibujar_carta_generica(
-    pantalla, carta, x, y, ancho, alto, fuente, color_texto, color_acierto, color_error, color_borde, img_reverso, color_borde_reverso
+    pantalla, carta, x, y, ancho, alto, fuente, color_texto, color_acierto, color_error, color_borde, img_reverso, color_borde_reverso,
+    emparejadas=None
 ):
     escala = 1.0 + carta.get('animacion', 0.0) * 0.1
     ancho_real = int(ancho * escala)
@@ -13,20 +36,17 @@ def dibujar_carta_generica(
     x_offset = (ancho_real - ancho) // 2
     y_offset = (alto_real - alto) // 2
     rect = pygame.Rect(x - x_offset, y - y_offset, ancho_real, alto_real)
-    if carta.get('id') in carta.get('cartas_emparejadas', set()) or carta.get('volteada', False):
-        color_fondo = (60, 60, 100) if carta.get('tipo') == 'operacion' else (100, 60, 60)
-        dibujar_caja_texto(pantalla, rect.x, rect.y, rect.width, rect.height, color_fondo, radius=10)
-        mostrar_texto_adaptativo(
-            pantalla, carta.get('valor', ''), rect.x, rect.y, rect.width, rect.height, fuente, color_texto, centrado=True
+    if emparejadas is None:
+        emparejadas = carta.get('cartas_emparejadas', ())
+    if carta.get('id') in emparejadas or carta.get('volteada', False):
+        bordes = carta.get('bordes')
+        if bordes not in ('acierto', 'error'):
+            bordes = None
+        borde = {'acierto': color_acierto, 'error': color_error}.get(bordes, color_borde)
+        img = sprite_cara(
+            carta.get('valor', ''), carta.get('tipo'), bordes, ancho_real, alto_real, fuente, color_texto, borde
         )
-        if carta.get('bordes') == 'acierto':
-            pygame.draw.rect(pantalla, color_acierto, rect, 4, border_radius=10)
-        elif carta.get('bordes') == 'error':
-            pygame.draw.rect(pantalla, color_error, rect, 4, border_radius=10)
-        else:
-            pygame.draw.rect(pantalla, color_borde, rect, 3, border_radius=10)
     else:
-        img = pygame.transform.scale(img_reverso, (ancho_real, alto_real))
-        pantalla.blit(img, rect)
-        pygame.draw.rect(pantalla, color_borde_reverso, rect, 2, border_radius=10)
+        img = sprite_reverso(img_reverso, ancho_real, alto_real, color_borde_reverso)
+    pantalla.blit(img, rect)
     return rect
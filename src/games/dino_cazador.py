@@ -5,25 +5,19 @@ import math
 from pygame.locals import *
 from core.juego_base import JuegoBase  # Asegúrate de que la ruta sea correcta
 from ui.components.utils import obtener_fuente, dibujar_caja_texto, mostrar_texto_adaptativo
+from games.banco_problemas import BancoProblemas
 
-def generar_problema_multiplicacion(nivel):
-    """Genera un problema de multiplicación según el nivel"""
+def problema_multiplicacion(nivel, a, b, c=None):
+    """Enunciado, respuesta y operación para unos factores ya elegidos"""
     if nivel == "Básico":
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
         problema = f"Un dinosaurio pone {a} huevos cada semana. ¿Cuántos huevos pondrá en {b} semanas?"
         respuesta = a * b
         operacion = f"{a} × {b} = ?"
     elif nivel == "Medio":
-        a = random.randint(2, 10)
-        b = random.randint(2, 10)
         problema = f"Hay {a} nidos con {b} huevos cada uno. ¿Cuántos huevos hay en total?"
         respuesta = a * b
         operacion = f"{a} × {b} = ?"
     else:  # Avanzado
-        a = random.randint(5, 15)
-        b = random.randint(5, 10)
-        c = random.randint(1, 5)
         problema = f"Un dinosaurio come {a} hojas por día. Si hay {b} dinosaurios y comen durante {c} días, ¿cuántas hojas comerán en total?"
         respuesta = a * b * c
         operacion = f"{a} × {b} × {c} = ?"
@@ -31,6 +25,27 @@ def generar_problema_multiplicacion(nivel):
     return problema, respuesta, operacion
 
 
+def generar_problema_multiplicacion(nivel):
+    """Genera un problema de multiplicación según el nivel"""
+    if nivel == "Básico":
+        return problema_multiplicacion(nivel, random.randint(1, 5), random.randint(1, 5))
+    elif nivel == "Medio":
+        return problema_multiplicacion(nivel, random.randint(2, 10), random.randint(2, 10))
+    return problema_multiplicacion(nivel, random.randint(5, 15), random.randint(5, 10), random.randint(1, 5))
+
+
+def enumerar_problemas_multiplicacion(nivel):
+    """Todos los problemas del nivel (mismos rangos que el generador), en un solo grupo"""
+    if nivel == "Básico":
+        return [[problema_multiplicacion(nivel, a, b) for a in range(1, 6) for b in range(1, 6)]]
+    elif nivel == "Medio":
+        return [[problema_multiplicacion(nivel, a, b) for a in range(2, 11) for b in range(2, 11)]]
+    return [[
+        problema_multiplicacion(nivel, a, b, c)
+        for a in range(5, 16) for b in range(5, 11) for c in range(1, 6)
+    ]]
+
+
 class JuegoCazadorNumeros(JuegoBase):
     def __init__(self, pantalla, config, dificultad, fondo, navbar, images, sounds, return_to_menu):
         super().__init__('Dino Cazador de Números', pantalla, config, dificultad, fondo, navbar, images, sounds, return_to_menu)
@@ -45,15 +60,22 @@ class JuegoCazadorNumeros(JuegoBase):
         
         # Elementos para animación de estrellas
         self.estrellas = []
-        self.estrella_img = None
         self.tiempo_animacion = 0
         self.animacion_activa = False
         
         # Inicializar elementos UI responsivos
         self.init_responsive_ui()
         
+        # Capas cacheadas: enunciado (cambia con cada problema) y dino decorativo
+        self.registrar_capa("enunciado", self.dibujar_enunciado)
+        self.registrar_capa("decoracion", self.dibujar_decoracion, lambda: bool(self.opcion_botones))
+
         # Cargar recursos y generar primer problema
         self.cargar_imagenes()
+        self.banco = BancoProblemas.desde_config(
+            "multiplicacion", self._nivel_from_dificultad(dificultad), enumerar_problemas_multiplicacion,
+            config, self.precalentar_problema
+        )
         self.generar_problema()
 
     def init_responsive_ui(self):
@@ -117,9 +139,8 @@ class JuegoCazadorNumeros(JuegoBase):
 
 
     def generar_problema(self):
-        # Selecciona el problema según el nivel de dificultad usando la función auxiliar
-        nivel = self._nivel_from_dificultad(self.dificultad)
-        problema, respuesta, operacion = generar_problema_multiplicacion(nivel)
+        # Siguiente problema del banco del nivel (ya precalentado)
+        problema, respuesta, operacion = self.banco.siguiente()
         self.problema_actual = problema
         self.respuesta_correcta = respuesta
         self.operacion_actual = operacion
@@ -127,6 +148,7 @@ class JuegoCazadorNumeros(JuegoBase):
         random.shuffle(self.opciones)
         self.tiempo_mensaje = 0
         self.mensaje = ""
+        self.invalidar_capas("enunciado")
 
     def handle_event(self, evento):
         super().handle_event(evento)
@@ -170,25 +192,24 @@ class JuegoCazadorNumeros(JuegoBase):
         self.init_responsive_ui()
 
     def update(self, dt=None):
-        if self.tiempo_mensaje > 0:
-            self.tiempo_mensaje -= 1
-            
-        # Actualizar animación de estrellas
-        self.update_animacion_estrellas()
-        # Actualizar partículas
-        self.update_particulas()
+        # Fondo, mensaje, estrellas y partículas
+        super().update(dt)
 
-    def draw(self, surface):
-        self.dibujar_fondo()
-        self.mostrar_titulo()
+    def precalentar_problema(self, problema):
+        enunciado_rect = self.ui_elements["enunciado_rect"]
+        self.precalentar_texto(
+            problema[0], enunciado_rect[2], enunciado_rect[3],
+            fuente=obtener_fuente(self.sf(28), negrita=True), centrado=True
+        )
 
+    def dibujar_enunciado(self, surface):
         # Enunciado grande, centrado, debajo del título y arriba de los botones
         enunciado_rect = self.ui_elements["enunciado_rect"]
         enunciado_fuente = obtener_fuente(self.sf(28), negrita=True)
         
         # Dibujar fondo del problema
         dibujar_caja_texto(
-            self.pantalla,
+            surface,
             enunciado_rect[0], enunciado_rect[1], 
             enunciado_rect[2], enunciado_rect[3],
             color=(240, 249, 232, 220),
@@ -204,9 +225,26 @@ class JuegoCazadorNumeros(JuegoBase):
             h=enunciado_rect[3],
             fuente=enunciado_fuente,
             color=(30, 30, 30),
-            centrado=True
+            centrado=True,
+            surface=surface
         )
 
+    def dibujar_decoracion(self, surface):
+        # Imagen decorativa (opcional)
+        if self.dino_img and self.opcion_botones:
+            dino_pos = self.ui_elements["dino_pos"]
+            surface.blit(self.dino_img, dino_pos)
+
+    def dibujar_marcador(self, surface):
+        self.mostrar_puntaje(self.puntuacion, self.jugadas_totales, "Puntaje", surface=surface)
+        # Mostrar racha actual
+        self.mostrar_racha(self.ui_elements["racha_rect"], surface=surface)
+
+    def draw(self, surface):
+        self.dibujar_fondo()
+        self.dibujar_capa("titulo")
+        self.dibujar_capa("enunciado")
+
         # Mostrar la operación matemática
         operacion_rect = self.ui_elements["operacion_rect"]
         self.mostrar_operacion(operacion_rect)
@@ -220,10 +258,7 @@ class JuegoCazadorNumeros(JuegoBase):
             espacio=self.sx(25)
         )
 
-        # Imagen decorativa (opcional)
-        if self.dino_img and self.opcion_botones:
-            dino_pos = self.ui_elements["dino_pos"]
-            self.pantalla.blit(self.dino_img, dino_pos)
+        self.dibujar_capa("decoracion")
 
         # Dibujar animación de estrellas
         self.draw_animacion_estrellas()
@@ -232,11 +267,7 @@ class JuegoCazadorNumeros(JuegoBase):
         # Feedback
         self.dibujar_feedback()
 
-        # Puntaje
-        self.mostrar_puntaje(self.puntuacion, self.jugadas_totales, "Puntaje")
-        
-        # Mostrar racha actual
-        racha_rect = self.ui_elements["racha_rect"]
-        self.mostrar_racha(racha_rect)
+        # Puntaje y racha
+        self.dibujar_capa("marcador")
 
 # Para usar esta clase, crea una instancia pasando los argumentos requeridos por JuegoBase.
\ No newline at end of file
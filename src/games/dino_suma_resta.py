@@ -4,14 +4,12 @@ import sys
 from ui.components.utils import Boton, dibujar_caja_texto
 from ui.navigation_bar import NavigationBar
 from core.juego_base import JuegoBase, PALETA
+from games.banco_problemas import BancoProblemas
 
 
-def generar_problema_suma_resta(nivel):
-    """Genera un problema de suma o resta con enunciado temático según el nivel"""
+def problema_suma_resta(nivel, operacion, a, b, c=None):
+    """Enunciado temático y respuesta para una operación y unos valores ya elegidos"""
     if nivel == "Básico":
-        a = random.randint(1, 10)
-        b = random.randint(1, min(10, a))
-        operacion = random.choice(['+', '-'])
         if operacion == '+':
             problema = f"Dino encontró {a} huevos en su cueva y luego encontró {b} más en el bosque.\n¿Cuántos huevos tiene en total?"
             respuesta = a + b
@@ -19,9 +17,6 @@ def generar_problema_suma_resta(nivel):
             problema = f"Dino tenía {a} huevos y usó {b} para hacer una tortilla.\n¿Cuántos huevos le quedan?"
             respuesta = a - b
     elif nivel == "Medio":
-        a = random.randint(10, 20)
-        b = random.randint(1, min(15, a))
-        operacion = random.choice(['+', '-'])
         if operacion == '+':
             problema = f"Dino recolectó {a} frutas y luego encontró {b} más.\n¿Cuántas frutas tiene ahora?"
             respuesta = a + b
@@ -29,10 +24,6 @@ def generar_problema_suma_resta(nivel):
             problema = f"Dino tenía {a} piedras y perdió {b} en el camino.\n¿Cuántas piedras le quedan?"
             respuesta = a - b
     else:  # Avanzado
-        a = random.randint(10, 30)
-        b = random.randint(5, 15)
-        c = random.randint(1, 10)
-        operacion = random.choice(['++', '+-', '-+'])
         if operacion == '++':
             problema = f"Dino encontró {a} semillas, luego {b} más y después otras {c}.\n¿Cuántas semillas tiene en total?"
             respuesta = a + b + c
@@ -45,6 +36,40 @@ def generar_problema_suma_resta(nivel):
     return problema, respuesta
 
 
+def generar_problema_suma_resta(nivel):
+    """Genera un problema de suma o resta con enunciado temático según el nivel"""
+    if nivel == "Básico":
+        a = random.randint(1, 10)
+        b = random.randint(1, min(10, a))
+        return problema_suma_resta(nivel, random.choice(['+', '-']), a, b)
+    elif nivel == "Medio":
+        a = random.randint(10, 20)
+        b = random.randint(1, min(15, a))
+        return problema_suma_resta(nivel, random.choice(['+', '-']), a, b)
+    a = random.randint(10, 30)
+    b = random.randint(5, 15)
+    c = random.randint(1, 10)
+    return problema_suma_resta(nivel, random.choice(['++', '+-', '-+']), a, b, c)
+
+
+def enumerar_problemas_suma_resta(nivel):
+    """Todos los problemas del nivel (mismos rangos que el generador), un grupo por operación"""
+    if nivel == "Básico":
+        return [
+            [problema_suma_resta(nivel, op, a, b) for a in range(1, 11) for b in range(1, min(10, a) + 1)]
+            for op in ('+', '-')
+        ]
+    elif nivel == "Medio":
+        return [
+            [problema_suma_resta(nivel, op, a, b) for a in range(10, 21) for b in range(1, min(15, a) + 1)]
+            for op in ('+', '-')
+        ]
+    return [
+        [problema_suma_resta(nivel, op, a, b, c) for a in range(10, 31) for b in range(5, 16) for c in range(1, 11)]
+        for op in ('++', '+-', '-+')
+    ]
+
+
 class JuegoSumaResta(JuegoBase):
     def __init__(self, pantalla, config, dificultad, fondo, navbar, images, sounds, return_to_menu=None):
         super().__init__('Dino Suma y Resta', pantalla, config, dificultad, fondo, navbar, images, sounds, return_to_menu)
@@ -59,6 +84,10 @@ class JuegoSumaResta(JuegoBase):
         self._ajustar_imagenes()
         self.opciones = []
         self.opcion_botones = []
+        self.registrar_capa("escena", self.dibujar_escena)
+        self.banco = BancoProblemas.desde_config(
+            "suma_resta", self.nivel_actual, enumerar_problemas_suma_resta, config, self.precalentar_problema
+        )
         self.generar_problema()
 
     def _ajustar_imagenes(self):
@@ -71,20 +100,21 @@ class JuegoSumaResta(JuegoBase):
             self.piedrita = pygame.transform.smoothscale(self.piedrita, (60, 60))
 
     def generar_problema(self):
-        self.problema_actual, self.respuesta_correcta = generar_problema_suma_resta(self.nivel_actual)
+        self.problema_actual, self.respuesta_correcta = self.banco.siguiente()
         self.opciones = self.generar_opciones(self.respuesta_correcta)
+        self.invalidar_capas("escena")
         # Los botones se crean en draw con dibujar_opciones()
 
-    def draw(self, surface=None):
-        pantalla = surface if surface else self.pantalla
-        self.pantalla = pantalla
-        super().draw(surface)
+    def precalentar_problema(self, problema):
+        self.precalentar_texto(problema[0], 640, 60, fuente=self.fuente, color=(20, 20, 80), centrado=True)
 
+    def dibujar_escena(self, surface):
+        """Caja del problema e imágenes decorativas (capa cacheada)."""
         # Problema en caja decorativa
         texto_problem_y = self.navbar_height + 95
         altura_caja = 80
         dibujar_caja_texto(
-            self.pantalla,
+            surface,
             self.ANCHO//2 - 350,
             texto_problem_y,
             700,
@@ -99,21 +129,28 @@ class JuegoSumaResta(JuegoBase):
             h=altura_caja - 20,
             fuente=self.fuente,
             color=(20, 20, 80),
-            centrado=True
+            centrado=True,
+            surface=surface
         )
 
         # Imágenes decorativas
         alto_img = int(self.ALTO * 0.22)
         y_fila = texto_problem_y + altura_caja + 20
         if self.dino_img:
-            self.pantalla.blit(self.dino_img, (60, y_fila))
+            surface.blit(self.dino_img, (60, y_fila))
         if self.cueva_img:
-            self.pantalla.blit(self.cueva_img, (self.ANCHO - alto_img - 60, y_fila))
+            surface.blit(self.cueva_img, (self.ANCHO - alto_img - 60, y_fila))
         if self.piedrita:
             espacio_total = self.ANCHO - 120 - alto_img * 2
             for i in range(3):
                 x = 60 + alto_img + espacio_total * (i + 1) // 4
-                self.pantalla.blit(self.piedrita, (x, y_fila + alto_img // 3))
+                surface.blit(self.piedrita, (x, y_fila + alto_img // 3))
+
+    def draw(self, surface=None):
+        pantalla = surface if surface else self.pantalla
+        self.pantalla = pantalla
+        super().draw(surface)
+        self.dibujar_capa("escena")
 
         # Opciones (usa método base, botones responsivos y coloridos)
         y_btn = int(self.ALTO * 0.65)
@@ -142,9 +179,8 @@ class JuegoSumaResta(JuegoBase):
                     return True
         return False
 
-    def update(self, dt=0):
-        self.update_animacion_estrellas()
-        self.update_particulas()
+    def update(self, dt=None):
+        super().update(dt)
 
     def on_resize(self, ancho, alto):
         self.ANCHO = ancho
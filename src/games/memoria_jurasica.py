@@ -1,6 +1,7 @@
 import pygame
 import random
 import os
+from functools import lru_cache
 from games.cards import dibujar_carta_generica
 from core.juego_base import JuegoBase
 from ui.components.utils import Boton  # <-- Añade esta línea
@@ -19,6 +20,39 @@ def cargar_sonido(nombre):
     ruta = os.path.join(SND_PATH, nombre)
     return pygame.mixer.Sound(ruta)
 
+@lru_cache(maxsize=None)
+def operaciones_por_resultado(nivel):
+    """
+    Todas las operaciones válidas del nivel agrupadas por resultado:
+    {resultado: (operacion, ...)}. Se enumeran una sola vez por nivel.
+    """
+    indice = {}
+    def agregar(op, res):
+        indice.setdefault(res, []).append(op)
+
+    if nivel == "Básico":
+        for a in range(1, 11):
+            for b in range(1, 11):
+                agregar(f"{a} + {b}", a + b)
+    elif nivel == "Medio":
+        for a in range(2, 11):
+            for b in range(2, 11):
+                agregar(f"{a} × {b}", a * b)
+    else:  # Avanzado
+        for a in range(10, 51):
+            for b in range(10, 51):
+                agregar(f"{a} + {b}", a + b)
+        for a in range(20, 61):
+            for b in range(10, 31):
+                agregar(f"{a} - {b}", a - b)
+        for a in range(3, 13):
+            for b in range(3, 13):
+                agregar(f"{a} × {b}", a * b)
+        for b in range(2, 11):  # División exacta
+            for res in range(2, 11):
+                agregar(f"{b * res} ÷ {b}", res)
+    return {res: tuple(ops) for res, ops in indice.items()}
+
 class JuegoMemoriaJurasica(JuegoBase):
     DIFICULTAD_CONFIG = {
         "Fácil":   {"nivel": "Básico",   "pares": 6,  "filas": 3, "columnas": 4},
@@ -42,15 +76,30 @@ class JuegoMemoriaJurasica(JuegoBase):
         self.reverso = images.get("card_back") or cargar_imagen("card_back.png", (100, 120))
         self.sonido_acierto = sounds.get("acierto") if sounds else cargar_sonido("acierto.wav")
         self.sonido_error = sounds.get("error") if sounds else cargar_sonido("error.wav")
-        self.img_sonido_encendido = images.get("encendido") or cargar_imagen("encendido.png", (40, 40))
-        self.img_sonido_apagado = images.get("apagado") or cargar_imagen("apagado.png", (40, 40))
+        self.img_sonido_encendido = self._icono(images.get("encendido") or cargar_imagen("encendido.png", (40, 40)))
+        self.img_sonido_apagado = self._icono(images.get("apagado") or cargar_imagen("apagado.png", (40, 40)))
         self.silenciado = False
-        self.btn_silencio_rect = None
+        self.btn_silencio = Boton(
+            "", 0, 0, 40, 40,
+            imagen=self.img_sonido_encendido,
+            imagen_pos="center",
+            estilo="round",
+            border_color=None,
+            border_width=3,
+            color_normal=(240, 240, 240),
+            color_hover=(255, 220, 220)
+        )
 
         # Estado del juego
         self.inicializar_estado()
         self.running = True
 
+    @staticmethod
+    def _icono(img, img_size=32):
+        if img.get_width() != img_size or img.get_height() != img_size:
+            img = pygame.transform.smoothscale(img, (img_size, img_size))
+        return img
+
     def set_dificultad(self, dificultad):
         config = self.DIFICULTAD_CONFIG.get(dificultad, self.DIFICULTAD_CONFIG["Fácil"])
         self.nivel_actual = config["nivel"]
@@ -67,19 +116,22 @@ class JuegoMemoriaJurasica(JuegoBase):
         self.total_pares = self.num_pares
         self.nivel_completado = False
         self.carta_rects = []
+        self.botones_victoria = []
         self.mostrar_cartas_inicio = True
         self.tiempo_inicio_mostrar = pygame.time.get_ticks()
         self.tiempo_espera = 0
         self.procesando_par = False
         self.mensaje = ""
-        self.tiempo_mensaje = 0
+        self.inicio_mensaje = 0
         self.generar_cartas()
+        self.calcular_layout()
 
     def cambiar_nivel(self, nueva_dificultad=None):
         if nueva_dificultad and nueva_dificultad in self.DIFICULTAD_CONFIG:
             self.dificultad_seleccionada = nueva_dificultad
         self.set_dificultad(self.dificultad_seleccionada)
         self.inicializar_estado()
+        self.invalidar_capas("titulo")
 
     def generar_cartas(self):
         operaciones = self.generar_operaciones(self.nivel_actual, self.num_pares)
@@ -104,40 +156,91 @@ class JuegoMemoriaJurasica(JuegoBase):
         random.shuffle(self.cartas)
 
     def generar_operaciones(self, nivel, num_pares):
-        operaciones = []
-        resultados_usados = set()
-        while len(operaciones) < num_pares:
-            if nivel == "Básico":
-                a, b = random.randint(1, 10), random.randint(1, 10)
-                op = f"{a} + {b}"
-                res = a + b
-            elif nivel == "Medio":
-                a, b = random.randint(2, 10), random.randint(2, 10)
-                op = f"{a} × {b}"
-                res = a * b
-            else:  # Avanzado
-                tipo = random.choice(['suma', 'resta', 'mult', 'div'])
-                if tipo == 'suma':
-                    a, b = random.randint(10, 50), random.randint(10, 50)
-                    op = f"{a} + {b}"
-                    res = a + b
-                elif tipo == 'resta':
-                    a, b = random.randint(20, 60), random.randint(10, 30)
-                    op = f"{a} - {b}"
-                    res = a - b
-                elif tipo == 'mult':
-                    a, b = random.randint(3, 12), random.randint(3, 12)
-                    op = f"{a} × {b}"
-                    res = a * b
-                else:  # División exacta
-                    b = random.randint(2, 10)
-                    res = random.randint(2, 10)
-                    a = b * res
-                    op = f"{a} ÷ {b}"
-            if res not in resultados_usados:
-                resultados_usados.add(res)
-                operaciones.append((op, res))
-        return operaciones
+        """Elige num_pares operaciones con resultados distintos (ver operaciones_por_resultado)."""
+        indice = operaciones_por_resultado(nivel)
+        if num_pares > len(indice):
+            raise ValueError(
+                f"Nivel {nivel}: se piden {num_pares} pares pero solo hay {len(indice)} resultados distintos"
+            )
+        return [(random.choice(indice[res]), res) for res in random.sample(list(indice), num_pares)]
+
+    def calcular_layout(self):
+        """
+        Geometría de la cuadrícula y del botón de silencio. Solo se recalcula
+        al cambiar el tamaño de la pantalla o las cartas (nuevo nivel).
+        """
+        ancho, alto = self.tamaño_layout = self.pantalla.get_size()
+        filas, columnas = self.filas, self.columnas
+        base_ancho, base_alto = 90, 110
+        espacio_h, espacio_v = 18, 18
+
+        # Espacio disponible debajo de la barra y título
+        info_top = self.navbar_height + 10
+        info_height = 70
+        margen_lateral = 40
+        margen_superior = info_top + info_height + 10
+        margen_inferior = 80
+
+        area_w = ancho - 2 * margen_lateral
+        area_h = alto - margen_superior - margen_inferior
+
+        total_ancho = columnas * base_ancho + (columnas - 1) * espacio_h
+        total_alto = filas * base_alto + (filas - 1) * espacio_v
+
+        factor = min(
+            area_w / total_ancho,
+            area_h / total_alto,
+            1.0
+        )
+        self.card_w = int(base_ancho * factor)
+        self.card_h = int(base_alto * factor)
+        self.espacio_h = int(espacio_h * factor)
+        self.espacio_v = int(espacio_v * factor)
+        total_ancho = columnas * self.card_w + (columnas - 1) * self.espacio_h
+        total_alto = filas * self.card_h + (filas - 1) * self.espacio_v
+
+        self.inicio_x = (ancho - total_ancho) // 2
+        self.inicio_y = margen_superior + (area_h - total_alto) // 2
+        self.mensaje_y = info_top + info_height + 10
+
+        self.carta_rects = []
+        for i, carta in enumerate(self.cartas):
+            fila, columna = divmod(i, columnas)
+            rect = pygame.Rect(
+                self.inicio_x + columna * (self.card_w + self.espacio_h),
+                self.inicio_y + fila * (self.card_h + self.espacio_v),
+                self.card_w, self.card_h
+            )
+            self.carta_rects.append((rect, carta))
+
+        # --- Botón de silenciar (abajo a la derecha) ---
+        btn_size = 40
+        margin = 12
+        self.btn_silencio.set_geometria(ancho - btn_size - margin, alto - btn_size - margin, btn_size, btn_size)
+
+    def carta_en(self, pos):
+        """Carta bajo `pos` por aritmética de la cuadrícula, o None si cae en un hueco."""
+        columna, dx = divmod(pos[0] - self.inicio_x, self.card_w + self.espacio_h)
+        fila, dy = divmod(pos[1] - self.inicio_y, self.card_h + self.espacio_v)
+        if not (0 <= columna < self.columnas and 0 <= fila < self.filas):
+            return None
+        if dx >= self.card_w or dy >= self.card_h:
+            return None
+        i = fila * self.columnas + columna
+        return self.cartas[i] if i < len(self.cartas) else None
+
+    def on_resize(self, ancho, alto):
+        self.calcular_layout()
+
+    def set_silencio(self, silenciado):
+        self.silenciado = silenciado
+        volumen = 0.0 if silenciado else 1.0
+        if self.sonido_acierto:
+            self.sonido_acierto.set_volume(volumen)
+        if self.sonido_error:
+            self.sonido_error.set_volume(volumen)
+        self.btn_silencio.imagen = self.img_sonido_apagado if silenciado else self.img_sonido_encendido
+        self.btn_silencio.border_color = (255, 0, 0) if silenciado else None
 
     def handle_event(self, event):
         # Usa la lógica base para salir y resize
@@ -145,35 +248,29 @@ class JuegoMemoriaJurasica(JuegoBase):
         if event.type == pygame.QUIT:
             self.running = False
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.btn_silencio_rect and self.btn_silencio_rect.collidepoint(event.pos):
-                self.silenciado = not self.silenciado
-                volumen = 0.0 if self.silenciado else 1.0
-                if self.sonido_acierto:
-                    self.sonido_acierto.set_volume(volumen)
-                if self.sonido_error:
-                    self.sonido_error.set_volume(volumen)
+            if self.btn_silencio.rect.collidepoint(event.pos):
+                self.set_silencio(not self.silenciado)
                 return
             if self.nivel_completado:
-                for rect, carta in self.carta_rects:
-                    if rect.collidepoint(event.pos) and isinstance(carta, dict) and carta.get('id') == 'siguiente':
+                for rect, boton in self.botones_victoria:
+                    if rect.collidepoint(event.pos) and boton.get('id') == 'siguiente':
                         self.cambiar_nivel()
                         return
             if self.mostrar_cartas_inicio or self.procesando_par or self.nivel_completado:
                 return
-            for rect, carta in self.carta_rects:
-                if rect.collidepoint(event.pos):
-                    if carta['id'] in self.cartas_emparejadas or carta.get('volteada'):
-                        continue
-                    carta['volteada'] = True
-                    if not self.carta_primera:
-                        self.carta_primera = carta
-                    elif not self.carta_segunda and self.carta_primera['id'] != carta['id']:
-                        self.carta_segunda = carta
-                        self.procesando_par = True
-                        self.tiempo_espera = pygame.time.get_ticks()
-                    break
-
-    def update(self, dt=0):
+            carta = self.carta_en(event.pos)
+            if carta is None or carta['id'] in self.cartas_emparejadas or carta.get('volteada'):
+                return
+            carta['volteada'] = True
+            if not self.carta_primera:
+                self.carta_primera = carta
+            elif not self.carta_segunda and self.carta_primera['id'] != carta['id']:
+                self.carta_segunda = carta
+                self.procesando_par = True
+                self.tiempo_espera = pygame.time.get_ticks()
+
+    def update(self, dt=None):
+        super().update(dt)
         self.actualizar_logica()
 
     def actualizar_logica(self):
@@ -206,93 +303,61 @@ class JuegoMemoriaJurasica(JuegoBase):
                 self.carta_primera = None
                 self.carta_segunda = None
                 self.procesando_par = False
-                self.tiempo_mensaje = pygame.time.get_ticks()
+                self.inicio_mensaje = pygame.time.get_ticks()
                 if self.pares_encontrados >= self.total_pares:
                     self.nivel_completado = True
 
-    def draw(self, surface=None):
-        pantalla = surface if surface else self.pantalla
-        self.pantalla = pantalla  # Para mantener consistencia interna
-
-        # Fondo y navbar
-        self.dibujar_fondo()
-
-        navbar_height = self.navbar_height if hasattr(self, "navbar_height") else 60
-        info_top = navbar_height + 10
-
-        # --- Fondo info y título debajo de la barra ---
+    def dibujar_titulo(self, surface):
+        """Fondo info y título debajo de la barra (capa cacheada)."""
+        info_top = self.navbar_height + 10
         info_height = 70
+        # Sobre la pantalla el alfa se ignoraba: el recuadro siempre fue opaco
         pygame.draw.rect(
-            self.pantalla, (255, 255, 255, 180),
-            (20, info_top, self.pantalla.get_width() - 40, info_height),
+            surface, (255, 255, 255),
+            (20, info_top, surface.get_width() - 40, info_height),
             border_radius=18
         )
         self.mostrar_texto(
             f"Memoria Jurásica - {self.nivel_actual}",
             x=0,
             y=self.navbar_height + 28,  # Más espacio respecto a la navbar
-            w=self.pantalla.get_width(),
+            w=surface.get_width(),
             h=40,
             fuente=self.fuente_titulo,
             color=self.color_titulo,
-            centrado=True
+            centrado=True,
+            surface=surface
         )
-       
-        
-
-        # --- Calcular cuadrícula adaptativa ---
-        num = len(self.cartas)
-        filas, columnas = self.filas, self.columnas
-        base_ancho, base_alto = 90, 110
-        espacio_h, espacio_v = 18, 18
 
-        # Espacio disponible debajo de la barra y título
-        margen_lateral = 40
-        margen_superior = info_top + info_height + 10
-        margen_inferior = 80
-
-        area_w = self.pantalla.get_width() - 2 * margen_lateral
-        area_h = self.pantalla.get_height() - margen_superior - margen_inferior
+    def clave_marcador(self):
+        return (self.pares_encontrados, self.total_pares)
 
-        total_ancho = columnas * base_ancho + (columnas - 1) * espacio_h
-        total_alto = filas * base_alto + (filas - 1) * espacio_v
+    def dibujar_marcador(self, surface):
+        self.mostrar_puntaje(self.pares_encontrados, self.total_pares, "Pares", surface=surface)
 
-        factor = min(
-            area_w / total_ancho,
-            area_h / total_alto,
-            1.0
-        )
-        card_w = int(base_ancho * factor)
-        card_h = int(base_alto * factor)
-        espacio_h = int(espacio_h * factor)
-        espacio_v = int(espacio_v * factor)
-        total_ancho = columnas * card_w + (columnas - 1) * espacio_h
-        total_alto = filas * card_h + (filas - 1) * espacio_v
-
-        inicio_x = (self.pantalla.get_width() - total_ancho) // 2
-        inicio_y = margen_superior + (area_h - total_alto) // 2
+    def draw(self, surface=None):
+        pantalla = surface if surface else self.pantalla
+        self.pantalla = pantalla  # Para mantener consistencia interna
+        if pantalla.get_size() != self.tamaño_layout:
+            self.calcular_layout()
 
-        # --- Dibujar cartas ---
-        self.carta_rects = []
-        for i, carta in enumerate(self.cartas):
-            fila = i // columnas
-            columna = i % columnas
-            x = inicio_x + columna * (card_w + espacio_h)
-            y = inicio_y + fila * (card_h + espacio_v)
-            rect = dibujar_carta_generica(
-                self.pantalla, {**carta, "cartas_emparejadas": self.cartas_emparejadas},
-                x, y, card_w, card_h, self.fuente,
+        # Fondo, título y cartas
+        self.dibujar_fondo()
+        self.dibujar_capa("titulo")
+        for rect, carta in self.carta_rects:
+            dibujar_carta_generica(
+                self.pantalla, carta,
+                rect.x, rect.y, rect.w, rect.h, self.fuente,
                 (255, 255, 255), (0, 180, 0), (180, 0, 0), (0, 0, 120),
-                self.reverso, (80, 80, 80)
+                self.reverso, (80, 80, 80), self.cartas_emparejadas
             )
-            self.carta_rects.append((rect, carta))
 
         # --- Mensaje temporal ---
-        if self.mensaje and pygame.time.get_ticks() - self.tiempo_mensaje < 1200:
+        if self.mensaje and pygame.time.get_ticks() - self.inicio_mensaje < 1200:
             self.mostrar_texto(
                 self.mensaje,
                 x=0,
-                y=info_top + info_height + 10,
+                y=self.mensaje_y,
                 w=self.pantalla.get_width(),
                 h=30,
                 fuente=self.fuente,
@@ -304,34 +369,11 @@ class JuegoMemoriaJurasica(JuegoBase):
 
         # --- Victoria ---
         if self.nivel_completado:
-            self.mostrar_victoria(
-                self.pantalla,
-                lambda v: v, lambda v: v, self.pantalla.get_width(), self.pantalla.get_height(),
-                self.fuente_titulo, self.fuente,
-                self, self.carta_rects
-            )
+            self.botones_victoria = []
+            self.mostrar_victoria(self.botones_victoria)
 
         # --- Botón de silenciar ---
-        img_size = 32
-        btn_size = 40
-        margin = 12
-        x_btn = self.pantalla.get_width() - btn_size - margin
-        y_btn = self.pantalla.get_height() - btn_size - margin
-        icono = self.img_sonido_apagado if self.silenciado else self.img_sonido_encendido
-        if icono.get_width() != img_size or icono.get_height() != img_size:
-            icono = pygame.transform.smoothscale(icono, (img_size, img_size))
-        btn_silencio = Boton(
-            "", x_btn, y_btn, btn_size, btn_size,
-            imagen=icono,
-            imagen_pos="center",
-            estilo="round",
-            border_color=(255, 0, 0) if self.silenciado else None,
-            border_width=3,
-            color_normal=(240, 240, 240),
-            color_hover=(255, 220, 220)
-        )
-        btn_silencio.draw(self.pantalla)
-        self.btn_silencio_rect = btn_silencio.rect
+        self.btn_silencio.draw(self.pantalla)
 
         # --- Puntaje ---
-        self.mostrar_puntaje(self.pares_encontrados, self.total_pares, "Pares")
+        self.dibujar_capa("marcador")
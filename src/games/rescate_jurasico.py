@@ -4,29 +4,42 @@ import random
 from pygame.locals import *
 from core.juego_base import JuegoBase  # Usa tu base común
 from ui.components.utils import obtener_fuente
+from games.banco_problemas import BancoProblemas
 # Si tienes imágenes, importa/carga aquí
 
-def generar_problema_division(nivel):
-    """Genera un problema de división según el nivel"""
+def problema_division(nivel, b, cociente, c=None):
+    """Enunciado y respuesta para un divisor y un cociente ya elegidos (a = b × cociente)"""
+    a = b * cociente
     if nivel == "Básico":
-        b = random.randint(1, 5)
-        a = b * random.randint(1, 5)
         problema = f"Dino tiene {a} bayas. Si las reparte en {b} grupos iguales, ¿cuántas bayas habrá en cada grupo?"
         respuesta = a // b
     elif nivel == "Medio":
-        b = random.randint(2, 5)
-        a = b * random.randint(3, 8)
         problema = f"Dino tiene {a} bayas y quiere repartirlas entre {b} amigos. ¿Cuántas bayas recibirá cada amigo?"
         respuesta = a // b
     else:  # Avanzado
-        b = random.randint(3, 6)
-        a = b * random.randint(5, 10)
-        c = random.randint(1, 3)
         problema = f"Dino tiene {a} bayas. Si las reparte en {b} grupos iguales y luego come {c} de un grupo, ¿cuántas bayas le quedan en ese grupo?"
         respuesta = (a // b) - c
     return problema, respuesta
 
+def generar_problema_division(nivel):
+    """Genera un problema de división según el nivel"""
+    if nivel == "Básico":
+        return problema_division(nivel, random.randint(1, 5), random.randint(1, 5))
+    elif nivel == "Medio":
+        return problema_division(nivel, random.randint(2, 5), random.randint(3, 8))
+    return problema_division(nivel, random.randint(3, 6), random.randint(5, 10), random.randint(1, 3))
+
+def enumerar_problemas_division(nivel):
+    """Todos los problemas del nivel (mismos rangos que el generador), en un solo grupo"""
+    if nivel == "Básico":
+        return [[problema_division(nivel, b, k) for b in range(1, 6) for k in range(1, 6)]]
+    elif nivel == "Medio":
+        return [[problema_division(nivel, b, k) for b in range(2, 6) for k in range(3, 9)]]
+    return [[problema_division(nivel, b, k, c) for b in range(3, 7) for k in range(5, 11) for c in range(1, 4)]]
+
 class JuegoRescate(JuegoBase):
+    CAMINO_Y = 250  # Altura del camino de rocas; el enunciado va debajo
+
     def __init__(self, pantalla, config, dificultad, fondo, navbar, images, sounds, return_to_menu):
         super().__init__('Rescate Jurásico', pantalla, config, dificultad, fondo, navbar, images, sounds, return_to_menu)
         self.problema_actual = ""
@@ -41,6 +54,11 @@ class JuegoRescate(JuegoBase):
         self.total_pasos = 3
         self.nivel_completado = False
         self.cargar_imagenes()
+        self.registrar_capa("escena", self.dibujar_escena, lambda: self.posicion_dino)
+        self.banco = BancoProblemas.desde_config(
+            "division", self._nivel_from_dificultad(dificultad), enumerar_problemas_division,
+            config, self.precalentar_problema
+        )
         self.generar_problema()
 
     def cargar_imagenes(self):
@@ -49,8 +67,7 @@ class JuegoRescate(JuegoBase):
         self.roca_img = self.images.get("roca")
 
     def generar_problema(self):
-        nivel = self._nivel_from_dificultad(self.dificultad)  # Usa el método de JuegoBase
-        problema, respuesta = generar_problema_division(nivel)
+        problema, respuesta = self.banco.siguiente()
         self.problema_actual = problema
         self.respuesta_correcta = respuesta
         self.opciones = self.generar_opciones(self.respuesta_correcta)
@@ -58,6 +75,18 @@ class JuegoRescate(JuegoBase):
         self.tiempo_mensaje = 0
         self.mensaje = ""
 
+    def _enunciado_rect(self):
+        enunciado_y = self.CAMINO_Y + 120  # Debajo del camino
+        enunciado_h = 80
+        return enunciado_y, enunciado_h
+
+    def _fuente_enunciado(self):
+        return obtener_fuente(28, negrita=False)
+
+    def precalentar_problema(self, problema):
+        enunciado_h = self._enunciado_rect()[1]
+        self.precalentar_texto(problema[0], self.ANCHO - 80, enunciado_h, fuente=self._fuente_enunciado(), centrado=True)
+
     def handle_event(self, evento):
         super().handle_event(evento)
         if evento.type == MOUSEBUTTONDOWN and evento.button == 1:
@@ -79,13 +108,16 @@ class JuegoRescate(JuegoBase):
                     return
 
     def update(self, dt=None):
-        if self.tiempo_mensaje > 0:
-            self.tiempo_mensaje -= 1
+        super().update(dt)
 
-    def draw(self, surface):
-        self.dibujar_fondo()
-        self.mostrar_titulo()
+    def clave_marcador(self):
+        return (self.puntuacion, self.jugadas_totales)
 
+    def dibujar_marcador(self, surface):
+        self.mostrar_puntaje(self.puntuacion, self.jugadas_totales, "Puntuación", surface=surface)
+
+    def dibujar_escena(self, surface):
+        """Subtítulo, camino y dinos; se repinta cuando mamá dino avanza."""
         # Mensaje debajo del título
         self.mostrar_texto(
             "¡Ayuda a mamá dinosaurio a rescatar a su bebé perdido!",
@@ -95,12 +127,13 @@ class JuegoRescate(JuegoBase):
             h=40,
             fuente=obtener_fuente(30, negrita=False),
             color=(80, 80, 80),
-            centrado=True
+            centrado=True,
+            surface=surface
         )
 
         # Camino y personajes
         camino_x = 250
-        camino_y = 250
+        camino_y = self.CAMINO_Y
         espacio_rocas = 120
 
         # Mamá dino
@@ -108,29 +141,32 @@ class JuegoRescate(JuegoBase):
         if self.posicion_dino > 0:
             mama_x = camino_x + (self.posicion_dino - 1) * espacio_rocas
         if self.dino_mama_img:
-            self.pantalla.blit(self.dino_mama_img, (mama_x, camino_y))
+            surface.blit(self.dino_mama_img, (mama_x, camino_y))
 
         # Rocas
         if self.roca_img:
             for i in range(self.total_pasos):
-                self.pantalla.blit(self.roca_img, (camino_x + i * espacio_rocas, camino_y))
+                surface.blit(self.roca_img, (camino_x + i * espacio_rocas, camino_y))
 
         # Bebé dino
         if self.dino_bebe_img:
             bebe_x = camino_x + self.total_pasos * espacio_rocas + 20
-            self.pantalla.blit(self.dino_bebe_img, (bebe_x, camino_y + 10))
+            surface.blit(self.dino_bebe_img, (bebe_x, camino_y + 10))
+
+    def draw(self, surface):
+        self.dibujar_fondo()
+        self.dibujar_capa("titulo")
+        self.dibujar_capa("escena")
 
         # Problema
-        enunciado_y = camino_y + 120
-        enunciado_h = 80
-        enunciado_fuente = obtener_fuente(28, negrita=False)
+        enunciado_y, enunciado_h = self._enunciado_rect()
         self.mostrar_texto(
             self.problema_actual,
             x=40,
             y=enunciado_y,
             w=self.ANCHO - 80,
             h=enunciado_h,
-            fuente=enunciado_fuente,
+            fuente=self._fuente_enunciado(),
             color=(30, 30, 30),
             centrado=True
         )
@@ -155,6 +191,6 @@ class JuegoRescate(JuegoBase):
         self.dibujar_feedback()
 
         # Puntaje
-        self.mostrar_puntaje(self.puntuacion, self.jugadas_totales, "Puntuación")
+        self.dibujar_capa("marcador")
 
 # Para usar esta clase, crea una instancia pasando los argumentos requeridos por JuegoBase.
@@ -4,6 +4,7 @@ Pantalla de victoria y botón para avanzar de nivel.
 import pygame
 from ui.components.utils import mostrar_texto_adaptativo, Boton
 from ui.components.emoji import mostrar_alternativo_adaptativo
+from ui.components.gradientes import gradiente
 
 def mostrar_victoria(
     pantalla, sx, sy, ancho, alto, fuente_titulo, fuente_texto, juego_base, carta_rects,
@@ -13,13 +14,7 @@ def mostrar_victoria(
     alto_panel = sy(200)
     x_panel = (ancho - ancho_panel) // 2
     y_panel = (alto - alto_panel) // 2
-    panel = pygame.Surface((ancho_panel, alto_panel), pygame.SRCALPHA)
-    for i in range(alto_panel):
-        factor = i / alto_panel
-        r = int(255 - factor * 50)
-        g = int(250 - factor * 20)
-        b = int(150 + factor * 50)
-        pygame.draw.line(panel, (r, g, b, 240), (0, i), (ancho_panel, i))
+    panel = gradiente(ancho_panel, alto_panel, ((255, 250, 150, 240), (205, 230, 200, 240)))
     pantalla.blit(panel, (x_panel, y_panel))
     pygame.draw.rect(pantalla, color_borde, (x_panel, y_panel, ancho_panel, alto_panel), 4, border_radius=20)
     mostrar_alternativo_adaptativo(
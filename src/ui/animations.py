@@ -1,5 +1,6 @@
 import pygame
 import math
+from ui.components.utils import mark_dirty, superficie_temporal
 
 scaled_imgs_cache = {}  # Cache global para imágenes escaladas
 hover_anim_states = {}  # Estado de hover por índice (0.0 a 1.0)
@@ -20,8 +21,8 @@ def actualizar_hover_state(idx, is_hover, velocidad=0.1):
     return state
 
 def get_surface(ancho, alto, alpha=False):
-    flags = pygame.SRCALPHA if alpha else 0
-    return pygame.Surface((ancho, alto), flags)
+    """Superficie temporal del pool de ui.components.utils (no guardarla)."""
+    return superficie_temporal(ancho, alto, alpha)
 
 def elementos(caja, juego, recursos, cx, cy, tam_caja, fuente):
     img = recursos.get(juego["imagen"])
@@ -91,6 +92,8 @@ def animar_dinos(pantalla, imagenes_dinos, posiciones, escala, tiempo_ms, veloci
             
             # Dibujar el dino
             pantalla.blit(img_scaled, (pos_x, pos_y))
+            mark_dirty(pygame.Rect(sombra_x, sombra_y, sombra_size, sombra_size // 3).union(
+                (pos_x, pos_y, tamaño, tamaño)))
 
 def dibujar_caja_juegos(surface, x, y, w, h, juegos, recursos,
                          color=(255, 255, 255), alpha=0, radius=0,
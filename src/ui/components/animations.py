@@ -1,5 +1,6 @@
 import pygame
 import math
+from ui.components.utils import superficie_temporal
 scaled_imgs_cache = {}
 def get_scaled_image(img, size):
     if img is None:
@@ -10,8 +11,8 @@ def get_scaled_image(img, size):
     return scaled_imgs_cache[key]
 
 def get_surface(ancho, alto, alpha=False):
-    flags = pygame.SRCALPHA if alpha else 0
-    return pygame.Surface((ancho, alto), flags)
+    """Superficie temporal del pool de ui.components.utils (no guardarla)."""
+    return superficie_temporal(ancho, alto, alpha)
 def animar_dinos(pantalla, imagenes_dinos, posiciones, escala, tiempo_ms, velocidad=1.0):
     """Versión mejorada con más parámetros de control y animaciones más suaves."""
     for i, (img_key, pos) in enumerate(zip(imagenes_dinos, posiciones)):
@@ -2,6 +2,8 @@ import pygame
 import os
 import emoji
 from collections import OrderedDict
+from typing import Tuple
+from ui.components.emoji_atlas import AtlasEmojis, ATLAS_PATH, clave_emoji
 
 # LRU Cache optimizada
 class LRUCache:
@@ -27,6 +29,65 @@ _CACHE_FUENTES = {}
 _CACHE_EMOJIS = LRUCache(64)
 _CACHE_MEDIDAS = LRUCache(128)
 _CACHE_LINEAS = LRUCache(32)
+_CACHE_TOKENS = LRUCache(512)
+_CACHE_SUPERFICIES_LINEA = LRUCache(128)
+
+# --- Tokenizador de emojis (trie de secuencias) ---
+_FIN = ""  # Marca de fin de secuencia dentro del trie (ninguna secuencia es vacía)
+_TRIE_EMOJIS = None
+
+def _get_trie_emojis():
+    """Construye una sola vez el trie con todas las secuencias de emoji.EMOJI_DATA
+    (incluye secuencias ZWJ, modificadores de tono y variantes con FE0F)."""
+    global _TRIE_EMOJIS
+    if _TRIE_EMOJIS is None:
+        trie = {}
+        for seq in emoji.EMOJI_DATA:
+            nodo = trie
+            for ch in seq:
+                nodo = nodo.setdefault(ch, {})
+            nodo[_FIN] = True
+        _TRIE_EMOJIS = trie
+    return _TRIE_EMOJIS
+
+def tokenizar_emojis(texto: str) -> tuple:
+    """
+    Divide un texto en tramos (es_emoji, fragmento), tomando en cada posición la
+    secuencia de emoji más larga. El resultado se cachea por texto.
+    """
+    tokens = _CACHE_TOKENS.get(texto)
+    if tokens is not None:
+        return tokens
+
+    trie = _get_trie_emojis()
+    tramos = []
+    inicio_texto = 0
+    i = 0
+    length = len(texto)
+    while i < length:
+        nodo = trie.get(texto[i])
+        fin = 0
+        j = i
+        while nodo is not None:
+            j += 1
+            if _FIN in nodo:
+                fin = j
+            if j >= length:
+                break
+            nodo = nodo.get(texto[j])
+        if fin:
+            if inicio_texto < i:
+                tramos.append((False, texto[inicio_texto:i]))
+            tramos.append((True, texto[i:fin]))
+            i = inicio_texto = fin
+        else:
+            i += 1
+    if inicio_texto < length:
+        tramos.append((False, texto[inicio_texto:]))
+
+    tokens = tuple(tramos)
+    _CACHE_TOKENS.put(texto, tokens)
+    return tokens
 
 def obtener_fuente(tamano, negrita=False):
     """Obtiene una fuente del tamaño especificado, usando caché."""
@@ -46,13 +107,18 @@ class EmojiTextRenderer:
         font_names=["Segoe UI Symbol", "Arial Unicode MS"],
         emoji_path="assets/fuentes/twemoji_png",
         emoji_scale_factor=1.2,
-        cache_capacity=256
+        cache_capacity=256,
+        usar_atlas=True,
+        atlas_path=ATLAS_PATH
     ):
         pygame.font.init()
         self.font_names = font_names
         self.emoji_path = emoji_path
         self.emoji_scale_factor = emoji_scale_factor
         self.fonts = {}  # Se inicializarán según el tamaño necesario
+        # Con el atlas construido no se accede al disco al dibujar; si no existe
+        # se usa el modo clásico de un PNG por emoji
+        self.atlas = AtlasEmojis.cargar(atlas_path) if usar_atlas else None
 
     def get_font(self, size, bold=False):
         """Obtiene una fuente del tamaño especificado."""
@@ -74,13 +140,20 @@ class EmojiTextRenderer:
 
     def get_emoji_surf(self, seq: str, size):
         """Obtiene la superficie de un emoji, usando caché."""
-        key = f"{'-'.join(f'{ord(c):x}' for c in seq if ord(c) != 0xfe0f)}_{size}"
+        if self.atlas is not None:
+            surf = self.atlas.get(clave_emoji(seq), size)
+            if surf is None:
+                # Fallback: elimina FE0F (variante de presentación)
+                surf = self.atlas.get(clave_emoji(seq, quitar_fe0f=True), size)
+            return surf
+
+        key = f"{clave_emoji(seq, quitar_fe0f=True)}_{size}"
         surf = _CACHE_EMOJIS.get(key)
         if surf is not None:
             return surf
             
         # Intenta con codepoints completos
-        full = "-".join(f"{ord(c):x}" for c in seq)
+        full = clave_emoji(seq)
         path_full = os.path.join(self.emoji_path, f"{full}.png")
         
         try:
@@ -93,7 +166,7 @@ class EmojiTextRenderer:
             # Fallback: elimina FE0F (variante de presentación)
             stripped = "".join(c for c in seq if ord(c) != 0xfe0f)
             if stripped != seq:
-                short = "-".join(f"{ord(c):x}" for c in stripped)
+                short = clave_emoji(stripped)
                 path_short = os.path.join(self.emoji_path, f"{short}.png")
                 if os.path.isfile(path_short):
                     surf = pygame.image.load(path_short).convert_alpha()
@@ -113,30 +186,17 @@ class EmojiTextRenderer:
             return cached
             
         width = 0
-        i = 0
-        length = len(text)
         font = self.get_font(font_size)
         emoji_size = int(font_size * self.emoji_scale_factor)
         
-        while i < length:
-            # Verifica si es un emoji
-            emoji_seq = None
-            for size in range(4, 0, -1):
-                if i+size <= length and self.is_emoji(text[i:i+size]):
-                    emoji_seq = text[i:i+size]
-                    break
-            
-            if emoji_seq:
+        for es_emoji, fragmento in tokenizar_emojis(text):
+            if es_emoji:
                 width += emoji_size
-                i += len(emoji_seq)
-            else:
-                ch = text[i]
-                try:
-                    w = font.size(ch)[0]
-                    width += w
-                except:
-                    width += font_size // 2  # Estimación para caracteres no soportados
-                i += 1
+                continue
+            try:
+                width += font.size(fragmento)[0]
+            except:
+                width += len(fragmento) * (font_size // 2)  # Estimación para caracteres no soportados
         
         _CACHE_MEDIDAS.put(key, width)
         return width
@@ -173,53 +233,74 @@ class EmojiTextRenderer:
         _CACHE_LINEAS.put(key, all_lines)
         return all_lines
 
-    def render_line(self, surface, text: str, x: int, y: int, font_size: int, color=(0,0,0), centered=False, max_width=None):
-        """Renderiza una línea de texto con emojis - versión optimizada."""
+    def _render_fragmento(self, font, fragmento, color):
+        """Renderiza un tramo de texto completo en una sola llamada."""
+        try:
+            return font.render(fragmento, True, color)
+        except:
+            # Algún carácter no soportado: se sustituye solo ese carácter
+            limpio = []
+            for ch in fragmento:
+                try:
+                    font.size(ch)
+                    limpio.append(ch)
+                except:
+                    limpio.append("?")
+            return font.render("".join(limpio), True, color)
+
+    def render_line_surface(self, text: str, font_size: int, color=(0,0,0)) -> Tuple[pygame.Surface, int]:
+        """
+        Compone una línea completa (texto + emojis) en una superficie cacheada
+        por (texto, tamaño, color). Cada tramo de texto se renderiza con una sola
+        llamada a font.render.
+
+        Devuelve (superficie, top): top es el desplazamiento vertical (<= 0) que
+        hay que sumar a la y de la línea al blitear, porque un emoji más alto que
+        la fuente hace que la superficie empiece por encima de la línea de texto.
+        """
+        key = (text, font_size, tuple(color))
+        cached = _CACHE_SUPERFICIES_LINEA.get(key)
+        if cached is not None:
+            return cached
+
         font = self.get_font(font_size)
+        font_h = font.get_height()
         emoji_size = int(font_size * self.emoji_scale_factor)
+        emoji_y = (font_h - emoji_size) // 2
+
+        piezas = []
+        ancho = 0
+        for es_emoji, fragmento in tokenizar_emojis(text):
+            if es_emoji:
+                em_surf = self.get_emoji_surf(fragmento, emoji_size)
+                if em_surf:
+                    piezas.append((em_surf, ancho, emoji_y))
+                    ancho += emoji_size
+                    continue
+                # Emoji no encontrado, dibuja un carácter de reemplazo
+                fragmento = "□"
+            txt = self._render_fragmento(font, fragmento, color)
+            piezas.append((txt, ancho, 0))
+            ancho += txt.get_width()
+
+        # Los emojis pueden ser más altos que la fuente: se amplía la superficie
+        top = min([0] + [dy for _, _, dy in piezas])
+        alto = max([font_h] + [dy + p.get_height() for p, _, dy in piezas]) - top
+        linea = pygame.Surface((max(1, ancho), max(1, alto)), pygame.SRCALPHA)
+        linea.blits([(p, (dx, dy - top)) for p, dx, dy in piezas], doreturn=False)
+        resultado = (linea, top)
+        _CACHE_SUPERFICIES_LINEA.put(key, resultado)
+        return resultado
+
+    def render_line(self, surface, text: str, x: int, y: int, font_size: int, color=(0,0,0), centered=False, max_width=None):
+        """Renderiza una línea de texto con emojis usando la superficie de línea cacheada."""
+        linea, top = self.render_line_surface(text, font_size, color)
         
         # Si está centrado, calcula la posición x
         if centered and max_width:
-            text_width = self.measure_text_width(text, font_size)
-            x = x + (max_width - text_width) // 2
-        
-        pos_x = x
-        i = 0
-        length = len(text)
+            x = x + (max_width - linea.get_width()) // 2
         
-        while i < length:
-            emoji_seq = None
-            for size in range(4, 0, -1):
-                if i+size <= length and self.is_emoji(text[i:i+size]):
-                    emoji_seq = text[i:i+size]
-                    break
-            
-            if emoji_seq:
-                em_surf = self.get_emoji_surf(emoji_seq, emoji_size)
-                if em_surf:
-                    y_offset = (font.get_height() - emoji_size) // 2
-                    surface.blit(em_surf, (pos_x, y + y_offset))
-                    pos_x += emoji_size
-                else:
-                    # Emoji no encontrado, dibuja un carácter de reemplazo
-                    txt = font.render("□", True, color)
-                    surface.blit(txt, (pos_x, y))
-                    pos_x += txt.get_width()
-                
-                i += len(emoji_seq)
-            else:
-                ch = text[i]
-                try:
-                    txt = font.render(ch, True, color)
-                    surface.blit(txt, (pos_x, y))
-                    pos_x += txt.get_width()
-                except:
-                    # Carácter no soportado
-                    txt = font.render("?", True, color)
-                    surface.blit(txt, (pos_x, y))
-                    pos_x += txt.get_width()
-                
-                i += 1
+        surface.blit(linea, (x, y + top))
 
 # Inicializa el renderer global
 _emoji_renderer = None
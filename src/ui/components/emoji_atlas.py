@@ -0,0 +1,181 @@
+"""
+Atlas de texturas para los emojis de Twemoji.
+
+Empaqueta los PNG individuales de assets/fuentes/twemoji_png en unas pocas
+páginas por nivel de tamaño (mip levels) y genera un índice
+codepoints -> (página, x, y). En tiempo de dibujo el renderer solo recorta
+subsuperficies del atlas, sin tocar el sistema de archivos: las páginas de los
+niveles más usados (NIVELES_PRECARGA) se decodifican en segundo plano en
+cuanto se crea el AtlasEmojis.
+
+Construir el atlas (desde la raíz del proyecto):
+    python src/ui/components/emoji_atlas.py
+"""
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+EMOJI_PATH = os.path.join("assets", "fuentes", "twemoji_png")
+ATLAS_PATH = os.path.join(".cache", "twemoji_atlas")
+INDICE = "indice.json"
+NIVELES = (72, 48, 32, 24, 16)
+TAM_PAGINA = 1024
+# Niveles de los emojis junto a fuentes de ~14 a ~40 px (la interfaz y los juegos);
+# el nivel 72 ocupa 19 páginas y solo se carga si se pide
+NIVELES_PRECARGA = (24, 32, 48)
+
+
+def clave_emoji(seq: str, quitar_fe0f: bool = False) -> str:
+    """Convierte una secuencia de emoji al nombre de archivo de Twemoji (sin .png)."""
+    return "-".join(f"{ord(c):x}" for c in seq if not (quitar_fe0f and ord(c) == 0xfe0f))
+
+
+def construir_atlas(origen=EMOJI_PATH, destino=ATLAS_PATH, niveles=NIVELES, tam_pagina=TAM_PAGINA):
+    """
+    Genera las páginas del atlas y el índice JSON en `destino`.
+    Devuelve la cantidad de emojis empaquetados.
+    """
+    nombres = sorted(f[:-4] for f in os.listdir(origen) if f.endswith(".png"))
+    originales = [pygame.image.load(os.path.join(origen, f"{n}.png")) for n in nombres]
+    os.makedirs(destino, exist_ok=True)
+
+    indice = {"niveles": {}}
+    for nivel in niveles:
+        por_fila = tam_pagina // nivel
+        por_pagina = por_fila * por_fila
+        paginas, emojis = [], {}
+        for inicio in range(0, len(nombres), por_pagina):
+            bloque = range(inicio, min(inicio + por_pagina, len(nombres)))
+            filas = -(-len(bloque) // por_fila)
+            pagina = pygame.Surface((por_fila * nivel, filas * nivel), pygame.SRCALPHA)
+            for j, i in enumerate(bloque):
+                x, y = (j % por_fila) * nivel, (j // por_fila) * nivel
+                img = originales[i]
+                if img.get_size() != (nivel, nivel):
+                    if img.get_bitsize() < 24:  # smoothscale no admite PNG con paleta
+                        rgba = pygame.Surface(img.get_size(), pygame.SRCALPHA)
+                        rgba.blit(img, (0, 0))
+                        img = rgba
+                    img = pygame.transform.smoothscale(img, (nivel, nivel))
+                pagina.blit(img, (x, y))
+                emojis[nombres[i]] = [len(paginas), x, y]
+            archivo = f"atlas_{nivel}_{len(paginas)}.png"
+            pygame.image.save(pagina, os.path.join(destino, archivo))
+            paginas.append(archivo)
+        indice["niveles"][str(nivel)] = {"paginas": paginas, "emojis": emojis}
+
+    with open(os.path.join(destino, INDICE), "w", encoding="utf-8") as f:
+        json.dump(indice, f, separators=(",", ":"))
+    return len(nombres)
+
+
+class AtlasEmojis:
+    """
+    Acceso de solo lectura a un atlas ya construido.
+
+    Las páginas de los niveles en `precargar` se decodifican en un pool de
+    hilos desde que se crea el atlas; las demás, la primera vez que se
+    necesitan. Para un tamaño pedido se usa el nivel más pequeño que sea >= al
+    tamaño, y si no coincide exactamente se escala una sola vez y se guarda en caché.
+    """
+    def __init__(self, ruta=ATLAS_PATH, capacidad=512, precargar=NIVELES_PRECARGA):
+        with open(os.path.join(ruta, INDICE), encoding="utf-8") as f:
+            datos = json.load(f)
+        self.ruta = ruta
+        self.niveles = sorted(int(n) for n in datos["niveles"])
+        self._indice = {int(n): v for n, v in datos["niveles"].items()}
+        self._paginas = {}
+        self._pendientes = {}
+        self._pool = None
+        self._cache = OrderedDict()
+        self.capacidad = capacidad
+        if precargar:
+            self.prefetch(precargar)
+
+    @classmethod
+    def cargar(cls, ruta=ATLAS_PATH, **kwargs):
+        """Devuelve el atlas si está construido, o None."""
+        if not os.path.isfile(os.path.join(ruta, INDICE)):
+            return None
+        try:
+            return cls(ruta, **kwargs)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def prefetch(self, niveles):
+        """Empieza a decodificar en segundo plano todas las páginas de los niveles indicados."""
+        for nivel in niveles:
+            if nivel not in self._indice:
+                continue
+            for num, archivo in enumerate(self._indice[nivel]["paginas"]):
+                key = (nivel, num)
+                if key in self._paginas or key in self._pendientes:
+                    continue
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=2)
+                self._pendientes[key] = self._pool.submit(pygame.image.load, os.path.join(self.ruta, archivo))
+
+    def cerrar(self):
+        """Libera el pool de hilos (las páginas pendientes se cargarán al pedirlas)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._pendientes.clear()
+
+    def __contains__(self, clave):
+        return clave in self._indice[self.niveles[-1]]["emojis"]
+
+    def _nivel_para(self, size):
+        for nivel in self.niveles:
+            if nivel >= size:
+                return nivel
+        return self.niveles[-1]
+
+    def _pagina(self, nivel, num):
+        key = (nivel, num)
+        pagina = self._paginas.get(key)
+        if pagina is None:
+            futuro = self._pendientes.pop(key, None)
+            if futuro is not None:
+                pagina = futuro.result()
+            else:
+                archivo = self._indice[nivel]["paginas"][num]
+                pagina = pygame.image.load(os.path.join(self.ruta, archivo))
+            if pygame.display.get_surface() is not None:
+                pagina = pagina.convert_alpha()
+            self._paginas[key] = pagina
+        return pagina
+
+    def get(self, clave, size):
+        """Superficie de `size`x`size` para el emoji `clave`, o None si no está."""
+        key = (clave, size)
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            return surf
+        nivel = self._nivel_para(size)
+        pos = self._indice[nivel]["emojis"].get(clave)
+        if pos is None:
+            return None
+        num, x, y = pos
+        surf = self._pagina(nivel, num).subsurface((x, y, nivel, nivel))
+        if nivel != size:
+            surf = pygame.transform.smoothscale(surf, (size, size))
+        self._cache[key] = surf
+        if len(self._cache) > self.capacidad:
+            self._cache.popitem(last=False)
+        return surf
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Construye el atlas de emojis de Twemoji.")
+    parser.add_argument("--origen", default=EMOJI_PATH)
+    parser.add_argument("--destino", default=ATLAS_PATH)
+    args = parser.parse_args()
+    pygame.init()
+    total = construir_atlas(args.origen, args.destino)
+    print(f"Atlas generado en {args.destino} con {total} emojis")
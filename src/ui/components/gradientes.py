@@ -0,0 +1,130 @@
+"""
+Servicio de gradientes.
+
+Calcula los píxeles de una sola pasada con NumPy (interpolando entre las
+paradas de color) y crea la superficie con frombytes. Los resultados se
+cachean por (tamaño, paradas, dirección), así que redimensionar la ventana
+o volver a una pantalla no repite el trabajo.
+
+Los gradientes pequeños (botones, tarjetas) van a un lru_cache por número de
+entradas. Los del tamaño de la ventana ocupan ~8 MB cada uno a 1080p, así que
+van a otra caché limitada por bytes (MAX_BYTES_GRANDES).
+
+Las paradas pueden ser colores sueltos (repartidos uniformemente) o pares
+(posición 0..1, color). Los colores aceptan RGB o RGBA.
+
+Con opaco=True se descarta el alfa y la superficie se convierte con convert()
+(sin alfa por píxel), que se blitea mucho más rápido: es la variante para los
+fondos de pantalla completa. Se cachea aparte de la versión con alfa.
+"""
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+import pygame
+
+VERTICAL = "vertical"
+HORIZONTAL = "horizontal"
+RADIAL = "radial"
+
+AREA_GRANDE = 256 * 256  # a partir de aquí el gradiente va a la caché por bytes
+MAX_BYTES_GRANDES = 24 * 1024 * 1024  # unas tres ventanas de 1080p
+
+_grandes = OrderedDict()
+_bytes_grandes = 0
+
+
+def _normalizar_paradas(paradas) -> Tuple[Tuple[float, Tuple[int, int, int, int]], ...]:
+    """Convierte las paradas a una tupla hashable de (posición, RGBA)."""
+    paradas = list(paradas)
+    if not paradas:
+        raise ValueError("Un gradiente necesita al menos una parada de color")
+    con_posicion = all(
+        len(p) == 2 and isinstance(p[0], (int, float)) and not isinstance(p[1], (int, float))
+        for p in paradas
+    )
+    if not con_posicion:
+        n = len(paradas)
+        paradas = [(i / (n - 1) if n > 1 else 0.0, c) for i, c in enumerate(paradas)]
+    resultado = []
+    for pos, color in sorted(paradas, key=lambda p: p[0]):
+        color = tuple(int(c) for c in color)
+        if len(color) == 3:
+            color += (255,)
+        resultado.append((float(pos), color))
+    return tuple(resultado)
+
+
+def _parametro(ancho, alto, direccion):
+    """Posición 0..1 de cada píxel a lo largo del gradiente, con forma (alto, ancho) o difundible."""
+    if direccion == VERTICAL:
+        return (np.arange(alto, dtype=np.float32) / max(alto - 1, 1))[:, None]
+    if direccion == HORIZONTAL:
+        return (np.arange(ancho, dtype=np.float32) / max(ancho - 1, 1))[None, :]
+    if direccion == RADIAL:
+        # 0 en el centro y 1 en las esquinas
+        cx, cy = (ancho - 1) / 2, (alto - 1) / 2
+        dx = (np.arange(ancho, dtype=np.float32) - cx)[None, :]
+        dy = (np.arange(alto, dtype=np.float32) - cy)[:, None]
+        return np.sqrt(dx * dx + dy * dy) / max(np.hypot(cx, cy), 1.0)
+    raise ValueError(f"Dirección de gradiente desconocida: {direccion}")
+
+
+def _crear_gradiente(ancho, alto, paradas, direccion, opaco=False) -> pygame.Surface:
+    t = _parametro(ancho, alto, direccion)
+    posiciones = [p for p, _ in paradas]
+    canales = 3 if opaco else 4
+    pixeles = np.empty((alto, ancho, canales), dtype=np.uint8)
+    for canal in range(canales):
+        valores = np.interp(t, posiciones, [c[canal] for _, c in paradas])
+        pixeles[..., canal] = valores.astype(np.uint8)  # difunde filas/columnas
+    surf = pygame.image.frombytes(pixeles.tobytes(), (ancho, alto), "RGB" if opaco else "RGBA")
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert() if opaco else surf.convert_alpha()
+    return surf
+
+
+_gradiente = lru_cache(maxsize=64)(_crear_gradiente)
+
+
+def _gradiente_grande(ancho, alto, paradas, direccion, opaco=False) -> pygame.Surface:
+    """Como _gradiente pero en una LRU que descarta los más viejos al pasar de MAX_BYTES_GRANDES."""
+    global _bytes_grandes
+    clave = (ancho, alto, paradas, direccion, opaco)
+    surf = _grandes.get(clave)
+    if surf is not None:
+        _grandes.move_to_end(clave)
+        return surf
+    surf = _crear_gradiente(ancho, alto, paradas, direccion, opaco)
+    _grandes[clave] = surf
+    _bytes_grandes += ancho * alto * 4
+    # Siempre se conserva el último aunque por sí solo supere el límite
+    while _bytes_grandes > MAX_BYTES_GRANDES and len(_grandes) > 1:
+        (w, h, *_), _viejo = _grandes.popitem(last=False)
+        _bytes_grandes -= w * h * 4
+    return surf
+
+
+def gradiente(ancho: int, alto: int, paradas: Sequence, direccion: str = VERTICAL,
+              opaco: bool = False) -> pygame.Surface:
+    """
+    Devuelve una superficie SRCALPHA de (ancho, alto) con el gradiente pedido,
+    u opaca (sin alfa por píxel) si opaco=True.
+    La superficie es compartida (cacheada): hay que copiarla antes de modificarla.
+    """
+    ancho, alto = max(1, int(ancho)), max(1, int(alto))
+    crear = _gradiente_grande if ancho * alto >= AREA_GRANDE else _gradiente
+    return crear(ancho, alto, _normalizar_paradas(paradas), direccion, opaco)
+
+
+def es_opaco(paradas: Sequence) -> bool:
+    """True si todas las paradas tienen alfa 255 (o no traen alfa)."""
+    return all(color[3] == 255 for _, color in _normalizar_paradas(paradas))
+
+
+def limpiar_cache():
+    global _bytes_grandes
+    _gradiente.cache_clear()
+    _grandes.clear()
+    _bytes_grandes = 0
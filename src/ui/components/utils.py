@@ -1,8 +1,11 @@
 import pygame
 import time
 import unicodedata
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any, List, Union, Callable
+from ui.components.emoji import tokenizar_emojis
+from ui.components.gradientes import gradiente
 
 # --- Memory Management & Caching ---
 FUENTE_NOMBRE = "Segoe UI Emoji"  # Cambiado a Segoe UI Emoji para mejor soporte de emojis
@@ -27,17 +30,37 @@ def render_text_cached(text: str, size: int, bold: bool, color: Tuple[int, int,
     font = obtener_fuente(size, bold)
     return font.render(text, True, color)
 
-@lru_cache(maxsize=32)
 def get_gradient(ancho: int, alto: int, color_top: Tuple[int, int, int], color_bottom: Tuple[int, int, int]) -> pygame.Surface:
-    """Genera y cachea un gradiente vertical."""
-    grad = pygame.Surface((1, alto), pygame.SRCALPHA)
-    for i in range(alto):
-        ratio = i / (alto - 1) if alto > 1 else 0
-        r = int(color_top[0] * (1 - ratio) + color_bottom[0] * ratio)
-        g = int(color_top[1] * (1 - ratio) + color_bottom[1] * ratio)
-        b = int(color_top[2] * (1 - ratio) + color_bottom[2] * ratio)
-        grad.set_at((0, i), (r, g, b, 255))
-    return pygame.transform.scale(grad, (ancho, alto))
+    """Gradiente vertical opaco (cacheado en ui.components.gradientes)."""
+    return gradiente(ancho, alto, (color_top[:3], color_bottom[:3]))
+
+# --- Superficies reutilizables ---
+MAX_SUPERFICIES_TEMPORALES = 32
+_superficies_temporales = OrderedDict()
+
+@lru_cache(maxsize=128)
+def caja_redondeada(w: int, h: int, color: Tuple[int, ...], radius: int) -> pygame.Surface:
+    """Rectángulo redondeado con transparencia, cacheado (LRU). Es compartida: no modificarla."""
+    s = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.rect(s, color, (0, 0, w, h), border_radius=radius)
+    return s
+
+def superficie_temporal(ancho: int, alto: int, alpha: bool = False) -> pygame.Surface:
+    """
+    Superficie de trabajo limpia para pintar y blitear en el momento. Se reutiliza
+    entre llamadas del mismo tamaño (las menos usadas se liberan), así que no
+    hay que guardarla.
+    """
+    clave = (ancho, alto, alpha)
+    surf = _superficies_temporales.pop(clave, None)
+    if surf is None:
+        if len(_superficies_temporales) >= MAX_SUPERFICIES_TEMPORALES:
+            _superficies_temporales.popitem(last=False)
+        surf = pygame.Surface((ancho, alto), pygame.SRCALPHA if alpha else 0)
+    else:
+        surf.fill((0, 0, 0, 0))
+    _superficies_temporales[clave] = surf
+    return surf
 
 # --- Dirty Rectangles for Partial Updates ---
 DIRTY_RECTS = []
@@ -64,25 +87,7 @@ def is_emoji(char: str) -> bool:
 
 def split_text_with_emojis(text: str) -> List[str]:
     """Divide el texto en segmentos, separando emojis para renderizado especial."""
-    segments = []
-    current_segment = ""
-    
-    for char in text:
-        if is_emoji(char):
-            # Si tenemos texto acumulado, lo guardamos primero
-            if current_segment:
-                segments.append(current_segment)
-                current_segment = ""
-            # Guardamos el emoji como un segmento separado
-            segments.append(char)
-        else:
-            current_segment += char
-    
-    # Añadir el último segmento si existe
-    if current_segment:
-        segments.append(current_segment)
-    
-    return segments
+    return [fragmento for _, fragmento in tokenizar_emojis(text)]
 
 # --- Tooltip Manager ---
 class TooltipManager:
@@ -154,11 +159,9 @@ class TooltipManager:
         y = max(0, self.current_pos[1] - height)
         
         # Dibujar fondo con transparencia
-        tooltip_surf = pygame.Surface((width, height), pygame.SRCALPHA)
-        pygame.draw.rect(tooltip_surf, (*self.bg_color, 220), 
-                         (0, 0, width, height), 
-                         border_radius=self.border_radius)
+        tooltip_surf = caja_redondeada(width, height, (*self.bg_color, 220), self.border_radius)
         pantalla.blit(tooltip_surf, (x, y))
+        mark_dirty(pygame.Rect(x, y, width, height))
         
         # Renderizar el texto del tooltip
         mostrar_texto_adaptativo(
@@ -280,6 +283,16 @@ class Boton:
         )
         return shadow_surf
 
+    def set_geometria(self, x: int, y: int, ancho: int, alto: int, border_radius: Optional[int] = None):
+        """Mueve/redimensiona el botón; la sombra solo se regenera si cambia el tamaño o el radio."""
+        border_radius = self.border_radius if border_radius is None else border_radius
+        cambia_forma = (ancho, alto, border_radius) != (self.ancho, self.alto, self.border_radius)
+        self.x, self.y, self.ancho, self.alto = x, y, ancho, alto
+        self.border_radius = border_radius
+        self.rect.update(x, y, ancho, alto)
+        if cambia_forma:
+            self._shadow_surf = self._make_shadow()
+
     def draw(self, pantalla, tooltip_manager: Optional[TooltipManager] = None):
         mouse_pos = pygame.mouse.get_pos()
         self.hovered = self.collidepoint(mouse_pos)
@@ -303,11 +316,12 @@ class Boton:
         color_bottom = self.color_hover if hovered and self.color_hover else self.color_bottom
 
         gradiente = get_gradient(self.ancho, self.alto, color_top, color_bottom)
-        mask = pygame.Surface((self.ancho, self.alto), pygame.SRCALPHA)
-        pygame.draw.rect(mask, (255, 255, 255, 255), (0, 0, self.ancho, self.alto), border_radius=self.border_radius)
-        gradiente = gradiente.copy()
-        gradiente.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        pantalla.blit(gradiente, (self.x, self.y))
+        mask = caja_redondeada(self.ancho, self.alto, (255, 255, 255, 255), self.border_radius)
+        # Copia del gradiente (cacheado) en una superficie temporal: MAX sobre cero la copia tal cual
+        boton = superficie_temporal(self.ancho, self.alto, alpha=True)
+        boton.blit(gradiente, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        boton.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        pantalla.blit(boton, (self.x, self.y))
 
         if self.border_color and self.border_width > 0:
             pygame.draw.rect(
@@ -508,68 +522,98 @@ def mostrar_texto_adaptativo(
     Ajusta el tamaño de fuente para que el texto no sobresalga ni en ancho ni en alto.
     """
     fuente_base = fuente_base or get_default_font()
-    max_font_size = fuente_base.get_height()
+    bloque = layout_texto_adaptativo(
+        texto, w, h, fuente_base.get_height(), fuente_base.get_bold(), tuple(color), centrado
+    )
+    if bloque is None:
+        return
+    if centrado:
+        pantalla.blit(bloque, (x + (w - bloque.get_width()) // 2, y + (h - bloque.get_height()) // 2))
+    else:
+        pantalla.blit(bloque, (x, y))
+
+def _medir_segmento(fuente: pygame.font.Font, seg: str) -> Tuple[int, int]:
+    try:
+        return fuente.size(seg)
+    except:
+        return fuente.size('□')
+
+def _render_segmento(fuente: pygame.font.Font, seg: str, color) -> pygame.Surface:
+    try:
+        return fuente.render(seg, True, color)
+    except:
+        return fuente.render('□', True, color)
+
+def _medir_lineas(lineas: List[List[str]], fuente: pygame.font.Font) -> Tuple[int, int]:
+    """Ancho máximo y alto total de las líneas sin renderizar nada (solo métricas)."""
+    max_w = total_h = 0
+    for segments in lineas:
+        if not segments:
+            continue
+        medidas = [_medir_segmento(fuente, seg) for seg in segments]
+        max_w = max(max_w, sum(m[0] for m in medidas))
+        total_h += max(m[1] for m in medidas)
+    return max_w, total_h
+
+@lru_cache(maxsize=256)
+def layout_texto_adaptativo(
+    texto: str, w: int, h: int, max_font_size: int, bold: bool,
+    color: Tuple[int, ...], centrado: bool = False
+) -> Optional[pygame.Surface]:
+    """
+    Calcula el tamaño de fuente que hace caber el texto en (w, h) y devuelve el
+    bloque de texto ya compuesto (None si no hay nada que dibujar o no cabe
+    ni con la fuente mínima).
+    La búsqueda binaria solo mide con font.size; se renderiza una vez al final.
+    """
     min_font_size = 10
-    bold = fuente_base.get_bold()
+    lineas = [split_text_with_emojis(line) for line in texto.split('\n')]
 
-    # Divide el texto en líneas por \n
-    lines = texto.split('\n')
-    best_size = min_font_size
-    best_surfs = []
     # Búsqueda binaria para el tamaño de fuente máximo que cabe en el área
+    best_size = None
     left, right = min_font_size, max_font_size
     while left <= right:
         mid = (left + right) // 2
-        fuente = obtener_fuente(mid, bold)
-        line_surfs = []
-        max_line_w = 0
-        for line in lines:
-            # Renderiza cada línea, soportando emojis
-            segments = split_text_with_emojis(line)
-            seg_surfs = []
-            for seg in segments:
-                try:
-                    seg_surfs.append(fuente.render(seg, True, color))
-                except:
-                    seg_surfs.append(fuente.render('□', True, color))
-            if seg_surfs:
-                total_w = sum(s.get_width() for s in seg_surfs)
-                max_h = max(s.get_height() for s in seg_surfs)
-                line_surf = pygame.Surface((total_w, max_h), pygame.SRCALPHA)
-                x_off = 0
-                for s in seg_surfs:
-                    line_surf.blit(s, (x_off, 0))
-                    x_off += s.get_width()
-                line_surfs.append(line_surf)
-                max_line_w = max(max_line_w, total_w)
-            else:
-                line_surfs.append(None)
-        total_height = sum((s.get_height() if s else 0) for s in line_surfs)
+        max_line_w, total_height = _medir_lineas(lineas, obtener_fuente(mid, bold))
         if max_line_w <= w and total_height <= h:
             best_size = mid
-            best_surfs = line_surfs
             left = mid + 1
         else:
             right = mid - 1
+    if best_size is None:
+        return None
 
     # Render final con el mejor tamaño encontrado
     fuente = obtener_fuente(best_size, bold)
-    y_offset = y + (h - sum((s.get_height() if s else 0) for s in best_surfs)) // 2 if centrado else y
-    for s in best_surfs:
-        if s:
-            if centrado:
-                x_offset = x + (w - s.get_width()) // 2
-            else:
-                x_offset = x
-            pantalla.blit(s, (x_offset, y_offset))
-            y_offset += s.get_height()
+    line_surfs = []
+    for segments in lineas:
+        if not segments:
+            continue
+        seg_surfs = [_render_segmento(fuente, seg, color) for seg in segments]
+        line_surf = pygame.Surface(
+            (sum(s.get_width() for s in seg_surfs), max(s.get_height() for s in seg_surfs)),
+            pygame.SRCALPHA
+        )
+        x_off = 0
+        for s in seg_surfs:
+            line_surf.blit(s, (x_off, 0))
+            x_off += s.get_width()
+        line_surfs.append(line_surf)
+    if not line_surfs:
+        return None
+
+    ancho = max(s.get_width() for s in line_surfs)
+    bloque = pygame.Surface((ancho, sum(s.get_height() for s in line_surfs)), pygame.SRCALPHA)
+    y_offset = 0
+    for s in line_surfs:
+        bloque.blit(s, ((ancho - s.get_width()) // 2 if centrado else 0, y_offset))
+        y_offset += s.get_height()
+    return bloque
 
 def dibujar_caja_texto(
     pantalla, x, y, w, h, color, radius=18, texto=None, fuente=None, color_texto=(30, 30, 30)
 ):
-    s = pygame.Surface((w, h), pygame.SRCALPHA)
-    pygame.draw.rect(s, color, (0, 0, w, h), border_radius=radius)
-    pantalla.blit(s, (x, y))
+    pantalla.blit(caja_redondeada(w, h, tuple(color), radius), (x, y))
     if texto:
         mostrar_texto_adaptativo(
             pantalla=pantalla, 
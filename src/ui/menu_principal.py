@@ -2,9 +2,12 @@ import pygame
 import random
 from ui.navigation_bar import NavigationBar
 from ui.animations import animar_dinos, dibujar_caja_juegos
-from ui.components.utils import Boton, dibujar_caja_texto, mostrar_texto_adaptativo, TooltipManager
+from ui.components.utils import Boton, dibujar_caja_texto, mostrar_texto_adaptativo, TooltipManager, get_dirty_rects
 from ui.components.emoji import mostrar_alternativo_adaptativo
 from core.game_state import *
+from core.config import factor_paso
+from core.game_loop import BucleJuego
+from core.renderizado import RenderizadorSucio
 from games import JUEGOS_DISPONIBLES
 from ui.screen_manager import (
     ScreenManager, HomeScreen, JuegosScreen, ChatBotScreen, GameInstanceScreen,
@@ -38,6 +41,8 @@ class MenuPrincipal:
         self._precache_fonts()
 
         self.screen_manager = screen_manager or ScreenManager()
+        usar_rects = config.get("rendimiento", {}).get("rectangulos_sucios", True) if config else False
+        self.renderizador = RenderizadorSucio() if usar_rects else None
 
     def sx(self, x): return int(x * self.pantalla.get_width() / self.base_width)
     def sy(self, y): return int(y * self.pantalla.get_height() / self.base_height)
@@ -48,16 +53,22 @@ class MenuPrincipal:
         self.fonts["texto"] = pygame.font.SysFont("Segoe UI", int(28 * esc))
 
     def mostrar_home(self):
+        self.mostrar_home_estatico()
+        self.mostrar_home_dinamico()
+
+    def mostrar_home_estatico(self, surface=None):
+        """Títulos y cajas de texto del inicio (no cambian entre frames)."""
+        surface = surface or self.pantalla
         esc = min(self.pantalla.get_width() / 900, self.pantalla.get_height() / 700)
         x_t, y_t, w_t, h_t = (self.pantalla.get_width() - int(640 * esc)) // 2, int(110 * esc), int(640 * esc), int(60 * esc)
-        dibujar_caja_texto(self.pantalla, x_t, y_t, w_t, h_t, (70, 130, 180))
+        dibujar_caja_texto(surface, x_t, y_t, w_t, h_t, (70, 130, 180))
 
-        mostrar_texto_adaptativo(self.pantalla, "¡Bienvenido a Jugando con Dino!", x_t, y_t, w_t, h_t,
+        mostrar_texto_adaptativo(surface, "¡Bienvenido a Jugando con Dino!", x_t, y_t, w_t, h_t,
                                  self.fonts["titulo"], (255, 255, 255), centrado=True)
 
         # Caja instrucciones
         x_c, y_c, w_c, h_c = (self.pantalla.get_width() - int(600 * esc)) // 2, int(180 * esc), int(600 * esc), int(320 * esc)
-        dibujar_caja_texto(self.pantalla, x_c, y_c, w_c, h_c, (255, 255, 255, 220))
+        dibujar_caja_texto(surface, x_c, y_c, w_c, h_c, (255, 255, 255, 220))
 
         instrucciones = (
             "📚 ¡Aprende matemáticas jugando con Dino y sus amigos!\n\n"
@@ -68,9 +79,14 @@ class MenuPrincipal:
             "🎮 ¡Diviértete y aprende mientras juegas!"
         )
 
-        mostrar_texto_adaptativo(self.pantalla, instrucciones, x_c, y_c, w_c, h_c,
+        mostrar_texto_adaptativo(surface, instrucciones, x_c, y_c, w_c, h_c,
                                  self.fonts["texto"], (30, 30, 30), centrado=True)
 
+    def mostrar_home_dinamico(self, surface=None):
+        """Dinos animados del inicio."""
+        surface = surface or self.pantalla
+        esc = min(self.pantalla.get_width() / 900, self.pantalla.get_height() / 700)
+
         # Animación dinos
         if pygame.time.get_ticks() - self.ultimo_cambio_dinos > 3000:
             self.dinos_actuales = random.sample(range(len(self.imagenes_dinos)), 3)
@@ -84,24 +100,25 @@ class MenuPrincipal:
         posiciones = [(x_ini + i * (dino_w + espacio), dino_y) for i in range(3)]
 
         animar_dinos(
-            self.pantalla,
+            surface,
             [self.imagenes_dinos[i] for i in self.dinos_actuales],
             posiciones,
             esc,
             pygame.time.get_ticks()
         )
 
-    def mostrar_chatbot(self):
+    def mostrar_chatbot(self, surface=None):
+        surface = surface or self.pantalla
         ancho, alto = self.pantalla.get_width(), self.pantalla.get_height()
-        dibujar_caja_texto(self.pantalla, self.sx(80), self.sy(120), ancho - self.sx(160), alto - self.sy(180),
+        dibujar_caja_texto(surface, self.sx(80), self.sy(120), ancho - self.sx(160), alto - self.sy(180),
                            (245, 245, 255), radius=24)
 
-        mostrar_texto_adaptativo(self.pantalla, "ChatBot Dino", self.sx(100), self.sy(140),
+        mostrar_texto_adaptativo(surface, "ChatBot Dino", self.sx(100), self.sy(140),
                                  ancho - self.sx(200), self.sy(60), pygame.font.SysFont("Segoe UI", 48, bold=True),
                                  (70, 130, 180), centrado=True)
 
         mostrar_alternativo_adaptativo(
-            self.pantalla,
+            surface,
             "🦖 ¡Hola! Soy Dino. Pregúntame cualquier cosa sobre matemáticas. Σ 🧠 π",
             self.sx(120), self.sy(220), ancho - self.sx(240), self.sy(60),
             self.fonts["texto"], (30, 30, 30), centrado=True
@@ -136,66 +153,101 @@ class MenuPrincipal:
             fuente=self.fonts["texto"]
         )
 
+    def prefetch_juegos(self):
+        """Adelanta la carga de las miniaturas y recursos de los juegos listados."""
+        if not hasattr(self.images, "prefetch"):
+            return
+        claves = []
+        for juego in JUEGOS_DISPONIBLES:
+            claves.append(juego["imagen"])
+            claves.extend(juego.get("recursos", ()))
+        self.images.prefetch(dict.fromkeys(claves))
+
     def handle_juegos_eventos(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and hasattr(self, "juego_rects"):
             for idx, rect in enumerate(self.juego_rects):
                 if idx < len(JUEGOS_DISPONIBLES) and rect.collidepoint(event.pos):
                     juego = JUEGOS_DISPONIBLES[idx]
                     if callable(juego["clase"]):
+                        al_salir = None
+                        if hasattr(self.images, "prefetch"):
+                            self.images.prefetch(juego.get("recursos", ()))
+                            # El juego guarda referencias a sus imágenes: no se descartan hasta que sale
+                            self.images.fijar(juego.get("recursos", ()))
+                            al_salir = self.images.soltar
                         instancia = juego["clase"](
                             self.pantalla, self.config, self.dificultad_seleccionada, self.fondo,
                             self.navbar, self.images, self.sounds,
                             return_to_menu=lambda: set_screen(self.screen_manager, JuegosScreen(self, self.dificultad_seleccionada))
                         )
-                        set_screen(self.screen_manager, GameInstanceScreen(instancia))
+                        set_screen(self.screen_manager, GameInstanceScreen(instancia, al_salir))
                         return True
         return False
 
+    def procesar_eventos(self, events):
+        """Procesa los eventos del frame. Devuelve False al cerrar la ventana."""
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEORESIZE:
+                if (event.w, event.h) != (self.base_width, self.base_height):
+                    self.base_width, self.base_height = event.w, event.h
+                    self.pantalla = pygame.display.set_mode((self.base_width, self.base_height), pygame.RESIZABLE)
+                    self.fondo.resize(self.base_width, self.base_height)
+                    self._precache_fonts()
+
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                resultado = self.navbar.handle_event(event, self.logo)
+                if resultado is not None:
+                    destino = self.niveles[resultado]
+                    if destino == "Home":
+                        set_screen(self.screen_manager, HomeScreen(self))
+                    elif destino in ("Fácil", "Normal", "Difícil"):
+                        self.prefetch_juegos()
+                        set_screen(self.screen_manager, JuegosScreen(self, destino))
+                    elif destino == "ChatBot":
+                        set_screen(self.screen_manager, ChatBotScreen(self))
+
+        self.tooltip_manager.update(pygame.mouse.get_pos())
+        handle_event_screen(self.screen_manager, events)
+        return running
+
+    def actualizar(self, dt):
+        """Paso fijo de lógica (dt en segundos)."""
+        self.fondo.update(factor_paso(dt))
+        update_screen(self.screen_manager, dt)
+
+    def _dibujar_dinamico(self, surface):
+        pantalla_actual = self.screen_manager.get_screen()
+        pantalla_actual.dibujar_dinamico(surface)
+        self.navbar.draw(surface, self.logo)
+
+    def dibujar(self, alfa=1.0):
+        pantalla_actual = self.screen_manager.get_screen()
+        if hasattr(self.fondo, "interpolar"):
+            self.fondo.interpolar(alfa)
+        if self.renderizador and hasattr(pantalla_actual, "capa"):
+            # Pantallas con capa estática: solo se actualizan las zonas que cambian
+            self.renderizador.dibujar(
+                self.pantalla, self.fondo, pantalla_actual.capa, self._dibujar_dinamico,
+                clave=id(pantalla_actual)
+            )
+            return
+        if self.renderizador:
+            self.renderizador.invalidar()
+        self.fondo.draw(self.pantalla)
+        draw_screen(self.screen_manager, self.pantalla)
+        self.navbar.draw(self.pantalla, self.logo)
+        get_dirty_rects()  # nadie los consume en el redibujado completo
+        pygame.display.flip()
+
     def run(self):
         set_screen(self.screen_manager, HomeScreen(self))
-        running = True
-        last_time = pygame.time.get_ticks()
-        FPS = 60
-
-        while running:
-            now = pygame.time.get_ticks()
-            dt = (now - last_time) / 1000.0
-            last_time = now
-
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.VIDEORESIZE:
-                    if (event.w, event.h) != (self.base_width, self.base_height):
-                        self.base_width, self.base_height = event.w, event.h
-                        self.pantalla = pygame.display.set_mode((self.base_width, self.base_height), pygame.RESIZABLE)
-                        self.fondo.resize(self.base_width, self.base_height)
-                        self._precache_fonts()
-
-                if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
-                    resultado = self.navbar.handle_event(event, self.logo)
-                    if resultado is not None:
-                        destino = self.niveles[resultado]
-                        if destino == "Home":
-                            set_screen(self.screen_manager, HomeScreen(self))
-                        elif destino in ("Fácil", "Normal", "Difícil"):
-                            set_screen(self.screen_manager, JuegosScreen(self, destino))
-                        elif destino == "ChatBot":
-                            set_screen(self.screen_manager, ChatBotScreen(self))
-
-            self.tooltip_manager.update(pygame.mouse.get_pos())
-            handle_event_screen(self.screen_manager, events)
-
-            self.fondo.update(dt * FPS)
-            self.fondo.draw(self.pantalla)
-
-            update_screen(self.screen_manager, dt)
-            draw_screen(self.screen_manager, self.pantalla)
-            self.navbar.draw(self.pantalla, self.logo)
-
-            pygame.display.flip()
-            self.clock.tick(FPS)
+        self.bucle = BucleJuego.desde_config(
+            self.config, self.procesar_eventos, self.actualizar, self.dibujar, reloj=self.clock
+        )
+        self.bucle.run()
 
 def run_menu_principal(pantalla, fondo, images, sounds, config, screen_manager=None):
     menu = MenuPrincipal(pantalla, fondo, images, sounds, config, screen_manager)
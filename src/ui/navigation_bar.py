@@ -1,9 +1,11 @@
 # navigation_bar.py
 import pygame
 import os
+from collections import OrderedDict
 from functools import lru_cache
-from .components.utils import Boton, TooltipManager
-from .animations import get_surface
+from .components.utils import Boton, TooltipManager, mark_dirty
+
+MAX_ICONOS_CACHE = 16  # iconos escalados que se conservan (LRU)
 
 class NavigationBar:
     def __init__(self, options, down=True, icons=None, tooltips=None):
@@ -18,6 +20,15 @@ class NavigationBar:
         self._tooltip_idx = None
         self._tooltip_alpha = 0
         self.tooltip_manager = TooltipManager(delay=1.0)
+        # Estado retenido entre frames
+        self._sel_botones = None
+        self._textos = {}
+        self._textos_size = None
+        self._iconos = OrderedDict()
+        self._sombra = None
+        self._sombra_key = None
+        self._logo_scaled = None
+        self._logo_key = None
 
     def get_height(self):
         alto = pygame.display.get_surface().get_height() if pygame.display.get_surface() else 700
@@ -31,13 +42,53 @@ class NavigationBar:
         except Exception:
             return pygame.font.SysFont("Segoe UI", font_size, bold=True)
 
-    @staticmethod
-    @lru_cache(maxsize=64)
-    def get_cached_icon(icon_id, icon_bytes, size):
-        # icon_id: unique identifier for the icon (e.g., id(icon) or a string)
-        # icon_bytes: bytes of the icon surface for cache key uniqueness
-        surf = pygame.image.frombuffer(icon_bytes, (size, size), "RGBA")
-        return pygame.transform.smoothscale(surf, (size, size))
+    def get_cached_icon(self, i, icon, size):
+        """Icono i escalado a size x size, cacheado por (opción, tamaño) en una LRU pequeña."""
+        key = (i, size)
+        entrada = self._iconos.pop(key, None)
+        # Se guarda la superficie original para detectar si cambió el icono de la opción
+        if entrada is None or entrada[0] is not icon:
+            if len(self._iconos) >= MAX_ICONOS_CACHE:
+                self._iconos.popitem(last=False)
+            entrada = (icon, pygame.transform.smoothscale(icon, (size, size)))
+        self._iconos[key] = entrada
+        return entrada[1]
+
+    def _crear_botones(self, fuente, radius):
+        self.botones = [
+            Boton(
+                txt, 0, 0, 1, 1, id=f"navbar_{i}",
+                fuente=fuente, border_radius=radius,
+                border_color=False, texto_visible=True,
+                tooltip=self.tooltips[i] if i < len(self.tooltips) else None
+            )
+            for i, txt in enumerate(self.options)
+        ]
+        self._sel_botones = None
+
+    def _aplicar_seleccion(self, colores, txt_color_sel, txt_color_unsel):
+        # Solo se reconfiguran los botones cuando cambia la opción seleccionada
+        for i, boton in enumerate(self.botones):
+            if i == self.selected:
+                boton.color_top, boton.color_bottom = colores[i % len(colores)]
+                boton.color_texto = txt_color_sel
+                boton.estilo = "apple"
+            else:
+                boton.color_top = boton.color_bottom = (0, 0, 0, 0)
+                boton.color_texto = txt_color_unsel
+                boton.estilo = "flat"
+        self._sel_botones = self.selected
+
+    def _texto(self, fuente, font_size, txt, color):
+        # Solo se guardan los textos del tamaño de fuente actual: al redimensionar se descartan
+        if font_size != self._textos_size:
+            self._textos.clear()
+            self._textos_size = font_size
+        key = (txt, color)
+        surf = self._textos.get(key)
+        if surf is None:
+            surf = self._textos[key] = fuente.render(txt, True, color)
+        return surf
 
     def draw(self, surface, logo=None, logo_height=None):
         ancho, alto = surface.get_size()
@@ -82,14 +133,21 @@ class NavigationBar:
 
         # Sombra pegada a los botones (sin espacio)
         pad_x, pad_y = 0, 0
-        sombra = get_surface(bar_w + pad_x * 2, b_alto + pad_y * 2, alpha=True)
-        pygame.draw.rect(sombra, (0, 0, 0, 32), sombra.get_rect(), border_radius=radius + 10)
-        surface.blit(sombra, (bar_x - pad_x, bar_y - pad_y))
-
-        # Dibuja el logo si existe
+        sombra_key = (bar_w, b_alto, radius)
+        if sombra_key != self._sombra_key:
+            # Se guarda entre frames: superficie propia, no del pool temporal
+            self._sombra = pygame.Surface((bar_w + pad_x * 2, b_alto + pad_y * 2), pygame.SRCALPHA)
+            pygame.draw.rect(self._sombra, (0, 0, 0, 32), self._sombra.get_rect(), border_radius=radius + 10)
+            self._sombra_key = sombra_key
+        surface.blit(self._sombra, (bar_x - pad_x, bar_y - pad_y))
+
+        # Dibuja el logo si existe (escalado solo cuando cambia el tamaño)
         if logo:
-            logo_scaled = pygame.transform.smoothscale(logo, (lw, lh))
-            surface.blit(logo_scaled, (logo_x, lmy))
+            logo_key = (id(logo), lw, lh)
+            if logo_key != self._logo_key:
+                self._logo_scaled = pygame.transform.smoothscale(logo, (lw, lh))
+                self._logo_key = logo_key
+            surface.blit(self._logo_scaled, (logo_x, lmy))
 
         # Fuente San Francisco Pro Text Bold o fallback (cacheada)
         font_size = int(b_alto * 0.55)
@@ -121,7 +179,10 @@ class NavigationBar:
             tgt_op = 1.0 if i == self.selected else 0.5
             self._anim_opacity[i] += (tgt_op - self._anim_opacity[i]) * opacity_speed
 
-        self.botones.clear()
+        if len(self.botones) != num:
+            self._crear_botones(fuente, radius)
+        if self._sel_botones != self.selected:
+            self._aplicar_seleccion(colores, txt_color_sel, txt_color_unsel)
         x = bar_x
 
         for i, txt in enumerate(self.options):
@@ -130,33 +191,13 @@ class NavigationBar:
             alto = int(b_alto + (b_alto_sel - b_alto) * a)
             y = bar_y + (b_alto - alto) // 2
             icon = self.icons[i] if i < len(self.icons) else None
-            if i == self.selected:
-                color_top, color_bottom = colores[i % len(colores)]
-                color_texto = txt_color_sel
-                #border_color = (68, 68, 78, 32)  # Sombra muy ligera
-                border_color = False
-                estilo = "apple"
-                text_alpha = 255
-            else:
-                color_top = color_bottom = (0, 0, 0, 0)
-                color_texto = txt_color_unsel
-                border_color = False
-                estilo = "flat"
-                text_alpha = int(255 * self._anim_opacity[i])
-            boton = Boton(
-                txt, x, y, ancho, alto,
-                color_texto=color_texto, fuente=fuente,
-                border_radius=radius, estilo=estilo,
-                color_top=color_top, color_bottom=color_bottom,
-                border_color=border_color,
-                texto_visible=True,
-                tooltip=self.tooltips[i] if i < len(self.tooltips) else None
-            )
+            boton = self.botones[i]
+            boton.fuente = fuente
+            boton.set_geometria(x, y, ancho, alto, radius)
             # Soporte para iconos: dibuja el icono si existe (cacheado)
             if icon:
                 icon_size = int(alto * 0.6)
-                icon_bytes = pygame.image.tostring(icon, "RGBA")
-                icon_img = self.get_cached_icon(id(icon), icon_bytes, icon_size)
+                icon_img = self.get_cached_icon(i, icon, icon_size)
                 icon_x = x + (ancho - icon_size) // 2
                 icon_y = y + (alto - icon_size) // 2 - (font_size // 3)
                 surface.blit(icon_img, (icon_x, icon_y))
@@ -164,18 +205,24 @@ class NavigationBar:
 
             # Animación de opacidad en el texto
             if boton.texto and not i == self.selected:
-                text_surf = fuente.render(boton.texto, True, color_texto)
-                text_surf.set_alpha(text_alpha)
+                text_surf = self._texto(fuente, font_size, boton.texto, boton.color_texto)
+                text_surf.set_alpha(int(255 * self._anim_opacity[i]))
                 text_rect = text_surf.get_rect(center=(x + ancho // 2, y + alto // 2))
                 surface.blit(text_surf, text_rect)
             else:
                 boton.draw(surface, self.tooltip_manager)
 
-            self.botones.append(boton)
             if boton.tooltip:
                 self.tooltip_manager.register(f"navbar_{i}", boton.tooltip, boton.rect)
             x += ancho + sep
 
+        # Toda la barra (logo, sombra y botones animados) cuenta como zona sucia
+        area = pygame.Rect(bar_x - pad_x, bar_y - pad_y, bar_w + pad_x * 2, b_alto + pad_y * 2)
+        area.union_ip(pygame.Rect(bar_x, bar_y + (b_alto - b_alto_sel) // 2, x - bar_x, b_alto_sel))
+        if logo:
+            area.union_ip(pygame.Rect(logo_x, lmy, lw, lh))
+        mark_dirty(area.inflate(8, 8))
+
         # Dibuja el tooltip usando TooltipManager
         self.tooltip_manager.update(mouse_pos)
         self.tooltip_manager.draw(surface)
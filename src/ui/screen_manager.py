@@ -1,12 +1,19 @@
 """
 Gestor funcional de pantallas: maneja el cambio y la gestión de diferentes pantallas o vistas del juego.
+
+Las pantallas que tienen `capa` (una CapaCacheada con su parte estática) y
+`dibujar_dinamico(surface)` pueden dibujarse por rectángulos sucios.
 """
+from core.renderizado import CapaCacheada
 
 class ScreenManager:
     def __init__(self):
         self.current_screen = None
 
     def set_screen(self, screen):
+        # Avisa a la pantalla que se deja (p. ej. para liberar recursos del juego)
+        if self.current_screen is not screen and hasattr(self.current_screen, "salir"):
+            self.current_screen.salir()
         self.current_screen = screen
 
     def get_screen(self):
@@ -21,14 +28,9 @@ class ScreenManager:
                 self.current_screen.handle_event(eventos)
 
     def update(self, dt=None):
+        """Avanza la pantalla actual; dt es el tiempo del frame en segundos."""
         if self.current_screen and hasattr(self.current_screen, "update"):
-            try:
-                if dt is not None:
-                    self.current_screen.update(dt)
-                else:
-                    self.current_screen.update()
-            except TypeError:
-                self.current_screen.update()
+            self.current_screen.update(dt)
 
     def draw(self, surface):
         if self.current_screen and hasattr(self.current_screen, "draw"):
@@ -47,10 +49,14 @@ class GameScreen:
 class HomeScreen(GameScreen):
     def __init__(self, menu):
         self.menu = menu
+        self.capa = CapaCacheada(menu.mostrar_home_estatico)
 
     def draw(self, surface):
         self.menu.mostrar_home()
 
+    def dibujar_dinamico(self, surface):
+        self.menu.mostrar_home_dinamico(surface)
+
 class JuegosScreen(GameScreen):
     def __init__(self, menu, dificultad):
         self.menu = menu
@@ -66,6 +72,7 @@ class JuegosScreen(GameScreen):
 class ChatBotScreen(GameScreen):
     def __init__(self, menu):
         self.menu = menu
+        self.capa = CapaCacheada(menu.mostrar_chatbot)
 
     def handle_event(self, eventos):
         if hasattr(self.menu, "handle_chatbot_eventos"):
@@ -74,9 +81,17 @@ class ChatBotScreen(GameScreen):
     def draw(self, surface):
         self.menu.mostrar_chatbot()
 
+    def dibujar_dinamico(self, surface):
+        pass
+
 class GameInstanceScreen(GameScreen):
-    def __init__(self, game_instance):
+    def __init__(self, game_instance, al_salir=None):
         self.game_instance = game_instance
+        self.al_salir = al_salir
+
+    def salir(self):
+        if self.al_salir:
+            self.al_salir()
 
     def handle_event(self, eventos):
         if hasattr(self.game_instance, "handle_event"):